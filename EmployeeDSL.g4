@@ -9,22 +9,46 @@ statement
     | aggregateStatement
     | printStatement
     | sortStatement
+    | joinStatement
+    | sampleStatement
+    | limitStatement
+    | explainStatement
     ;
 
-loadStatement : LOAD STRING_LITERAL SEMICOLON ;
+loadStatement : LOAD STRING_LITERAL (AS IDENTIFIER)? SEMICOLON ;
+
+joinStatement
+    : JOIN IDENTIFIER ON COLUMN STRING_LITERAL (EQ COLUMN STRING_LITERAL)? SEMICOLON
+    ;
+
+sampleStatement : SAMPLE NUMBER PERCENT (BY COLUMN STRING_LITERAL)? SEMICOLON ;   // Consultas aproximadas
 
 filterStatement
     : FILTER COLUMN STRING_LITERAL operator value SEMICOLON
+    | FILTER expression operator value SEMICOLON       // Para columnas calculadas
     | filterStatement AND filterStatement
     | filterStatement OR filterStatement
     ;
 
-operator : GT | LT | GTE | LTE | EQ | NEQ | BETWEEN ;
+operator : GT | LT | GTE | LTE | EQ | NEQ | BETWEEN | STARTS_WITH | CONTAINS | LIKE ;
 
 value
     : NUMBER                                     // Para filtros con números
     | STRING_LITERAL                             // Para filtros con texto
     | NUMBER AND NUMBER                          // Para BETWEEN
+    | DATE_LITERAL                               // Fechas: 2020-01-31
+    | DATE_LITERAL AND DATE_LITERAL              // Para BETWEEN con fechas
+    | PARAMETER                                  // Para scripts preparados
+    | PARAMETER AND PARAMETER                    // Para BETWEEN en scripts preparados
+    ;
+
+expression
+    : expression (MUL | DIV) expression
+    | expression (PLUS | MINUS) expression
+    | LPAREN expression RPAREN
+    | IDENTIFIER LPAREN expression RPAREN        // Funciones: days_since, years_since, year
+    | COLUMN STRING_LITERAL
+    | NUMBER
     ;
 
 aggregateStatement
@@ -33,14 +57,26 @@ aggregateStatement
 
 aggregateFunction
     : COUNT
+    | APPROX? COUNT DISTINCT
     | SUM
     | AVERAGE
+    | MIN
+    | MAX
+    | STDDEV
+    | APPROX? PERCENTILE NUMBER                  // Percentil entre 0 y 100
+    | APPROX? MEDIAN
     ;
 
-sortStatement : SORT COLUMN STRING_LITERAL (ASC | DESC) SEMICOLON ;
+sortStatement : SORT sortKey (COMMA sortKey)* SEMICOLON ;
+
+sortKey : COLUMN STRING_LITERAL (ASC | DESC) ;
+
+limitStatement : LIMIT NUMBER (OFFSET NUMBER | AFTER (STRING_LITERAL | PARAMETER))? SEMICOLON ;   // Paginación
 
 printStatement : PRINT SEMICOLON ;
 
+explainStatement : EXPLAIN ANALYZE? SEMICOLON ;   // Plan de la consulta, con analyze también la ejecuta
+
 // Lexer rules
 LOAD : 'load' ;
 FILTER : 'filter' ;
@@ -48,13 +84,30 @@ COLUMN : 'column' ;
 AGGREGATE : 'aggregate' ;
 PRINT : 'print' ;
 SORT : 'sort' ;
+JOIN : 'join' ;
+ON : 'on' ;
+AS : 'as' ;
+SAMPLE : 'sample' ;
+BY : 'by' ;
 ASC : 'asc' ;
 DESC : 'desc' ;
+LIMIT : 'limit' ;
+OFFSET : 'offset' ;
+AFTER : 'after' ;
+EXPLAIN : 'explain' ;
+ANALYZE : 'analyze' ;
 
 // Aggregate functions
 COUNT : 'count' ;
 SUM : 'sum' ;
 AVERAGE : 'average' ;
+DISTINCT : 'distinct' ;
+MIN : 'min' ;
+MAX : 'max' ;
+STDDEV : 'stddev' ;
+PERCENTILE : 'percentile' ;
+MEDIAN : 'median' ;
+APPROX : 'approx' ;
 
 // Operators
 GT : '>' ;
@@ -64,15 +117,31 @@ LTE : '<=' ;
 EQ : '==' ;
 NEQ : '!=' ;
 BETWEEN : 'between' ;
+STARTS_WITH : 'starts_with' ;
+CONTAINS : 'contains' ;
+LIKE : 'like' ;
 
 // Logical operators
 AND : 'and' ;
 OR : 'or' ;
 
+// Arithmetic operators
+PLUS : '+' ;
+MINUS : '-' ;
+MUL : '*' ;
+DIV : '/' ;
+PERCENT : '%' ;
+LPAREN : '(' ;
+RPAREN : ')' ;
+
 // Basic types
+DATE_LITERAL : [0-9] [0-9] [0-9] [0-9] '-' [0-9] [0-9] '-' [0-9] [0-9] ;
 NUMBER : [0-9]+ ('.' [0-9]+)? ;
+IDENTIFIER : [a-zA-Z_] [a-zA-Z_0-9]* ;
+PARAMETER : '$' [a-zA-Z_] [a-zA-Z_0-9]* | '?' ;
 STRING_LITERAL : '"' (~["\r\n])* '"' ;
 SEMICOLON : ';' ;
+COMMA : ',' ;
 
 // Skip whitespace and comments
 WS : [ \t\r\n]+ -> skip ;
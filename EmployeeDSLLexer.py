@@ -10,72 +10,157 @@ else:
 
 def serializedATN():
     return [
-        4,0,25,191,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,56,429,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
-        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,1,0,1,0,1,0,
-        1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,
-        1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,
-        1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,8,1,8,
-        1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,
-        10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,14,1,15,1,
-        15,1,15,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,
-        18,1,18,1,18,1,18,1,19,1,19,1,19,1,20,4,20,151,8,20,11,20,12,20,
-        152,1,20,1,20,4,20,157,8,20,11,20,12,20,158,3,20,161,8,20,1,21,1,
-        21,5,21,165,8,21,10,21,12,21,168,9,21,1,21,1,21,1,22,1,22,1,23,4,
-        23,175,8,23,11,23,12,23,176,1,23,1,23,1,24,1,24,1,24,1,24,5,24,185,
-        8,24,10,24,12,24,188,9,24,1,24,1,24,0,0,25,1,1,3,2,5,3,7,4,9,5,11,
-        6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,
-        35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,1,0,4,1,0,48,57,
-        3,0,10,10,13,13,34,34,3,0,9,10,13,13,32,32,2,0,10,10,13,13,196,0,
-        1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,
-        0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,
-        0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,
-        0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,
-        0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,1,51,1,
-        0,0,0,3,56,1,0,0,0,5,63,1,0,0,0,7,70,1,0,0,0,9,80,1,0,0,0,11,86,
-        1,0,0,0,13,91,1,0,0,0,15,95,1,0,0,0,17,100,1,0,0,0,19,106,1,0,0,
-        0,21,110,1,0,0,0,23,118,1,0,0,0,25,120,1,0,0,0,27,122,1,0,0,0,29,
-        125,1,0,0,0,31,128,1,0,0,0,33,131,1,0,0,0,35,134,1,0,0,0,37,142,
-        1,0,0,0,39,146,1,0,0,0,41,150,1,0,0,0,43,162,1,0,0,0,45,171,1,0,
-        0,0,47,174,1,0,0,0,49,180,1,0,0,0,51,52,5,108,0,0,52,53,5,111,0,
-        0,53,54,5,97,0,0,54,55,5,100,0,0,55,2,1,0,0,0,56,57,5,102,0,0,57,
-        58,5,105,0,0,58,59,5,108,0,0,59,60,5,116,0,0,60,61,5,101,0,0,61,
-        62,5,114,0,0,62,4,1,0,0,0,63,64,5,99,0,0,64,65,5,111,0,0,65,66,5,
-        108,0,0,66,67,5,117,0,0,67,68,5,109,0,0,68,69,5,110,0,0,69,6,1,0,
-        0,0,70,71,5,97,0,0,71,72,5,103,0,0,72,73,5,103,0,0,73,74,5,114,0,
-        0,74,75,5,101,0,0,75,76,5,103,0,0,76,77,5,97,0,0,77,78,5,116,0,0,
-        78,79,5,101,0,0,79,8,1,0,0,0,80,81,5,112,0,0,81,82,5,114,0,0,82,
-        83,5,105,0,0,83,84,5,110,0,0,84,85,5,116,0,0,85,10,1,0,0,0,86,87,
-        5,115,0,0,87,88,5,111,0,0,88,89,5,114,0,0,89,90,5,116,0,0,90,12,
-        1,0,0,0,91,92,5,97,0,0,92,93,5,115,0,0,93,94,5,99,0,0,94,14,1,0,
-        0,0,95,96,5,100,0,0,96,97,5,101,0,0,97,98,5,115,0,0,98,99,5,99,0,
-        0,99,16,1,0,0,0,100,101,5,99,0,0,101,102,5,111,0,0,102,103,5,117,
-        0,0,103,104,5,110,0,0,104,105,5,116,0,0,105,18,1,0,0,0,106,107,5,
-        115,0,0,107,108,5,117,0,0,108,109,5,109,0,0,109,20,1,0,0,0,110,111,
-        5,97,0,0,111,112,5,118,0,0,112,113,5,101,0,0,113,114,5,114,0,0,114,
-        115,5,97,0,0,115,116,5,103,0,0,116,117,5,101,0,0,117,22,1,0,0,0,
-        118,119,5,62,0,0,119,24,1,0,0,0,120,121,5,60,0,0,121,26,1,0,0,0,
-        122,123,5,62,0,0,123,124,5,61,0,0,124,28,1,0,0,0,125,126,5,60,0,
-        0,126,127,5,61,0,0,127,30,1,0,0,0,128,129,5,61,0,0,129,130,5,61,
-        0,0,130,32,1,0,0,0,131,132,5,33,0,0,132,133,5,61,0,0,133,34,1,0,
-        0,0,134,135,5,98,0,0,135,136,5,101,0,0,136,137,5,116,0,0,137,138,
-        5,119,0,0,138,139,5,101,0,0,139,140,5,101,0,0,140,141,5,110,0,0,
-        141,36,1,0,0,0,142,143,5,97,0,0,143,144,5,110,0,0,144,145,5,100,
-        0,0,145,38,1,0,0,0,146,147,5,111,0,0,147,148,5,114,0,0,148,40,1,
-        0,0,0,149,151,7,0,0,0,150,149,1,0,0,0,151,152,1,0,0,0,152,150,1,
-        0,0,0,152,153,1,0,0,0,153,160,1,0,0,0,154,156,5,46,0,0,155,157,7,
-        0,0,0,156,155,1,0,0,0,157,158,1,0,0,0,158,156,1,0,0,0,158,159,1,
-        0,0,0,159,161,1,0,0,0,160,154,1,0,0,0,160,161,1,0,0,0,161,42,1,0,
-        0,0,162,166,5,34,0,0,163,165,8,1,0,0,164,163,1,0,0,0,165,168,1,0,
-        0,0,166,164,1,0,0,0,166,167,1,0,0,0,167,169,1,0,0,0,168,166,1,0,
-        0,0,169,170,5,34,0,0,170,44,1,0,0,0,171,172,5,59,0,0,172,46,1,0,
-        0,0,173,175,7,2,0,0,174,173,1,0,0,0,175,176,1,0,0,0,176,174,1,0,
-        0,0,176,177,1,0,0,0,177,178,1,0,0,0,178,179,6,23,0,0,179,48,1,0,
-        0,0,180,181,5,47,0,0,181,182,5,47,0,0,182,186,1,0,0,0,183,185,8,
-        3,0,0,184,183,1,0,0,0,185,188,1,0,0,0,186,184,1,0,0,0,186,187,1,
-        0,0,0,187,189,1,0,0,0,188,186,1,0,0,0,189,190,6,24,0,0,190,50,1,
-        0,0,0,7,0,152,158,160,166,176,186,1,6,0,0
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,1,0,1,0,1,0,1,0,1,0,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,
+        5,1,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,8,1,8,1,8,1,9,1,9,1,9,1,
+        9,1,9,1,9,1,9,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,12,1,12,1,12,
+        1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,
+        1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,
+        1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,22,
+        1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,
+        1,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,26,
+        1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,28,1,28,1,29,1,29,1,30,1,30,1,30,1,31,1,31,1,31,1,32,1,32,1,32,
+        1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,
+        1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,
+        1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,37,1,38,1,38,
+        1,38,1,38,1,39,1,39,1,39,1,40,1,40,1,41,1,41,1,42,1,42,1,43,1,43,
+        1,44,1,44,1,45,1,45,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,47,
+        1,47,1,47,1,47,1,47,1,48,4,48,369,8,48,11,48,12,48,370,1,48,1,48,
+        4,48,375,8,48,11,48,12,48,376,3,48,379,8,48,1,49,1,49,5,49,383,8,
+        49,10,49,12,49,386,9,49,1,50,1,50,1,50,5,50,391,8,50,10,50,12,50,
+        394,9,50,1,50,3,50,397,8,50,1,51,1,51,5,51,401,8,51,10,51,12,51,
+        404,9,51,1,51,1,51,1,52,1,52,1,53,1,53,1,54,4,54,413,8,54,11,54,
+        12,54,414,1,54,1,54,1,55,1,55,1,55,1,55,5,55,423,8,55,10,55,12,55,
+        426,9,55,1,55,1,55,0,0,56,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,
+        9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,
+        20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,
+        31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,
+        42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,51,103,52,
+        105,53,107,54,109,55,111,56,1,0,6,1,0,48,57,3,0,65,90,95,95,97,122,
+        4,0,48,57,65,90,95,95,97,122,3,0,10,10,13,13,34,34,3,0,9,10,13,13,
+        32,32,2,0,10,10,13,13,437,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,
+        7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,
+        1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,
+        1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,
+        1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,
+        1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,
+        1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,
+        1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,
+        1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,
+        1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,
+        1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,
+        107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,1,113,1,0,0,0,3,118,1,0,
+        0,0,5,125,1,0,0,0,7,132,1,0,0,0,9,142,1,0,0,0,11,148,1,0,0,0,13,
+        153,1,0,0,0,15,158,1,0,0,0,17,161,1,0,0,0,19,164,1,0,0,0,21,171,
+        1,0,0,0,23,174,1,0,0,0,25,178,1,0,0,0,27,183,1,0,0,0,29,189,1,0,
+        0,0,31,196,1,0,0,0,33,202,1,0,0,0,35,210,1,0,0,0,37,218,1,0,0,0,
+        39,224,1,0,0,0,41,228,1,0,0,0,43,236,1,0,0,0,45,245,1,0,0,0,47,249,
+        1,0,0,0,49,253,1,0,0,0,51,260,1,0,0,0,53,271,1,0,0,0,55,278,1,0,
+        0,0,57,285,1,0,0,0,59,287,1,0,0,0,61,289,1,0,0,0,63,292,1,0,0,0,
+        65,295,1,0,0,0,67,298,1,0,0,0,69,301,1,0,0,0,71,309,1,0,0,0,73,321,
+        1,0,0,0,75,330,1,0,0,0,77,335,1,0,0,0,79,339,1,0,0,0,81,342,1,0,
+        0,0,83,344,1,0,0,0,85,346,1,0,0,0,87,348,1,0,0,0,89,350,1,0,0,0,
+        91,352,1,0,0,0,93,354,1,0,0,0,95,356,1,0,0,0,97,368,1,0,0,0,99,380,
+        1,0,0,0,101,396,1,0,0,0,103,398,1,0,0,0,105,407,1,0,0,0,107,409,
+        1,0,0,0,109,412,1,0,0,0,111,418,1,0,0,0,113,114,5,108,0,0,114,115,
+        5,111,0,0,115,116,5,97,0,0,116,117,5,100,0,0,117,2,1,0,0,0,118,119,
+        5,102,0,0,119,120,5,105,0,0,120,121,5,108,0,0,121,122,5,116,0,0,
+        122,123,5,101,0,0,123,124,5,114,0,0,124,4,1,0,0,0,125,126,5,99,0,
+        0,126,127,5,111,0,0,127,128,5,108,0,0,128,129,5,117,0,0,129,130,
+        5,109,0,0,130,131,5,110,0,0,131,6,1,0,0,0,132,133,5,97,0,0,133,134,
+        5,103,0,0,134,135,5,103,0,0,135,136,5,114,0,0,136,137,5,101,0,0,
+        137,138,5,103,0,0,138,139,5,97,0,0,139,140,5,116,0,0,140,141,5,101,
+        0,0,141,8,1,0,0,0,142,143,5,112,0,0,143,144,5,114,0,0,144,145,5,
+        105,0,0,145,146,5,110,0,0,146,147,5,116,0,0,147,10,1,0,0,0,148,149,
+        5,115,0,0,149,150,5,111,0,0,150,151,5,114,0,0,151,152,5,116,0,0,
+        152,12,1,0,0,0,153,154,5,106,0,0,154,155,5,111,0,0,155,156,5,105,
+        0,0,156,157,5,110,0,0,157,14,1,0,0,0,158,159,5,111,0,0,159,160,5,
+        110,0,0,160,16,1,0,0,0,161,162,5,97,0,0,162,163,5,115,0,0,163,18,
+        1,0,0,0,164,165,5,115,0,0,165,166,5,97,0,0,166,167,5,109,0,0,167,
+        168,5,112,0,0,168,169,5,108,0,0,169,170,5,101,0,0,170,20,1,0,0,0,
+        171,172,5,98,0,0,172,173,5,121,0,0,173,22,1,0,0,0,174,175,5,97,0,
+        0,175,176,5,115,0,0,176,177,5,99,0,0,177,24,1,0,0,0,178,179,5,100,
+        0,0,179,180,5,101,0,0,180,181,5,115,0,0,181,182,5,99,0,0,182,26,
+        1,0,0,0,183,184,5,108,0,0,184,185,5,105,0,0,185,186,5,109,0,0,186,
+        187,5,105,0,0,187,188,5,116,0,0,188,28,1,0,0,0,189,190,5,111,0,0,
+        190,191,5,102,0,0,191,192,5,102,0,0,192,193,5,115,0,0,193,194,5,
+        101,0,0,194,195,5,116,0,0,195,30,1,0,0,0,196,197,5,97,0,0,197,198,
+        5,102,0,0,198,199,5,116,0,0,199,200,5,101,0,0,200,201,5,114,0,0,
+        201,32,1,0,0,0,202,203,5,101,0,0,203,204,5,120,0,0,204,205,5,112,
+        0,0,205,206,5,108,0,0,206,207,5,97,0,0,207,208,5,105,0,0,208,209,
+        5,110,0,0,209,34,1,0,0,0,210,211,5,97,0,0,211,212,5,110,0,0,212,
+        213,5,97,0,0,213,214,5,108,0,0,214,215,5,121,0,0,215,216,5,122,0,
+        0,216,217,5,101,0,0,217,36,1,0,0,0,218,219,5,99,0,0,219,220,5,111,
+        0,0,220,221,5,117,0,0,221,222,5,110,0,0,222,223,5,116,0,0,223,38,
+        1,0,0,0,224,225,5,115,0,0,225,226,5,117,0,0,226,227,5,109,0,0,227,
+        40,1,0,0,0,228,229,5,97,0,0,229,230,5,118,0,0,230,231,5,101,0,0,
+        231,232,5,114,0,0,232,233,5,97,0,0,233,234,5,103,0,0,234,235,5,101,
+        0,0,235,42,1,0,0,0,236,237,5,100,0,0,237,238,5,105,0,0,238,239,5,
+        115,0,0,239,240,5,116,0,0,240,241,5,105,0,0,241,242,5,110,0,0,242,
+        243,5,99,0,0,243,244,5,116,0,0,244,44,1,0,0,0,245,246,5,109,0,0,
+        246,247,5,105,0,0,247,248,5,110,0,0,248,46,1,0,0,0,249,250,5,109,
+        0,0,250,251,5,97,0,0,251,252,5,120,0,0,252,48,1,0,0,0,253,254,5,
+        115,0,0,254,255,5,116,0,0,255,256,5,100,0,0,256,257,5,100,0,0,257,
+        258,5,101,0,0,258,259,5,118,0,0,259,50,1,0,0,0,260,261,5,112,0,0,
+        261,262,5,101,0,0,262,263,5,114,0,0,263,264,5,99,0,0,264,265,5,101,
+        0,0,265,266,5,110,0,0,266,267,5,116,0,0,267,268,5,105,0,0,268,269,
+        5,108,0,0,269,270,5,101,0,0,270,52,1,0,0,0,271,272,5,109,0,0,272,
+        273,5,101,0,0,273,274,5,100,0,0,274,275,5,105,0,0,275,276,5,97,0,
+        0,276,277,5,110,0,0,277,54,1,0,0,0,278,279,5,97,0,0,279,280,5,112,
+        0,0,280,281,5,112,0,0,281,282,5,114,0,0,282,283,5,111,0,0,283,284,
+        5,120,0,0,284,56,1,0,0,0,285,286,5,62,0,0,286,58,1,0,0,0,287,288,
+        5,60,0,0,288,60,1,0,0,0,289,290,5,62,0,0,290,291,5,61,0,0,291,62,
+        1,0,0,0,292,293,5,60,0,0,293,294,5,61,0,0,294,64,1,0,0,0,295,296,
+        5,61,0,0,296,297,5,61,0,0,297,66,1,0,0,0,298,299,5,33,0,0,299,300,
+        5,61,0,0,300,68,1,0,0,0,301,302,5,98,0,0,302,303,5,101,0,0,303,304,
+        5,116,0,0,304,305,5,119,0,0,305,306,5,101,0,0,306,307,5,101,0,0,
+        307,308,5,110,0,0,308,70,1,0,0,0,309,310,5,115,0,0,310,311,5,116,
+        0,0,311,312,5,97,0,0,312,313,5,114,0,0,313,314,5,116,0,0,314,315,
+        5,115,0,0,315,316,5,95,0,0,316,317,5,119,0,0,317,318,5,105,0,0,318,
+        319,5,116,0,0,319,320,5,104,0,0,320,72,1,0,0,0,321,322,5,99,0,0,
+        322,323,5,111,0,0,323,324,5,110,0,0,324,325,5,116,0,0,325,326,5,
+        97,0,0,326,327,5,105,0,0,327,328,5,110,0,0,328,329,5,115,0,0,329,
+        74,1,0,0,0,330,331,5,108,0,0,331,332,5,105,0,0,332,333,5,107,0,0,
+        333,334,5,101,0,0,334,76,1,0,0,0,335,336,5,97,0,0,336,337,5,110,
+        0,0,337,338,5,100,0,0,338,78,1,0,0,0,339,340,5,111,0,0,340,341,5,
+        114,0,0,341,80,1,0,0,0,342,343,5,43,0,0,343,82,1,0,0,0,344,345,5,
+        45,0,0,345,84,1,0,0,0,346,347,5,42,0,0,347,86,1,0,0,0,348,349,5,
+        47,0,0,349,88,1,0,0,0,350,351,5,37,0,0,351,90,1,0,0,0,352,353,5,
+        40,0,0,353,92,1,0,0,0,354,355,5,41,0,0,355,94,1,0,0,0,356,357,7,
+        0,0,0,357,358,7,0,0,0,358,359,7,0,0,0,359,360,7,0,0,0,360,361,5,
+        45,0,0,361,362,7,0,0,0,362,363,7,0,0,0,363,364,5,45,0,0,364,365,
+        7,0,0,0,365,366,7,0,0,0,366,96,1,0,0,0,367,369,7,0,0,0,368,367,1,
+        0,0,0,369,370,1,0,0,0,370,368,1,0,0,0,370,371,1,0,0,0,371,378,1,
+        0,0,0,372,374,5,46,0,0,373,375,7,0,0,0,374,373,1,0,0,0,375,376,1,
+        0,0,0,376,374,1,0,0,0,376,377,1,0,0,0,377,379,1,0,0,0,378,372,1,
+        0,0,0,378,379,1,0,0,0,379,98,1,0,0,0,380,384,7,1,0,0,381,383,7,2,
+        0,0,382,381,1,0,0,0,383,386,1,0,0,0,384,382,1,0,0,0,384,385,1,0,
+        0,0,385,100,1,0,0,0,386,384,1,0,0,0,387,388,5,36,0,0,388,392,7,1,
+        0,0,389,391,7,2,0,0,390,389,1,0,0,0,391,394,1,0,0,0,392,390,1,0,
+        0,0,392,393,1,0,0,0,393,397,1,0,0,0,394,392,1,0,0,0,395,397,5,63,
+        0,0,396,387,1,0,0,0,396,395,1,0,0,0,397,102,1,0,0,0,398,402,5,34,
+        0,0,399,401,8,3,0,0,400,399,1,0,0,0,401,404,1,0,0,0,402,400,1,0,
+        0,0,402,403,1,0,0,0,403,405,1,0,0,0,404,402,1,0,0,0,405,406,5,34,
+        0,0,406,104,1,0,0,0,407,408,5,59,0,0,408,106,1,0,0,0,409,410,5,44,
+        0,0,410,108,1,0,0,0,411,413,7,4,0,0,412,411,1,0,0,0,413,414,1,0,
+        0,0,414,412,1,0,0,0,414,415,1,0,0,0,415,416,1,0,0,0,416,417,6,54,
+        0,0,417,110,1,0,0,0,418,419,5,47,0,0,419,420,5,47,0,0,420,424,1,
+        0,0,0,421,423,8,5,0,0,422,421,1,0,0,0,423,426,1,0,0,0,424,422,1,
+        0,0,0,424,425,1,0,0,0,425,427,1,0,0,0,426,424,1,0,0,0,427,428,6,
+        55,0,0,428,112,1,0,0,0,10,0,370,376,378,384,392,396,402,414,424,
+        1,6,0,0
     ]
 
 class EmployeeDSLLexer(Lexer):
@@ -90,25 +175,56 @@ class EmployeeDSLLexer(Lexer):
     AGGREGATE = 4
     PRINT = 5
     SORT = 6
-    ASC = 7
-    DESC = 8
-    COUNT = 9
-    SUM = 10
-    AVERAGE = 11
-    GT = 12
-    LT = 13
-    GTE = 14
-    LTE = 15
-    EQ = 16
-    NEQ = 17
-    BETWEEN = 18
-    AND = 19
-    OR = 20
-    NUMBER = 21
-    STRING_LITERAL = 22
-    SEMICOLON = 23
-    WS = 24
-    COMMENT = 25
+    JOIN = 7
+    ON = 8
+    AS = 9
+    SAMPLE = 10
+    BY = 11
+    ASC = 12
+    DESC = 13
+    LIMIT = 14
+    OFFSET = 15
+    AFTER = 16
+    EXPLAIN = 17
+    ANALYZE = 18
+    COUNT = 19
+    SUM = 20
+    AVERAGE = 21
+    DISTINCT = 22
+    MIN = 23
+    MAX = 24
+    STDDEV = 25
+    PERCENTILE = 26
+    MEDIAN = 27
+    APPROX = 28
+    GT = 29
+    LT = 30
+    GTE = 31
+    LTE = 32
+    EQ = 33
+    NEQ = 34
+    BETWEEN = 35
+    STARTS_WITH = 36
+    CONTAINS = 37
+    LIKE = 38
+    AND = 39
+    OR = 40
+    PLUS = 41
+    MINUS = 42
+    MUL = 43
+    DIV = 44
+    PERCENT = 45
+    LPAREN = 46
+    RPAREN = 47
+    DATE_LITERAL = 48
+    NUMBER = 49
+    IDENTIFIER = 50
+    PARAMETER = 51
+    STRING_LITERAL = 52
+    SEMICOLON = 53
+    COMMA = 54
+    WS = 55
+    COMMENT = 56
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -116,20 +232,33 @@ class EmployeeDSLLexer(Lexer):
 
     literalNames = [ "<INVALID>",
             "'load'", "'filter'", "'column'", "'aggregate'", "'print'", 
-            "'sort'", "'asc'", "'desc'", "'count'", "'sum'", "'average'", 
-            "'>'", "'<'", "'>='", "'<='", "'=='", "'!='", "'between'", "'and'", 
-            "'or'", "';'" ]
+            "'sort'", "'join'", "'on'", "'as'", "'sample'", "'by'", "'asc'", 
+            "'desc'", "'limit'", "'offset'", "'after'", "'explain'", "'analyze'", 
+            "'count'", "'sum'", "'average'", "'distinct'", "'min'", "'max'", 
+            "'stddev'", "'percentile'", "'median'", "'approx'", "'>'", "'<'", 
+            "'>='", "'<='", "'=='", "'!='", "'between'", "'starts_with'", 
+            "'contains'", "'like'", "'and'", "'or'", "'+'", "'-'", "'*'", 
+            "'/'", "'%'", "'('", "')'", "';'", "','" ]
 
     symbolicNames = [ "<INVALID>",
-            "LOAD", "FILTER", "COLUMN", "AGGREGATE", "PRINT", "SORT", "ASC", 
-            "DESC", "COUNT", "SUM", "AVERAGE", "GT", "LT", "GTE", "LTE", 
-            "EQ", "NEQ", "BETWEEN", "AND", "OR", "NUMBER", "STRING_LITERAL", 
-            "SEMICOLON", "WS", "COMMENT" ]
+            "LOAD", "FILTER", "COLUMN", "AGGREGATE", "PRINT", "SORT", "JOIN", 
+            "ON", "AS", "SAMPLE", "BY", "ASC", "DESC", "LIMIT", "OFFSET", 
+            "AFTER", "EXPLAIN", "ANALYZE", "COUNT", "SUM", "AVERAGE", "DISTINCT", 
+            "MIN", "MAX", "STDDEV", "PERCENTILE", "MEDIAN", "APPROX", "GT", 
+            "LT", "GTE", "LTE", "EQ", "NEQ", "BETWEEN", "STARTS_WITH", "CONTAINS", 
+            "LIKE", "AND", "OR", "PLUS", "MINUS", "MUL", "DIV", "PERCENT", 
+            "LPAREN", "RPAREN", "DATE_LITERAL", "NUMBER", "IDENTIFIER", 
+            "PARAMETER", "STRING_LITERAL", "SEMICOLON", "COMMA", "WS", "COMMENT" ]
 
     ruleNames = [ "LOAD", "FILTER", "COLUMN", "AGGREGATE", "PRINT", "SORT", 
-                  "ASC", "DESC", "COUNT", "SUM", "AVERAGE", "GT", "LT", 
-                  "GTE", "LTE", "EQ", "NEQ", "BETWEEN", "AND", "OR", "NUMBER", 
-                  "STRING_LITERAL", "SEMICOLON", "WS", "COMMENT" ]
+                  "JOIN", "ON", "AS", "SAMPLE", "BY", "ASC", "DESC", "LIMIT", 
+                  "OFFSET", "AFTER", "EXPLAIN", "ANALYZE", "COUNT", "SUM", 
+                  "AVERAGE", "DISTINCT", "MIN", "MAX", "STDDEV", "PERCENTILE", 
+                  "MEDIAN", "APPROX", "GT", "LT", "GTE", "LTE", "EQ", "NEQ", 
+                  "BETWEEN", "STARTS_WITH", "CONTAINS", "LIKE", "AND", "OR", 
+                  "PLUS", "MINUS", "MUL", "DIV", "PERCENT", "LPAREN", "RPAREN", 
+                  "DATE_LITERAL", "NUMBER", "IDENTIFIER", "PARAMETER", "STRING_LITERAL", 
+                  "SEMICOLON", "COMMA", "WS", "COMMENT" ]
 
     grammarFileName = "EmployeeDSL.g4"
 
@@ -35,6 +35,24 @@ class EmployeeDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by EmployeeDSLParser#joinStatement.
+    def enterJoinStatement(self, ctx:EmployeeDSLParser.JoinStatementContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#joinStatement.
+    def exitJoinStatement(self, ctx:EmployeeDSLParser.JoinStatementContext):
+        pass
+
+
+    # Enter a parse tree produced by EmployeeDSLParser#sampleStatement.
+    def enterSampleStatement(self, ctx:EmployeeDSLParser.SampleStatementContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#sampleStatement.
+    def exitSampleStatement(self, ctx:EmployeeDSLParser.SampleStatementContext):
+        pass
+
+
     # Enter a parse tree produced by EmployeeDSLParser#filterStatement.
     def enterFilterStatement(self, ctx:EmployeeDSLParser.FilterStatementContext):
         pass
@@ -62,6 +80,15 @@ class EmployeeDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by EmployeeDSLParser#expression.
+    def enterExpression(self, ctx:EmployeeDSLParser.ExpressionContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#expression.
+    def exitExpression(self, ctx:EmployeeDSLParser.ExpressionContext):
+        pass
+
+
     # Enter a parse tree produced by EmployeeDSLParser#aggregateStatement.
     def enterAggregateStatement(self, ctx:EmployeeDSLParser.AggregateStatementContext):
         pass
@@ -89,6 +116,24 @@ class EmployeeDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by EmployeeDSLParser#sortKey.
+    def enterSortKey(self, ctx:EmployeeDSLParser.SortKeyContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#sortKey.
+    def exitSortKey(self, ctx:EmployeeDSLParser.SortKeyContext):
+        pass
+
+
+    # Enter a parse tree produced by EmployeeDSLParser#limitStatement.
+    def enterLimitStatement(self, ctx:EmployeeDSLParser.LimitStatementContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#limitStatement.
+    def exitLimitStatement(self, ctx:EmployeeDSLParser.LimitStatementContext):
+        pass
+
+
     # Enter a parse tree produced by EmployeeDSLParser#printStatement.
     def enterPrintStatement(self, ctx:EmployeeDSLParser.PrintStatementContext):
         pass
@@ -98,5 +143,14 @@ class EmployeeDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by EmployeeDSLParser#explainStatement.
+    def enterExplainStatement(self, ctx:EmployeeDSLParser.ExplainStatementContext):
+        pass
+
+    # Exit a parse tree produced by EmployeeDSLParser#explainStatement.
+    def exitExplainStatement(self, ctx:EmployeeDSLParser.ExplainStatementContext):
+        pass
+
+
 
 del EmployeeDSLParser
\ No newline at end of file
@@ -10,32 +10,82 @@ else:
 
 def serializedATN():
     return [
-        4,1,25,84,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
-        6,2,7,7,7,2,8,7,8,2,9,7,9,1,0,4,0,22,8,0,11,0,12,0,23,1,0,1,0,1,
-        1,1,1,1,1,1,1,1,1,3,1,33,8,1,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,
-        1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,5,3,53,8,3,10,3,12,3,56,9,3,
-        1,4,1,4,1,5,1,5,1,5,1,5,1,5,3,5,65,8,5,1,6,1,6,1,6,1,6,1,6,1,6,1,
-        7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,0,1,6,10,0,2,4,6,8,
-        10,12,14,16,18,0,3,1,0,12,18,1,0,9,11,1,0,7,8,82,0,21,1,0,0,0,2,
-        32,1,0,0,0,4,34,1,0,0,0,6,38,1,0,0,0,8,57,1,0,0,0,10,64,1,0,0,0,
-        12,66,1,0,0,0,14,72,1,0,0,0,16,74,1,0,0,0,18,80,1,0,0,0,20,22,3,
-        2,1,0,21,20,1,0,0,0,22,23,1,0,0,0,23,21,1,0,0,0,23,24,1,0,0,0,24,
-        25,1,0,0,0,25,26,5,0,0,1,26,1,1,0,0,0,27,33,3,4,2,0,28,33,3,6,3,
-        0,29,33,3,12,6,0,30,33,3,18,9,0,31,33,3,16,8,0,32,27,1,0,0,0,32,
-        28,1,0,0,0,32,29,1,0,0,0,32,30,1,0,0,0,32,31,1,0,0,0,33,3,1,0,0,
-        0,34,35,5,1,0,0,35,36,5,22,0,0,36,37,5,23,0,0,37,5,1,0,0,0,38,39,
-        6,3,-1,0,39,40,5,2,0,0,40,41,5,3,0,0,41,42,5,22,0,0,42,43,3,8,4,
-        0,43,44,3,10,5,0,44,45,5,23,0,0,45,54,1,0,0,0,46,47,10,2,0,0,47,
-        48,5,19,0,0,48,53,3,6,3,3,49,50,10,1,0,0,50,51,5,20,0,0,51,53,3,
-        6,3,2,52,46,1,0,0,0,52,49,1,0,0,0,53,56,1,0,0,0,54,52,1,0,0,0,54,
-        55,1,0,0,0,55,7,1,0,0,0,56,54,1,0,0,0,57,58,7,0,0,0,58,9,1,0,0,0,
-        59,65,5,21,0,0,60,65,5,22,0,0,61,62,5,21,0,0,62,63,5,19,0,0,63,65,
-        5,21,0,0,64,59,1,0,0,0,64,60,1,0,0,0,64,61,1,0,0,0,65,11,1,0,0,0,
-        66,67,5,4,0,0,67,68,3,14,7,0,68,69,5,3,0,0,69,70,5,22,0,0,70,71,
-        5,23,0,0,71,13,1,0,0,0,72,73,7,1,0,0,73,15,1,0,0,0,74,75,5,6,0,0,
-        75,76,5,3,0,0,76,77,5,22,0,0,77,78,7,2,0,0,78,79,5,23,0,0,79,17,
-        1,0,0,0,80,81,5,5,0,0,81,82,5,23,0,0,82,19,1,0,0,0,5,23,32,52,54,
-        64
+        4,1,56,213,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,1,0,4,0,34,8,0,11,0,12,0,35,1,0,1,0,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,49,8,1,1,2,1,2,1,2,1,2,3,2,55,8,
+        2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,3,3,67,8,3,1,3,1,3,1,4,
+        1,4,1,4,1,4,1,4,1,4,3,4,77,8,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,
+        5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,3,5,95,8,5,1,5,1,5,1,5,1,5,1,5,1,5,
+        5,5,103,8,5,10,5,12,5,106,9,5,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,
+        7,1,7,1,7,1,7,1,7,1,7,1,7,3,7,123,8,7,1,8,1,8,1,8,1,8,1,8,1,8,1,
+        8,1,8,1,8,1,8,1,8,1,8,1,8,3,8,138,8,8,1,8,1,8,1,8,1,8,1,8,1,8,5,
+        8,146,8,8,10,8,12,8,149,9,8,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,3,
+        10,159,8,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,3,10,169,8,10,
+        1,10,1,10,1,10,3,10,174,8,10,1,10,3,10,177,8,10,1,11,1,11,1,11,1,
+        11,5,11,183,8,11,10,11,12,11,186,9,11,1,11,1,11,1,12,1,12,1,12,1,
+        12,1,13,1,13,1,13,1,13,1,13,1,13,3,13,200,8,13,1,13,1,13,1,14,1,
+        14,1,14,1,15,1,15,3,15,209,8,15,1,15,1,15,1,15,0,2,10,16,16,0,2,
+        4,6,8,10,12,14,16,18,20,22,24,26,28,30,0,5,1,0,29,38,1,0,43,44,1,
+        0,41,42,1,0,12,13,1,0,51,52,237,0,33,1,0,0,0,2,48,1,0,0,0,4,50,1,
+        0,0,0,6,58,1,0,0,0,8,70,1,0,0,0,10,94,1,0,0,0,12,107,1,0,0,0,14,
+        122,1,0,0,0,16,137,1,0,0,0,18,150,1,0,0,0,20,176,1,0,0,0,22,178,
+        1,0,0,0,24,189,1,0,0,0,26,193,1,0,0,0,28,203,1,0,0,0,30,206,1,0,
+        0,0,32,34,3,2,1,0,33,32,1,0,0,0,34,35,1,0,0,0,35,33,1,0,0,0,35,36,
+        1,0,0,0,36,37,1,0,0,0,37,38,5,0,0,1,38,1,1,0,0,0,39,49,3,4,2,0,40,
+        49,3,10,5,0,41,49,3,18,9,0,42,49,3,28,14,0,43,49,3,22,11,0,44,49,
+        3,6,3,0,45,49,3,8,4,0,46,49,3,26,13,0,47,49,3,30,15,0,48,39,1,0,
+        0,0,48,40,1,0,0,0,48,41,1,0,0,0,48,42,1,0,0,0,48,43,1,0,0,0,48,44,
+        1,0,0,0,48,45,1,0,0,0,48,46,1,0,0,0,48,47,1,0,0,0,49,3,1,0,0,0,50,
+        51,5,1,0,0,51,54,5,52,0,0,52,53,5,9,0,0,53,55,5,50,0,0,54,52,1,0,
+        0,0,54,55,1,0,0,0,55,56,1,0,0,0,56,57,5,53,0,0,57,5,1,0,0,0,58,59,
+        5,7,0,0,59,60,5,50,0,0,60,61,5,8,0,0,61,62,5,3,0,0,62,66,5,52,0,
+        0,63,64,5,33,0,0,64,65,5,3,0,0,65,67,5,52,0,0,66,63,1,0,0,0,66,67,
+        1,0,0,0,67,68,1,0,0,0,68,69,5,53,0,0,69,7,1,0,0,0,70,71,5,10,0,0,
+        71,72,5,49,0,0,72,76,5,45,0,0,73,74,5,11,0,0,74,75,5,3,0,0,75,77,
+        5,52,0,0,76,73,1,0,0,0,76,77,1,0,0,0,77,78,1,0,0,0,78,79,5,53,0,
+        0,79,9,1,0,0,0,80,81,6,5,-1,0,81,82,5,2,0,0,82,83,5,3,0,0,83,84,
+        5,52,0,0,84,85,3,12,6,0,85,86,3,14,7,0,86,87,5,53,0,0,87,95,1,0,
+        0,0,88,89,5,2,0,0,89,90,3,16,8,0,90,91,3,12,6,0,91,92,3,14,7,0,92,
+        93,5,53,0,0,93,95,1,0,0,0,94,80,1,0,0,0,94,88,1,0,0,0,95,104,1,0,
+        0,0,96,97,10,2,0,0,97,98,5,39,0,0,98,103,3,10,5,3,99,100,10,1,0,
+        0,100,101,5,40,0,0,101,103,3,10,5,2,102,96,1,0,0,0,102,99,1,0,0,
+        0,103,106,1,0,0,0,104,102,1,0,0,0,104,105,1,0,0,0,105,11,1,0,0,0,
+        106,104,1,0,0,0,107,108,7,0,0,0,108,13,1,0,0,0,109,123,5,49,0,0,
+        110,123,5,52,0,0,111,112,5,49,0,0,112,113,5,39,0,0,113,123,5,49,
+        0,0,114,123,5,48,0,0,115,116,5,48,0,0,116,117,5,39,0,0,117,123,5,
+        48,0,0,118,123,5,51,0,0,119,120,5,51,0,0,120,121,5,39,0,0,121,123,
+        5,51,0,0,122,109,1,0,0,0,122,110,1,0,0,0,122,111,1,0,0,0,122,114,
+        1,0,0,0,122,115,1,0,0,0,122,118,1,0,0,0,122,119,1,0,0,0,123,15,1,
+        0,0,0,124,125,6,8,-1,0,125,126,5,46,0,0,126,127,3,16,8,0,127,128,
+        5,47,0,0,128,138,1,0,0,0,129,130,5,50,0,0,130,131,5,46,0,0,131,132,
+        3,16,8,0,132,133,5,47,0,0,133,138,1,0,0,0,134,135,5,3,0,0,135,138,
+        5,52,0,0,136,138,5,49,0,0,137,124,1,0,0,0,137,129,1,0,0,0,137,134,
+        1,0,0,0,137,136,1,0,0,0,138,147,1,0,0,0,139,140,10,6,0,0,140,141,
+        7,1,0,0,141,146,3,16,8,7,142,143,10,5,0,0,143,144,7,2,0,0,144,146,
+        3,16,8,6,145,139,1,0,0,0,145,142,1,0,0,0,146,149,1,0,0,0,147,145,
+        1,0,0,0,147,148,1,0,0,0,148,17,1,0,0,0,149,147,1,0,0,0,150,151,5,
+        4,0,0,151,152,3,20,10,0,152,153,5,3,0,0,153,154,5,52,0,0,154,155,
+        5,53,0,0,155,19,1,0,0,0,156,177,5,19,0,0,157,159,5,28,0,0,158,157,
+        1,0,0,0,158,159,1,0,0,0,159,160,1,0,0,0,160,161,5,19,0,0,161,177,
+        5,22,0,0,162,177,5,20,0,0,163,177,5,21,0,0,164,177,5,23,0,0,165,
+        177,5,24,0,0,166,177,5,25,0,0,167,169,5,28,0,0,168,167,1,0,0,0,168,
+        169,1,0,0,0,169,170,1,0,0,0,170,171,5,26,0,0,171,177,5,49,0,0,172,
+        174,5,28,0,0,173,172,1,0,0,0,173,174,1,0,0,0,174,175,1,0,0,0,175,
+        177,5,27,0,0,176,156,1,0,0,0,176,158,1,0,0,0,176,162,1,0,0,0,176,
+        163,1,0,0,0,176,164,1,0,0,0,176,165,1,0,0,0,176,166,1,0,0,0,176,
+        168,1,0,0,0,176,173,1,0,0,0,177,21,1,0,0,0,178,179,5,6,0,0,179,184,
+        3,24,12,0,180,181,5,54,0,0,181,183,3,24,12,0,182,180,1,0,0,0,183,
+        186,1,0,0,0,184,182,1,0,0,0,184,185,1,0,0,0,185,187,1,0,0,0,186,
+        184,1,0,0,0,187,188,5,53,0,0,188,23,1,0,0,0,189,190,5,3,0,0,190,
+        191,5,52,0,0,191,192,7,3,0,0,192,25,1,0,0,0,193,194,5,14,0,0,194,
+        199,5,49,0,0,195,196,5,15,0,0,196,200,5,49,0,0,197,198,5,16,0,0,
+        198,200,7,4,0,0,199,195,1,0,0,0,199,197,1,0,0,0,199,200,1,0,0,0,
+        200,201,1,0,0,0,201,202,5,53,0,0,202,27,1,0,0,0,203,204,5,5,0,0,
+        204,205,5,53,0,0,205,29,1,0,0,0,206,208,5,17,0,0,207,209,5,18,0,
+        0,208,207,1,0,0,0,208,209,1,0,0,0,209,210,1,0,0,0,210,211,5,53,0,
+        0,211,31,1,0,0,0,19,35,48,54,66,76,94,102,104,122,137,145,147,158,
+        168,173,176,184,199,208
     ]
 
 class EmployeeDSLParser ( Parser ):
@@ -49,31 +99,49 @@ class EmployeeDSLParser ( Parser ):
     sharedContextCache = PredictionContextCache()
 
     literalNames = [ "<INVALID>", "'load'", "'filter'", "'column'", "'aggregate'", 
-                     "'print'", "'sort'", "'asc'", "'desc'", "'count'", 
-                     "'sum'", "'average'", "'>'", "'<'", "'>='", "'<='", 
-                     "'=='", "'!='", "'between'", "'and'", "'or'", "<INVALID>", 
-                     "<INVALID>", "';'" ]
+                     "'print'", "'sort'", "'join'", "'on'", "'as'", "'sample'", 
+                     "'by'", "'asc'", "'desc'", "'limit'", "'offset'", "'after'", 
+                     "'explain'", "'analyze'", "'count'", "'sum'", "'average'", 
+                     "'distinct'", "'min'", "'max'", "'stddev'", "'percentile'", 
+                     "'median'", "'approx'", "'>'", "'<'", "'>='", "'<='", 
+                     "'=='", "'!='", "'between'", "'starts_with'", "'contains'", 
+                     "'like'", "'and'", "'or'", "'+'", "'-'", "'*'", "'/'", 
+                     "'%'", "'('", "')'", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "';'", "','" ]
 
     symbolicNames = [ "<INVALID>", "LOAD", "FILTER", "COLUMN", "AGGREGATE", 
-                      "PRINT", "SORT", "ASC", "DESC", "COUNT", "SUM", "AVERAGE", 
+                      "PRINT", "SORT", "JOIN", "ON", "AS", "SAMPLE", "BY", 
+                      "ASC", "DESC", "LIMIT", "OFFSET", "AFTER", "EXPLAIN", 
+                      "ANALYZE", "COUNT", "SUM", "AVERAGE", "DISTINCT", 
+                      "MIN", "MAX", "STDDEV", "PERCENTILE", "MEDIAN", "APPROX", 
                       "GT", "LT", "GTE", "LTE", "EQ", "NEQ", "BETWEEN", 
-                      "AND", "OR", "NUMBER", "STRING_LITERAL", "SEMICOLON", 
-                      "WS", "COMMENT" ]
+                      "STARTS_WITH", "CONTAINS", "LIKE", "AND", "OR", "PLUS", 
+                      "MINUS", "MUL", "DIV", "PERCENT", "LPAREN", "RPAREN", 
+                      "DATE_LITERAL", "NUMBER", "IDENTIFIER", "PARAMETER", 
+                      "STRING_LITERAL", "SEMICOLON", "COMMA", "WS", "COMMENT" ]
 
     RULE_program = 0
     RULE_statement = 1
     RULE_loadStatement = 2
-    RULE_filterStatement = 3
-    RULE_operator = 4
-    RULE_value = 5
-    RULE_aggregateStatement = 6
-    RULE_aggregateFunction = 7
-    RULE_sortStatement = 8
-    RULE_printStatement = 9
-
-    ruleNames =  [ "program", "statement", "loadStatement", "filterStatement", 
-                   "operator", "value", "aggregateStatement", "aggregateFunction", 
-                   "sortStatement", "printStatement" ]
+    RULE_joinStatement = 3
+    RULE_sampleStatement = 4
+    RULE_filterStatement = 5
+    RULE_operator = 6
+    RULE_value = 7
+    RULE_expression = 8
+    RULE_aggregateStatement = 9
+    RULE_aggregateFunction = 10
+    RULE_sortStatement = 11
+    RULE_sortKey = 12
+    RULE_limitStatement = 13
+    RULE_printStatement = 14
+    RULE_explainStatement = 15
+
+    ruleNames =  [ "program", "statement", "loadStatement", "joinStatement", 
+                   "sampleStatement", "filterStatement", "operator", "value", 
+                   "expression", "aggregateStatement", "aggregateFunction", 
+                   "sortStatement", "sortKey", "limitStatement", "printStatement", 
+                   "explainStatement" ]
 
     EOF = Token.EOF
     LOAD=1
@@ -82,25 +150,56 @@ class EmployeeDSLParser ( Parser ):
     AGGREGATE=4
     PRINT=5
     SORT=6
-    ASC=7
-    DESC=8
-    COUNT=9
-    SUM=10
-    AVERAGE=11
-    GT=12
-    LT=13
-    GTE=14
-    LTE=15
-    EQ=16
-    NEQ=17
-    BETWEEN=18
-    AND=19
-    OR=20
-    NUMBER=21
-    STRING_LITERAL=22
-    SEMICOLON=23
-    WS=24
-    COMMENT=25
+    JOIN=7
+    ON=8
+    AS=9
+    SAMPLE=10
+    BY=11
+    ASC=12
+    DESC=13
+    LIMIT=14
+    OFFSET=15
+    AFTER=16
+    EXPLAIN=17
+    ANALYZE=18
+    COUNT=19
+    SUM=20
+    AVERAGE=21
+    DISTINCT=22
+    MIN=23
+    MAX=24
+    STDDEV=25
+    PERCENTILE=26
+    MEDIAN=27
+    APPROX=28
+    GT=29
+    LT=30
+    GTE=31
+    LTE=32
+    EQ=33
+    NEQ=34
+    BETWEEN=35
+    STARTS_WITH=36
+    CONTAINS=37
+    LIKE=38
+    AND=39
+    OR=40
+    PLUS=41
+    MINUS=42
+    MUL=43
+    DIV=44
+    PERCENT=45
+    LPAREN=46
+    RPAREN=47
+    DATE_LITERAL=48
+    NUMBER=49
+    IDENTIFIER=50
+    PARAMETER=51
+    STRING_LITERAL=52
+    SEMICOLON=53
+    COMMA=54
+    WS=55
+    COMMENT=56
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -155,19 +254,19 @@ class EmployeeDSLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 21 
+            self.state = 33 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 20
+                self.state = 32
                 self.statement()
-                self.state = 23 
+                self.state = 35 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 118) != 0)):
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 148726) != 0)):
                     break
 
-            self.state = 25
+            self.state = 37
             self.match(EmployeeDSLParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -205,6 +304,22 @@ class EmployeeDSLParser ( Parser ):
             return self.getTypedRuleContext(EmployeeDSLParser.SortStatementContext,0)
 
 
+        def joinStatement(self):
+            return self.getTypedRuleContext(EmployeeDSLParser.JoinStatementContext,0)
+
+
+        def sampleStatement(self):
+            return self.getTypedRuleContext(EmployeeDSLParser.SampleStatementContext,0)
+
+
+        def limitStatement(self):
+            return self.getTypedRuleContext(EmployeeDSLParser.LimitStatementContext,0)
+
+
+        def explainStatement(self):
+            return self.getTypedRuleContext(EmployeeDSLParser.ExplainStatementContext,0)
+
+
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_statement
 
@@ -230,34 +345,54 @@ class EmployeeDSLParser ( Parser ):
         localctx = EmployeeDSLParser.StatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_statement)
         try:
-            self.state = 32
+            self.state = 48
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [1]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 27
+                self.state = 39
                 self.loadStatement()
                 pass
             elif token in [2]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 28
+                self.state = 40
                 self.filterStatement(0)
                 pass
             elif token in [4]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 29
+                self.state = 41
                 self.aggregateStatement()
                 pass
             elif token in [5]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 30
+                self.state = 42
                 self.printStatement()
                 pass
             elif token in [6]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 31
+                self.state = 43
                 self.sortStatement()
                 pass
+            elif token in [7]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 44
+                self.joinStatement()
+                pass
+            elif token in [10]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 45
+                self.sampleStatement()
+                pass
+            elif token in [14]:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 46
+                self.limitStatement()
+                pass
+            elif token in [17]:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 47
+                self.explainStatement()
+                pass
             else:
                 raise NoViableAltException(self)
 
@@ -286,6 +421,12 @@ class EmployeeDSLParser ( Parser ):
         def SEMICOLON(self):
             return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
 
+        def AS(self):
+            return self.getToken(EmployeeDSLParser.AS, 0)
+
+        def IDENTIFIER(self):
+            return self.getToken(EmployeeDSLParser.IDENTIFIER, 0)
+
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_loadStatement
 
@@ -310,13 +451,202 @@ class EmployeeDSLParser ( Parser ):
 
         localctx = EmployeeDSLParser.LoadStatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 4, self.RULE_loadStatement)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 34
+            self.state = 50
             self.match(EmployeeDSLParser.LOAD)
-            self.state = 35
+            self.state = 51
+            self.match(EmployeeDSLParser.STRING_LITERAL)
+            self.state = 54
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==9:
+                self.state = 52
+                self.match(EmployeeDSLParser.AS)
+                self.state = 53
+                self.match(EmployeeDSLParser.IDENTIFIER)
+
+
+            self.state = 56
+            self.match(EmployeeDSLParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class JoinStatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def JOIN(self):
+            return self.getToken(EmployeeDSLParser.JOIN, 0)
+
+        def IDENTIFIER(self):
+            return self.getToken(EmployeeDSLParser.IDENTIFIER, 0)
+
+        def ON(self):
+            return self.getToken(EmployeeDSLParser.ON, 0)
+
+        def COLUMN(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.COLUMN)
+            else:
+                return self.getToken(EmployeeDSLParser.COLUMN, i)
+
+        def STRING_LITERAL(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.STRING_LITERAL)
+            else:
+                return self.getToken(EmployeeDSLParser.STRING_LITERAL, i)
+
+        def SEMICOLON(self):
+            return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
+
+        def EQ(self):
+            return self.getToken(EmployeeDSLParser.EQ, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_joinStatement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterJoinStatement" ):
+                listener.enterJoinStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitJoinStatement" ):
+                listener.exitJoinStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitJoinStatement" ):
+                return visitor.visitJoinStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def joinStatement(self):
+
+        localctx = EmployeeDSLParser.JoinStatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_joinStatement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 58
+            self.match(EmployeeDSLParser.JOIN)
+            self.state = 59
+            self.match(EmployeeDSLParser.IDENTIFIER)
+            self.state = 60
+            self.match(EmployeeDSLParser.ON)
+            self.state = 61
+            self.match(EmployeeDSLParser.COLUMN)
+            self.state = 62
             self.match(EmployeeDSLParser.STRING_LITERAL)
-            self.state = 36
+            self.state = 66
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==33:
+                self.state = 63
+                self.match(EmployeeDSLParser.EQ)
+                self.state = 64
+                self.match(EmployeeDSLParser.COLUMN)
+                self.state = 65
+                self.match(EmployeeDSLParser.STRING_LITERAL)
+
+
+            self.state = 68
+            self.match(EmployeeDSLParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SampleStatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SAMPLE(self):
+            return self.getToken(EmployeeDSLParser.SAMPLE, 0)
+
+        def NUMBER(self):
+            return self.getToken(EmployeeDSLParser.NUMBER, 0)
+
+        def PERCENT(self):
+            return self.getToken(EmployeeDSLParser.PERCENT, 0)
+
+        def SEMICOLON(self):
+            return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
+
+        def BY(self):
+            return self.getToken(EmployeeDSLParser.BY, 0)
+
+        def COLUMN(self):
+            return self.getToken(EmployeeDSLParser.COLUMN, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(EmployeeDSLParser.STRING_LITERAL, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_sampleStatement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSampleStatement" ):
+                listener.enterSampleStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSampleStatement" ):
+                listener.exitSampleStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSampleStatement" ):
+                return visitor.visitSampleStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def sampleStatement(self):
+
+        localctx = EmployeeDSLParser.SampleStatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_sampleStatement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 70
+            self.match(EmployeeDSLParser.SAMPLE)
+            self.state = 71
+            self.match(EmployeeDSLParser.NUMBER)
+            self.state = 72
+            self.match(EmployeeDSLParser.PERCENT)
+            self.state = 76
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==11:
+                self.state = 73
+                self.match(EmployeeDSLParser.BY)
+                self.state = 74
+                self.match(EmployeeDSLParser.COLUMN)
+                self.state = 75
+                self.match(EmployeeDSLParser.STRING_LITERAL)
+
+
+            self.state = 78
             self.match(EmployeeDSLParser.SEMICOLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -354,6 +684,10 @@ class EmployeeDSLParser ( Parser ):
         def SEMICOLON(self):
             return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
 
+        def expression(self):
+            return self.getTypedRuleContext(EmployeeDSLParser.ExpressionContext,0)
+
+
         def filterStatement(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(EmployeeDSLParser.FilterStatementContext)
@@ -391,64 +725,84 @@ class EmployeeDSLParser ( Parser ):
         _parentState = self.state
         localctx = EmployeeDSLParser.FilterStatementContext(self, self._ctx, _parentState)
         _prevctx = localctx
-        _startState = 6
-        self.enterRecursionRule(localctx, 6, self.RULE_filterStatement, _p)
+        _startState = 10
+        self.enterRecursionRule(localctx, 10, self.RULE_filterStatement, _p)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 39
-            self.match(EmployeeDSLParser.FILTER)
-            self.state = 40
-            self.match(EmployeeDSLParser.COLUMN)
-            self.state = 41
-            self.match(EmployeeDSLParser.STRING_LITERAL)
-            self.state = 42
-            self.operator()
-            self.state = 43
-            self.value()
-            self.state = 44
-            self.match(EmployeeDSLParser.SEMICOLON)
+            self.state = 94
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                self.state = 81
+                self.match(EmployeeDSLParser.FILTER)
+                self.state = 82
+                self.match(EmployeeDSLParser.COLUMN)
+                self.state = 83
+                self.match(EmployeeDSLParser.STRING_LITERAL)
+                self.state = 84
+                self.operator()
+                self.state = 85
+                self.value()
+                self.state = 86
+                self.match(EmployeeDSLParser.SEMICOLON)
+                pass
+
+            elif la_ == 2:
+                self.state = 88
+                self.match(EmployeeDSLParser.FILTER)
+                self.state = 89
+                self.expression(0)
+                self.state = 90
+                self.operator()
+                self.state = 91
+                self.value()
+                self.state = 92
+                self.match(EmployeeDSLParser.SEMICOLON)
+                pass
+
+
             self._ctx.stop = self._input.LT(-1)
-            self.state = 54
+            self.state = 104
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,3,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,7,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    self.state = 52
+                    self.state = 102
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,2,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
                     if la_ == 1:
                         localctx = EmployeeDSLParser.FilterStatementContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_filterStatement)
-                        self.state = 46
+                        self.state = 96
                         if not self.precpred(self._ctx, 2):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
-                        self.state = 47
+                        self.state = 97
                         self.match(EmployeeDSLParser.AND)
-                        self.state = 48
+                        self.state = 98
                         self.filterStatement(3)
                         pass
 
                     elif la_ == 2:
                         localctx = EmployeeDSLParser.FilterStatementContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_filterStatement)
-                        self.state = 49
+                        self.state = 99
                         if not self.precpred(self._ctx, 1):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
-                        self.state = 50
+                        self.state = 100
                         self.match(EmployeeDSLParser.OR)
-                        self.state = 51
+                        self.state = 101
                         self.filterStatement(2)
                         pass
 
              
-                self.state = 56
+                self.state = 106
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,3,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,7,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -487,6 +841,15 @@ class EmployeeDSLParser ( Parser ):
         def BETWEEN(self):
             return self.getToken(EmployeeDSLParser.BETWEEN, 0)
 
+        def STARTS_WITH(self):
+            return self.getToken(EmployeeDSLParser.STARTS_WITH, 0)
+
+        def CONTAINS(self):
+            return self.getToken(EmployeeDSLParser.CONTAINS, 0)
+
+        def LIKE(self):
+            return self.getToken(EmployeeDSLParser.LIKE, 0)
+
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_operator
 
@@ -510,13 +873,13 @@ class EmployeeDSLParser ( Parser ):
     def operator(self):
 
         localctx = EmployeeDSLParser.OperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 8, self.RULE_operator)
+        self.enterRule(localctx, 12, self.RULE_operator)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 57
+            self.state = 107
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 520192) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 549218942976) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -549,6 +912,18 @@ class EmployeeDSLParser ( Parser ):
         def AND(self):
             return self.getToken(EmployeeDSLParser.AND, 0)
 
+        def DATE_LITERAL(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.DATE_LITERAL)
+            else:
+                return self.getToken(EmployeeDSLParser.DATE_LITERAL, i)
+
+        def PARAMETER(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.PARAMETER)
+            else:
+                return self.getToken(EmployeeDSLParser.PARAMETER, i)
+
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_value
 
@@ -572,33 +947,65 @@ class EmployeeDSLParser ( Parser ):
     def value(self):
 
         localctx = EmployeeDSLParser.ValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_value)
+        self.enterRule(localctx, 14, self.RULE_value)
         try:
-            self.state = 64
+            self.state = 122
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 59
+                self.state = 109
                 self.match(EmployeeDSLParser.NUMBER)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 60
+                self.state = 110
                 self.match(EmployeeDSLParser.STRING_LITERAL)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 61
+                self.state = 111
                 self.match(EmployeeDSLParser.NUMBER)
-                self.state = 62
+                self.state = 112
                 self.match(EmployeeDSLParser.AND)
-                self.state = 63
+                self.state = 113
                 self.match(EmployeeDSLParser.NUMBER)
                 pass
 
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 114
+                self.match(EmployeeDSLParser.DATE_LITERAL)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 115
+                self.match(EmployeeDSLParser.DATE_LITERAL)
+                self.state = 116
+                self.match(EmployeeDSLParser.AND)
+                self.state = 117
+                self.match(EmployeeDSLParser.DATE_LITERAL)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 118
+                self.match(EmployeeDSLParser.PARAMETER)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 119
+                self.match(EmployeeDSLParser.PARAMETER)
+                self.state = 120
+                self.match(EmployeeDSLParser.AND)
+                self.state = 121
+                self.match(EmployeeDSLParser.PARAMETER)
+                pass
+
 
         except RecognitionException as re:
             localctx.exception = re
@@ -609,6 +1016,175 @@ class EmployeeDSLParser ( Parser ):
         return localctx
 
 
+    class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(EmployeeDSLParser.LPAREN, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(EmployeeDSLParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(EmployeeDSLParser.ExpressionContext,i)
+
+
+        def RPAREN(self):
+            return self.getToken(EmployeeDSLParser.RPAREN, 0)
+
+        def IDENTIFIER(self):
+            return self.getToken(EmployeeDSLParser.IDENTIFIER, 0)
+
+        def COLUMN(self):
+            return self.getToken(EmployeeDSLParser.COLUMN, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(EmployeeDSLParser.STRING_LITERAL, 0)
+
+        def NUMBER(self):
+            return self.getToken(EmployeeDSLParser.NUMBER, 0)
+
+        def MUL(self):
+            return self.getToken(EmployeeDSLParser.MUL, 0)
+
+        def DIV(self):
+            return self.getToken(EmployeeDSLParser.DIV, 0)
+
+        def PLUS(self):
+            return self.getToken(EmployeeDSLParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(EmployeeDSLParser.MINUS, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_expression
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExpression" ):
+                listener.enterExpression(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExpression" ):
+                listener.exitExpression(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpression" ):
+                return visitor.visitExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expression(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = EmployeeDSLParser.ExpressionContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 16
+        self.enterRecursionRule(localctx, 16, self.RULE_expression, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 137
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [46]:
+                self.state = 125
+                self.match(EmployeeDSLParser.LPAREN)
+                self.state = 126
+                self.expression(0)
+                self.state = 127
+                self.match(EmployeeDSLParser.RPAREN)
+                pass
+            elif token in [50]:
+                self.state = 129
+                self.match(EmployeeDSLParser.IDENTIFIER)
+                self.state = 130
+                self.match(EmployeeDSLParser.LPAREN)
+                self.state = 131
+                self.expression(0)
+                self.state = 132
+                self.match(EmployeeDSLParser.RPAREN)
+                pass
+            elif token in [3]:
+                self.state = 134
+                self.match(EmployeeDSLParser.COLUMN)
+                self.state = 135
+                self.match(EmployeeDSLParser.STRING_LITERAL)
+                pass
+            elif token in [49]:
+                self.state = 136
+                self.match(EmployeeDSLParser.NUMBER)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 147
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,11,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 145
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
+                    if la_ == 1:
+                        localctx = EmployeeDSLParser.ExpressionContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 139
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 140
+                        _la = self._input.LA(1)
+                        if not(_la==43 or _la==44):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 141
+                        self.expression(7)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = EmployeeDSLParser.ExpressionContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 142
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 143
+                        _la = self._input.LA(1)
+                        if not(_la==41 or _la==42):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 144
+                        self.expression(6)
+                        pass
+
+             
+                self.state = 149
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,11,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
     class AggregateStatementContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -655,18 +1231,18 @@ class EmployeeDSLParser ( Parser ):
     def aggregateStatement(self):
 
         localctx = EmployeeDSLParser.AggregateStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_aggregateStatement)
+        self.enterRule(localctx, 18, self.RULE_aggregateStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 66
+            self.state = 150
             self.match(EmployeeDSLParser.AGGREGATE)
-            self.state = 67
+            self.state = 151
             self.aggregateFunction()
-            self.state = 68
+            self.state = 152
             self.match(EmployeeDSLParser.COLUMN)
-            self.state = 69
+            self.state = 153
             self.match(EmployeeDSLParser.STRING_LITERAL)
-            self.state = 70
+            self.state = 154
             self.match(EmployeeDSLParser.SEMICOLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -687,12 +1263,36 @@ class EmployeeDSLParser ( Parser ):
         def COUNT(self):
             return self.getToken(EmployeeDSLParser.COUNT, 0)
 
+        def DISTINCT(self):
+            return self.getToken(EmployeeDSLParser.DISTINCT, 0)
+
+        def APPROX(self):
+            return self.getToken(EmployeeDSLParser.APPROX, 0)
+
         def SUM(self):
             return self.getToken(EmployeeDSLParser.SUM, 0)
 
         def AVERAGE(self):
             return self.getToken(EmployeeDSLParser.AVERAGE, 0)
 
+        def MIN(self):
+            return self.getToken(EmployeeDSLParser.MIN, 0)
+
+        def MAX(self):
+            return self.getToken(EmployeeDSLParser.MAX, 0)
+
+        def STDDEV(self):
+            return self.getToken(EmployeeDSLParser.STDDEV, 0)
+
+        def PERCENTILE(self):
+            return self.getToken(EmployeeDSLParser.PERCENTILE, 0)
+
+        def NUMBER(self):
+            return self.getToken(EmployeeDSLParser.NUMBER, 0)
+
+        def MEDIAN(self):
+            return self.getToken(EmployeeDSLParser.MEDIAN, 0)
+
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_aggregateFunction
 
@@ -716,17 +1316,95 @@ class EmployeeDSLParser ( Parser ):
     def aggregateFunction(self):
 
         localctx = EmployeeDSLParser.AggregateFunctionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_aggregateFunction)
+        self.enterRule(localctx, 20, self.RULE_aggregateFunction)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 72
-            _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3584) != 0)):
-                self._errHandler.recoverInline(self)
-            else:
-                self._errHandler.reportMatch(self)
-                self.consume()
+            self.state = 176
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 156
+                self.match(EmployeeDSLParser.COUNT)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 158
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==28:
+                    self.state = 157
+                    self.match(EmployeeDSLParser.APPROX)
+
+
+                self.state = 160
+                self.match(EmployeeDSLParser.COUNT)
+                self.state = 161
+                self.match(EmployeeDSLParser.DISTINCT)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 162
+                self.match(EmployeeDSLParser.SUM)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 163
+                self.match(EmployeeDSLParser.AVERAGE)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 164
+                self.match(EmployeeDSLParser.MIN)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 165
+                self.match(EmployeeDSLParser.MAX)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 166
+                self.match(EmployeeDSLParser.STDDEV)
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 168
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==28:
+                    self.state = 167
+                    self.match(EmployeeDSLParser.APPROX)
+
+
+                self.state = 170
+                self.match(EmployeeDSLParser.PERCENTILE)
+                self.state = 171
+                self.match(EmployeeDSLParser.NUMBER)
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 173
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==28:
+                    self.state = 172
+                    self.match(EmployeeDSLParser.APPROX)
+
+
+                self.state = 175
+                self.match(EmployeeDSLParser.MEDIAN)
+                pass
+
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -746,20 +1424,21 @@ class EmployeeDSLParser ( Parser ):
         def SORT(self):
             return self.getToken(EmployeeDSLParser.SORT, 0)
 
-        def COLUMN(self):
-            return self.getToken(EmployeeDSLParser.COLUMN, 0)
+        def sortKey(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(EmployeeDSLParser.SortKeyContext)
+            else:
+                return self.getTypedRuleContext(EmployeeDSLParser.SortKeyContext,i)
 
-        def STRING_LITERAL(self):
-            return self.getToken(EmployeeDSLParser.STRING_LITERAL, 0)
 
         def SEMICOLON(self):
             return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
 
-        def ASC(self):
-            return self.getToken(EmployeeDSLParser.ASC, 0)
-
-        def DESC(self):
-            return self.getToken(EmployeeDSLParser.DESC, 0)
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.COMMA)
+            else:
+                return self.getToken(EmployeeDSLParser.COMMA, i)
 
         def getRuleIndex(self):
             return EmployeeDSLParser.RULE_sortStatement
@@ -784,24 +1463,190 @@ class EmployeeDSLParser ( Parser ):
     def sortStatement(self):
 
         localctx = EmployeeDSLParser.SortStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_sortStatement)
+        self.enterRule(localctx, 22, self.RULE_sortStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 74
+            self.state = 178
             self.match(EmployeeDSLParser.SORT)
-            self.state = 75
+            self.state = 179
+            self.sortKey()
+            self.state = 184
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 180
+                self.match(EmployeeDSLParser.COMMA)
+                self.state = 181
+                self.sortKey()
+                self.state = 186
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 187
+            self.match(EmployeeDSLParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SortKeyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def COLUMN(self):
+            return self.getToken(EmployeeDSLParser.COLUMN, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(EmployeeDSLParser.STRING_LITERAL, 0)
+
+        def ASC(self):
+            return self.getToken(EmployeeDSLParser.ASC, 0)
+
+        def DESC(self):
+            return self.getToken(EmployeeDSLParser.DESC, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_sortKey
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSortKey" ):
+                listener.enterSortKey(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSortKey" ):
+                listener.exitSortKey(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSortKey" ):
+                return visitor.visitSortKey(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def sortKey(self):
+
+        localctx = EmployeeDSLParser.SortKeyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_sortKey)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 189
             self.match(EmployeeDSLParser.COLUMN)
-            self.state = 76
+            self.state = 190
             self.match(EmployeeDSLParser.STRING_LITERAL)
-            self.state = 77
+            self.state = 191
             _la = self._input.LA(1)
-            if not(_la==7 or _la==8):
+            if not(_la==12 or _la==13):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 78
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LimitStatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LIMIT(self):
+            return self.getToken(EmployeeDSLParser.LIMIT, 0)
+
+        def NUMBER(self, i:int=None):
+            if i is None:
+                return self.getTokens(EmployeeDSLParser.NUMBER)
+            else:
+                return self.getToken(EmployeeDSLParser.NUMBER, i)
+
+        def SEMICOLON(self):
+            return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
+
+        def OFFSET(self):
+            return self.getToken(EmployeeDSLParser.OFFSET, 0)
+
+        def AFTER(self):
+            return self.getToken(EmployeeDSLParser.AFTER, 0)
+
+        def STRING_LITERAL(self):
+            return self.getToken(EmployeeDSLParser.STRING_LITERAL, 0)
+
+        def PARAMETER(self):
+            return self.getToken(EmployeeDSLParser.PARAMETER, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_limitStatement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLimitStatement" ):
+                listener.enterLimitStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLimitStatement" ):
+                listener.exitLimitStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLimitStatement" ):
+                return visitor.visitLimitStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def limitStatement(self):
+
+        localctx = EmployeeDSLParser.LimitStatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_limitStatement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 193
+            self.match(EmployeeDSLParser.LIMIT)
+            self.state = 194
+            self.match(EmployeeDSLParser.NUMBER)
+            self.state = 199
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [15]:
+                self.state = 195
+                self.match(EmployeeDSLParser.OFFSET)
+                self.state = 196
+                self.match(EmployeeDSLParser.NUMBER)
+                pass
+            elif token in [16]:
+                self.state = 197
+                self.match(EmployeeDSLParser.AFTER)
+                self.state = 198
+                _la = self._input.LA(1)
+                if not(_la==51 or _la==52):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                pass
+            elif token in [53]:
+                pass
+            else:
+                pass
+            self.state = 201
             self.match(EmployeeDSLParser.SEMICOLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -848,12 +1693,76 @@ class EmployeeDSLParser ( Parser ):
     def printStatement(self):
 
         localctx = EmployeeDSLParser.PrintStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_printStatement)
+        self.enterRule(localctx, 28, self.RULE_printStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 80
+            self.state = 203
             self.match(EmployeeDSLParser.PRINT)
-            self.state = 81
+            self.state = 204
+            self.match(EmployeeDSLParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExplainStatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EXPLAIN(self):
+            return self.getToken(EmployeeDSLParser.EXPLAIN, 0)
+
+        def SEMICOLON(self):
+            return self.getToken(EmployeeDSLParser.SEMICOLON, 0)
+
+        def ANALYZE(self):
+            return self.getToken(EmployeeDSLParser.ANALYZE, 0)
+
+        def getRuleIndex(self):
+            return EmployeeDSLParser.RULE_explainStatement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExplainStatement" ):
+                listener.enterExplainStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExplainStatement" ):
+                listener.exitExplainStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExplainStatement" ):
+                return visitor.visitExplainStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def explainStatement(self):
+
+        localctx = EmployeeDSLParser.ExplainStatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_explainStatement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 206
+            self.match(EmployeeDSLParser.EXPLAIN)
+            self.state = 208
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==18:
+                self.state = 207
+                self.match(EmployeeDSLParser.ANALYZE)
+
+
+            self.state = 210
             self.match(EmployeeDSLParser.SEMICOLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -868,7 +1777,8 @@ class EmployeeDSLParser ( Parser ):
     def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
         if self._predicates == None:
             self._predicates = dict()
-        self._predicates[3] = self.filterStatement_sempred
+        self._predicates[5] = self.filterStatement_sempred
+        self._predicates[8] = self.expression_sempred
         pred = self._predicates.get(ruleIndex, None)
         if pred is None:
             raise Exception("No predicate with index:" + str(ruleIndex))
@@ -884,6 +1794,15 @@ class EmployeeDSLParser ( Parser ):
                 return self.precpred(self._ctx, 1)
          
 
+    def expression_sempred(self, localctx:ExpressionContext, predIndex:int):
+            if predIndex == 2:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 5)
+         
+
 
 
 
@@ -24,6 +24,16 @@ class EmployeeDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by EmployeeDSLParser#joinStatement.
+    def visitJoinStatement(self, ctx:EmployeeDSLParser.JoinStatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by EmployeeDSLParser#sampleStatement.
+    def visitSampleStatement(self, ctx:EmployeeDSLParser.SampleStatementContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by EmployeeDSLParser#filterStatement.
     def visitFilterStatement(self, ctx:EmployeeDSLParser.FilterStatementContext):
         return self.visitChildren(ctx)
@@ -39,6 +49,11 @@ class EmployeeDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by EmployeeDSLParser#expression.
+    def visitExpression(self, ctx:EmployeeDSLParser.ExpressionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by EmployeeDSLParser#aggregateStatement.
     def visitAggregateStatement(self, ctx:EmployeeDSLParser.AggregateStatementContext):
         return self.visitChildren(ctx)
@@ -54,10 +69,25 @@ class EmployeeDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by EmployeeDSLParser#sortKey.
+    def visitSortKey(self, ctx:EmployeeDSLParser.SortKeyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by EmployeeDSLParser#limitStatement.
+    def visitLimitStatement(self, ctx:EmployeeDSLParser.LimitStatementContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by EmployeeDSLParser#printStatement.
     def visitPrintStatement(self, ctx:EmployeeDSLParser.PrintStatementContext):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by EmployeeDSLParser#explainStatement.
+    def visitExplainStatement(self, ctx:EmployeeDSLParser.ExplainStatementContext):
+        return self.visitChildren(ctx)
+
+
 
 del EmployeeDSLParser
\ No newline at end of file
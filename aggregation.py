@@ -0,0 +1,281 @@
+import math
+import numpy as np
+import pandas as pd
+from sketches import HyperLogLog, KllSketch, exact_quantile
+from dates import format_date, is_date_column
+
+AGGREGATE_FUNCTIONS = ('count', 'count_distinct', 'sum', 'average', 'min', 'max', 'stddev', 'percentile', 'median')
+BLOCK_SIZE = 65536
+
+# Partial state each function needs from its column
+FUNCTION_NEEDS = {
+    'count': set(),
+    'count_distinct': {'distinct'},
+    'sum': {'sum'},
+    'average': {'sum'},
+    'min': {'range'},
+    'max': {'range'},
+    'stddev': {'sum', 'moments'},
+}
+
+def aggregation_fraction(agg):
+    """Quantile of a percentile or median aggregate as a fraction in 0..1"""
+    if agg.get('function') == 'median':
+        return 0.5
+    return agg.get('percentile') / 100.0
+
+def aggregation_needs(agg):
+    func = agg.get('function')
+    if func in ('percentile', 'median'):
+        # Exact quantiles keep the values for selection, approximate ones a bounded sketch
+        return {'sketch'} if agg.get('approximate') else {'values'}
+    if func == 'count_distinct' and agg.get('approximate'):
+        return {'hll'}
+    return FUNCTION_NEEDS[func]
+
+def aggregation_name(agg):
+    """Result key of an aggregate, e.g. sum_salario or approx_percentile_90_salario"""
+    func = agg.get('function')
+    column = agg.get('column')
+    if func in ('percentile', 'median', 'count_distinct'):
+        prefix = 'approx_' if agg.get('approximate') else ''
+        if func != 'percentile':
+            return f'{prefix}{func}_{column}'
+        return f"{prefix}percentile_{agg.get('percentile'):g}_{column}"
+    return f'{func}_{column}'
+
+def aggregation_signature(agg):
+    return (agg.get('function'), agg.get('column'), agg.get('percentile'), bool(agg.get('approximate')))
+
+def _is_numeric(series):
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+def _scalar(value):
+    return value.item() if hasattr(value, 'item') else value
+
+class ColumnState:
+    """Mergeable partial aggregate of one column: count, sum, M2, min, max, distinct values
+    and, for quantiles and approximate distinct counts, the raw values or a sketch.
+
+    M2 is the sum of squared deviations from the mean; merging uses Chan's
+    formula, which stays stable where a raw sum of squares would not.
+    """
+
+    def __init__(self, count=0, total=0, m2=0.0, minimum=None, maximum=None, distinct=None,
+                 values=None, sketch=None, hll=None):
+        self.count = count
+        self.total = total
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+        self.distinct = distinct
+        # List of numeric blocks, concatenated only when a quantile is requested
+        self.values = values
+        self.sketch = sketch
+        self.hll = hll
+
+    @classmethod
+    def empty(cls, needs):
+        return cls(distinct=set() if 'distinct' in needs else None,
+                   values=[] if 'values' in needs else None,
+                   sketch=KllSketch() if 'sketch' in needs else None,
+                   hll=HyperLogLog() if 'hll' in needs else None)
+
+    def copy(self):
+        state = ColumnState(**vars(self))
+        if self.values is not None:
+            state.values = list(self.values)
+        if self.sketch is not None:
+            state.sketch = self.sketch.copy()
+        if self.hll is not None:
+            state.hll = self.hll.copy()
+        return state
+
+    @classmethod
+    def from_series(cls, series, needs):
+        state = cls.empty(needs)
+        if not _is_numeric(series):
+            if needs & {'sum', 'moments', 'values', 'sketch'}:
+                raise ValueError(f"La columna '{series.name}' no es numérica")
+            values = series.dropna()
+            state.count = len(values)
+            if 'range' in needs and len(values):
+                if is_date_column(series):
+                    # Dates are reported as YYYY-MM-DD, which also orders correctly when merged
+                    state.minimum, state.maximum = format_date(values.min()), format_date(values.max())
+                else:
+                    state.minimum, state.maximum = _scalar(values.min()), _scalar(values.max())
+            if state.distinct is not None:
+                state.distinct = set(values.unique().tolist())
+            if state.hll is not None:
+                state.hll.update(values.to_numpy())
+            return state
+        values = series.to_numpy()
+        floating = values.dtype.kind == 'f'
+        # Walk the column once in cache-sized blocks, computing every needed partial per block
+        for start in range(0, len(values), BLOCK_SIZE):
+            block = values[start:start + BLOCK_SIZE]
+            if floating:
+                block = block[~np.isnan(block)]
+            state.merge(cls._from_block(block, needs))
+        return state
+
+    @classmethod
+    def _from_block(cls, block, needs):
+        state = cls.empty(needs)
+        state.count = len(block)
+        if state.values is not None:
+            state.values.append(block)
+        if state.sketch is not None:
+            state.sketch.update(block)
+        if state.hll is not None:
+            state.hll.update(block)
+        if not len(block):
+            return state
+        if 'sum' in needs:
+            state.total = _scalar(block.sum())
+        if 'moments' in needs:
+            mean = state.total / state.count
+            state.m2 = float(((block - mean) ** 2).sum())
+        if 'range' in needs:
+            state.minimum, state.maximum = _scalar(block.min()), _scalar(block.max())
+        if state.distinct is not None:
+            state.distinct = set(np.unique(block).tolist())
+        return state
+
+    def merge(self, other):
+        if other.distinct is not None:
+            self.distinct = other.distinct if self.distinct is None else self.distinct | other.distinct
+        if other.values is not None:
+            self.values = list(other.values) if self.values is None else self.values + other.values
+        if other.sketch is not None:
+            self.sketch = other.sketch.copy() if self.sketch is None else self.sketch.merge(other.sketch)
+        if other.hll is not None:
+            self.hll = other.hll.copy() if self.hll is None else self.hll.merge(other.hll)
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.total, self.m2 = other.count, other.total, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.total / other.count - self.total / self.count
+        self.m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total = self.total + other.total
+        if other.minimum is not None:
+            self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+            self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        return self
+
+    def result(self, func, fraction=None, approximate=False):
+        if func in ('percentile', 'median'):
+            if approximate:
+                return self.sketch.quantile(fraction)
+            values = np.concatenate(self.values) if self.values else np.empty(0)
+            return exact_quantile(values, fraction)
+        if func == 'count_distinct':
+            if approximate:
+                return self.hll.estimate()
+            return len(self.distinct or ())
+        if func == 'sum':
+            return self.total
+        if func == 'average':
+            return self.total / self.count if self.count else math.nan
+        if func == 'min':
+            return self.minimum if self.minimum is not None else math.nan
+        if func == 'max':
+            return self.maximum if self.maximum is not None else math.nan
+        if func == 'stddev':
+            # Sample standard deviation, like pandas' std()
+            return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+        return None
+
+    def to_dict(self):
+        data = dict(self.__dict__)
+        data['distinct'] = sorted(self.distinct, key=repr) if self.distinct is not None else None
+        if self.values is not None:
+            data['values'] = np.concatenate(self.values).tolist() if self.values else []
+        if self.sketch is not None:
+            data['sketch'] = self.sketch.to_dict()
+        if self.hll is not None:
+            data['hll'] = self.hll.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        if data.get('distinct') is not None:
+            data['distinct'] = set(data['distinct'])
+        if data.get('values') is not None:
+            data['values'] = [np.asarray(data['values'], dtype='float64')]
+        if data.get('sketch') is not None:
+            data['sketch'] = KllSketch.from_dict(data['sketch'])
+        if data.get('hll') is not None:
+            data['hll'] = HyperLogLog.from_dict(data['hll'])
+        return cls(**data)
+
+class AggregationEngine:
+    """Computes every requested aggregate with one pass per referenced column.
+
+    partial() returns a mergeable state, so chunked, incremental or
+    partitioned executors can combine per-chunk results with merge() and
+    call finalize() once at the end.
+    """
+
+    def __init__(self, aggregations):
+        self.aggregations = []
+        self.needs = {}
+        for agg in aggregations:
+            if agg.get('function') not in AGGREGATE_FUNCTIONS:
+                continue
+            self.aggregations.append(agg)
+            needs = aggregation_needs(agg)
+            if needs:
+                self.needs.setdefault(agg.get('column'), set()).update(needs)
+
+    def empty(self):
+        return {
+            'rows': 0,
+            'columns': {column: ColumnState.empty(needs) for column, needs in self.needs.items()}
+        }
+
+    def partial(self, frame):
+        return {
+            'rows': len(frame),
+            'columns': {column: ColumnState.from_series(frame[column], needs)
+                        for column, needs in self.needs.items()}
+        }
+
+    def merge(self, left, right):
+        columns = dict(left['columns'])
+        for column, state in right['columns'].items():
+            if column in columns:
+                columns[column] = columns[column].copy().merge(state)
+            else:
+                columns[column] = state
+        return {'rows': left['rows'] + right['rows'], 'columns': columns}
+
+    def finalize(self, state):
+        results = {}
+        for agg in self.aggregations:
+            func = agg.get('function')
+            if func == 'count':
+                results[aggregation_name(agg)] = state['rows']
+            else:
+                fraction = aggregation_fraction(agg) if func in ('percentile', 'median') else None
+                results[aggregation_name(agg)] = state['columns'][agg.get('column')].result(
+                    func, fraction, bool(agg.get('approximate')))
+        return results
+
+    def compute(self, frame):
+        return self.finalize(self.partial(frame))
+
+    def state_to_dict(self, state):
+        return {'rows': state['rows'],
+                'columns': {column: column_state.to_dict() for column, column_state in state['columns'].items()}}
+
+    def state_from_dict(self, data):
+        return {'rows': data['rows'],
+                'columns': {column: ColumnState.from_dict(column_state)
+                            for column, column_state in data['columns'].items()}}
@@ -0,0 +1,101 @@
+import os
+import asyncio
+import threading
+from column_stats import file_fingerprint
+from employee_dsl_interpreter import EmployeeDSLInterpreter, parse_script
+from result_cache import dataset_key
+
+class AsyncInterpreter:
+    """Runs DSL scripts from asyncio code without blocking the event loop.
+
+    Parsing, file loading and query execution run in executor (a
+    concurrent.futures executor with threads; None uses the loop's default
+    one). Loaded files are kept per (path, fingerprint) for later scripts.
+    Concurrent loads of the same file and concurrent runs of the same
+    script with the same parameters share one in-flight task. Cancelling a
+    run stops its query at the next operator; a shared task is only
+    cancelled when every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self, executor=None, result_cache=None, loader='pandas', materialize=True, limits=None):
+        self.executor = executor
+        self.result_cache = result_cache
+        self.loader = loader
+        self.materialize = materialize
+        # QueryLimits of every query; the wall time counts from when the query thread starts
+        self.limits = limits
+        # Same layout as the dataset cache of prepared scripts, filled by _read
+        self.datasets = {}
+        self._loads = {}
+        self._runs = {}
+
+    async def run(self, script, params=None):
+        """Result of the last print of script, like parse_and_interpret"""
+        return (await self._shared(self._runs, (script, _params_key(params)),
+                                   lambda: self._run(script, params)))[-1]
+
+    async def run_all(self, script, params=None):
+        """One result per print statement, like parse_and_interpret_all"""
+        return list(await self._shared(self._runs, (script, _params_key(params)),
+                                       lambda: self._run(script, params)))
+
+    async def load(self, filename):
+        """Read filename in the executor, once for all concurrent callers; returns the loaded frame"""
+        entry = self.datasets.get(os.path.abspath(filename))
+        if entry is not None and entry['fingerprint'] == file_fingerprint(filename):
+            return entry['data']
+        return await self._shared(self._loads, dataset_key(filename), lambda: self._in_executor(self._read, filename))
+
+    async def _run(self, script, params):
+        tree = await self._in_executor(parse_script, script)
+        if self.loader != 'mmap':
+            # The query thread finds every file already loaded
+            sources = [statement.loadStatement().STRING_LITERAL().getText()[1:-1]
+                       for statement in tree.statement() if statement.loadStatement()]
+            await asyncio.gather(*(self.load(source) for source in dict.fromkeys(sources)))
+        cancel_event = threading.Event()
+        try:
+            return await self._in_executor(self._execute, tree, params, cancel_event)
+        except asyncio.CancelledError:
+            # The thread keeps running until the interpreter sees the event
+            cancel_event.set()
+            raise
+
+    def _execute(self, tree, params, cancel_event):
+        interpreter = EmployeeDSLInterpreter(materialize=self.materialize, result_cache=self.result_cache,
+                                             params=params, dataset_cache=self.datasets, loader=self.loader,
+                                             cancel_event=cancel_event, limits=self.limits)
+        result = interpreter.visit(tree)
+        return tuple(interpreter.results or [result])
+
+    def _read(self, filename):
+        # Stores the frame, statistics and fingerprint in self.datasets
+        interpreter = EmployeeDSLInterpreter(dataset_cache=self.datasets, loader=self.loader)
+        return interpreter._read(filename)[0]
+
+    async def _in_executor(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def _shared(self, table, key, start):
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = {'task': asyncio.ensure_future(start()), 'waiters': 0}
+            entry['task'].add_done_callback(lambda task: table.pop(key, None) if table.get(key) is entry else None)
+        entry['waiters'] += 1
+        try:
+            # shield: one caller giving up must not cancel the task the others wait for
+            return await asyncio.shield(entry['task'])
+        finally:
+            entry['waiters'] -= 1
+            if entry['waiters'] == 0 and not entry['task'].done():
+                entry['task'].cancel()
+                # The done callback runs later; a new caller must start a fresh task, not join the cancelled one
+                if table.get(key) is entry:
+                    del table[key]
+
+def _params_key(params):
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return tuple(sorted((name, repr(value)) for name, value in params.items()))
+    return tuple(repr(value) for value in params)
@@ -0,0 +1,75 @@
+from aggregation import AggregationEngine
+from dates import read_csv
+from predicates import filter_predicate
+from query_result import QueryResult
+from sort_index import sort_frame
+
+class Backend:
+    """Where the operators of a query run.
+
+    A backend turns a file into a relation and each operator into a new
+    relation: for pandas a relation is a DataFrame, for SQLite a query that
+    has not run yet. aggregate() and materialize() produce the values of a
+    print. Backends that are not in_memory are driven only through these
+    methods, so the planner's in-memory extras (statistics, bitmaps,
+    reuse of the previous print) do not apply to them.
+    """
+
+    name = None
+    in_memory = False
+
+    def load(self, filename):
+        raise NotImplementedError
+
+    def filter(self, relation, filter_op, text_indexes=None, date_indexes=None):
+        raise NotImplementedError
+
+    def sort(self, relation, sorting, catalog=None):
+        raise NotImplementedError
+
+    def count(self, relation):
+        raise NotImplementedError
+
+    def aggregate(self, relation, aggregations):
+        """{aggregation name: value} over the rows of relation"""
+        raise NotImplementedError
+
+    def iter_frames(self, relation, chunk_size):
+        """Rows of relation as DataFrames of at most chunk_size rows, in order"""
+        raise NotImplementedError
+
+    def materialize(self, relation, aggregations, materialize=True, sorting=None, complete=None):
+        """QueryResult of a print over relation"""
+        raise NotImplementedError
+
+    def explain(self, relation):
+        """How the backend reads relation, for explain"""
+        return None
+
+class PandasBackend(Backend):
+    """The in-memory engine: relations are DataFrames"""
+
+    name = 'pandas'
+    in_memory = True
+
+    def load(self, filename):
+        return read_csv(filename)
+
+    def filter(self, relation, filter_op, text_indexes=None, date_indexes=None):
+        return relation[filter_predicate(filter_op).mask(relation, text_indexes, date_indexes)]
+
+    def sort(self, relation, sorting, catalog=None):
+        return sort_frame(relation, sorting, catalog)
+
+    def count(self, relation):
+        return len(relation)
+
+    def aggregate(self, relation, aggregations):
+        return AggregationEngine(aggregations).compute(relation)
+
+    def iter_frames(self, relation, chunk_size):
+        for start in range(0, len(relation), chunk_size):
+            yield relation.iloc[start:start + chunk_size]
+
+    def materialize(self, relation, aggregations, materialize=True, sorting=None, complete=None):
+        return QueryResult(relation, aggregations, materialize, sorting, complete)
@@ -0,0 +1,100 @@
+import io
+import sys
+import json
+import math
+import time
+import statistics
+import contextlib
+import subprocess
+
+# Module and entry point of each engine
+ENGINES = {
+    'pandas': 'employee_dsl_interpreter',
+    'numpy': 'numpy_engine',
+}
+STARTUP_RUNS = 5
+QUERY_RUNS = 20
+
+# Child process: import the engine, run one script and report the times and the peak memory
+STARTUP_PROGRAM = """
+import sys, time, io, contextlib, resource
+started = time.perf_counter()
+engine = __import__(sys.argv[1])
+imported = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    engine.parse_and_interpret(sys.argv[2])
+finished = time.perf_counter()
+print(imported - started, finished - started, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def startup(module, script, runs=STARTUP_RUNS):
+    """Median seconds to import the engine and to give a first result, and peak memory in KB, in fresh processes"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', STARTUP_PROGRAM, module, script],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append([float(value) for value in output.split()])
+    return [statistics.median(values) for values in zip(*samples)]
+
+def query_latency(function, script, runs=QUERY_RUNS):
+    """Median seconds of one parse_and_interpret of script, file load included"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = function(script)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+def same_result(left, right):
+    """Equal values, with NaN equal to NaN and int distinct from float"""
+    if isinstance(left, float) and isinstance(right, float):
+        return left == right or (math.isnan(left) and math.isnan(right))
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(same_result(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(same_result(a, b) for a, b in zip(left, right))
+    return type(left) is type(right) and left == right
+
+def _plain(result):
+    return {'record_count': result['record_count'], 'aggregations': dict(result['aggregations']),
+            'filtered_data': result['filtered_data']}
+
+def main(example_file='example_scripts.json', runs=QUERY_RUNS):
+    with open(example_file, 'r', encoding='utf-8') as f:
+        scripts = json.load(f)
+
+    print("Arranque (mediana de procesos nuevos):")
+    first = scripts[0]['contenido']
+    for name, module in ENGINES.items():
+        imported, answered, memory = startup(module, first)
+        print(f"  {name:6}  importación {imported * 1000:7.1f} ms  primer resultado {answered * 1000:7.1f} ms  "
+              f"memoria máxima {memory / 1024:6.1f} MB")
+
+    import numpy_engine
+    from employee_dsl_interpreter import parse_and_interpret
+    functions = {'pandas': parse_and_interpret, 'numpy': numpy_engine.parse_and_interpret}
+
+    print(f"\nLatencia por consulta (mediana de {runs} ejecuciones, carga del CSV incluida):")
+    totals = dict.fromkeys(functions, 0.0)
+    mismatches = []
+    for script in scripts:
+        timings, results = {}, {}
+        for name, function in functions.items():
+            timings[name], result = query_latency(function, script['contenido'], runs)
+            results[name] = _plain(result)
+            totals[name] += timings[name]
+        if not same_result(results['pandas'], results['numpy']):
+            mismatches.append(script['numero'])
+        print(f"  {script['numero']:>3}. {script['titulo'][:45]:45}  pandas {timings['pandas'] * 1000:7.2f} ms  "
+              f"numpy {timings['numpy'] * 1000:7.2f} ms")
+    print(f"\nTotal: pandas {totals['pandas'] * 1000:.1f} ms, numpy {totals['numpy'] * 1000:.1f} ms "
+          f"({totals['pandas'] / totals['numpy']:.1f}x)")
+    if mismatches:
+        print(f"Resultados distintos en los scripts: {', '.join(str(number) for number in mismatches)}")
+        return 1
+    print(f"Los {len(scripts)} scripts dan el mismo resultado en ambos motores")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(runs=int(sys.argv[1]) if len(sys.argv) > 1 else QUERY_RUNS))
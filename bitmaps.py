@@ -0,0 +1,243 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from column_stats import filter_key
+from predicates import filter_predicate
+
+# Rows per container; a container holds the positions that share their high 16 bits
+CONTAINER_ROWS = 1 << 16
+CONTAINER_WORDS = CONTAINER_ROWS // 64
+# Up to this many positions a sorted uint16 array is smaller than the 8 KB bitmap
+ARRAY_LIMIT = 4096
+MAX_BITMAPS = 256
+MAX_CATALOGS = 8
+ONE = np.uint64(1)
+# Set bits of every byte value, for NumPy versions without bitwise_count
+BYTE_BITS = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class RoaringBitmap:
+    """Compressed set of row positions in [0, size), roaring style.
+
+    Positions are split into containers of 65536 rows. A sparse container
+    is a sorted array of 16-bit offsets, a dense one a 1024-word bitmap;
+    empty containers are not stored. AND, OR and NOT work container by
+    container and count() is a popcount, so combining cached filter
+    results never touches the rows themselves.
+    """
+
+    def __init__(self, size, containers=None):
+        self.size = size
+        # container number -> uint16 offsets (sparse) or uint64 words (dense)
+        self.containers = containers if containers is not None else {}
+
+    @classmethod
+    def from_mask(cls, mask):
+        mask = np.asarray(mask, dtype=bool)
+        size = len(mask)
+        padded = np.zeros(-(-size // CONTAINER_ROWS) * CONTAINER_ROWS, dtype=bool)
+        padded[:size] = mask
+        words = np.packbits(padded, bitorder='little').view(np.uint64).reshape(-1, CONTAINER_WORDS)
+        counts = _popcount(words).sum(axis=1)
+        containers = {}
+        for key in np.flatnonzero(counts):
+            key = int(key)
+            if counts[key] <= ARRAY_LIMIT:
+                start = key * CONTAINER_ROWS
+                containers[key] = np.flatnonzero(padded[start:start + CONTAINER_ROWS]).astype(np.uint16)
+            else:
+                containers[key] = words[key].copy()
+        return cls(size, containers)
+
+    @classmethod
+    def from_positions(cls, positions, size):
+        positions = np.unique(np.asarray(positions, dtype=np.int64))
+        keys = positions >> 16
+        splits = np.flatnonzero(np.diff(keys)) + 1
+        containers = {}
+        for part in np.split(positions, splits) if len(positions) else []:
+            offsets = (part & 0xFFFF).astype(np.uint16)
+            containers[int(part[0] >> 16)] = offsets if len(offsets) <= ARRAY_LIMIT else _to_words(offsets)
+        return cls(size, containers)
+
+    def count(self):
+        return sum(len(container) if _sparse(container) else int(_popcount(container).sum())
+                   for container in self.containers.values())
+
+    def __len__(self):
+        return self.count()
+
+    def positions(self):
+        """Sorted int64 row positions of the set"""
+        parts = []
+        for key in sorted(self.containers):
+            container = self.containers[key]
+            if _sparse(container):
+                offsets = container.astype(np.int64)
+            else:
+                offsets = np.flatnonzero(np.unpackbits(container.view(np.uint8), bitorder='little'))
+            parts.append(offsets + key * CONTAINER_ROWS)
+        return np.concatenate(parts) if parts else np.array([], dtype=np.int64)
+
+    def to_mask(self):
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.positions()] = True
+        return mask
+
+    @property
+    def nbytes(self):
+        return sum(container.nbytes for container in self.containers.values())
+
+    def __and__(self, other):
+        self._check(other)
+        containers = {}
+        for key in self.containers.keys() & other.containers.keys():
+            container = _and(self.containers[key], other.containers[key])
+            if len(container):
+                containers[key] = container
+        return RoaringBitmap(self.size, containers)
+
+    def __or__(self, other):
+        self._check(other)
+        containers = dict(self.containers)
+        for key, container in other.containers.items():
+            containers[key] = _or(containers[key], container) if key in containers else container
+        return RoaringBitmap(self.size, containers)
+
+    def __invert__(self):
+        containers = {}
+        for key in range(-(-self.size // CONTAINER_ROWS)):
+            words = _full_words(min(CONTAINER_ROWS, self.size - key * CONTAINER_ROWS))
+            if key in self.containers:
+                words &= ~_words(self.containers[key])
+            container = _normalize(words)
+            if container is not None:
+                containers[key] = container
+        return RoaringBitmap(self.size, containers)
+
+    def __sub__(self, other):
+        return self & ~other
+
+    def __eq__(self, other):
+        return isinstance(other, RoaringBitmap) and self.size == other.size \
+            and np.array_equal(self.positions(), other.positions())
+
+    def __repr__(self):
+        return f"RoaringBitmap({self.count()} de {self.size})"
+
+    def _check(self, other):
+        if self.size != other.size:
+            raise ValueError(f"Los bitmaps describen conjuntos de distinto tamaño: {self.size} y {other.size}")
+
+def _sparse(container):
+    return container.dtype == np.uint16
+
+def _popcount(words):
+    # np.bitwise_count is new in NumPy 2.0; before that count byte by byte with a table
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    return BYTE_BITS[np.ascontiguousarray(words).view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+def _to_words(offsets):
+    words = np.zeros(CONTAINER_WORDS, dtype=np.uint64)
+    np.bitwise_or.at(words, offsets >> 6, ONE << (offsets & 63).astype(np.uint64))
+    return words
+
+def _words(container):
+    return _to_words(container) if _sparse(container) else container
+
+def _full_words(rows):
+    words = np.zeros(CONTAINER_WORDS, dtype=np.uint64)
+    words[:rows // 64] = ~np.uint64(0)
+    if rows % 64:
+        words[rows // 64] = (ONE << np.uint64(rows % 64)) - ONE
+    return words
+
+def _normalize(words):
+    # Dense words back to the smaller representation, None when empty
+    count = int(_popcount(words).sum())
+    if count == 0:
+        return None
+    if count <= ARRAY_LIMIT:
+        return np.flatnonzero(np.unpackbits(words.view(np.uint8), bitorder='little')).astype(np.uint16)
+    return words
+
+def _contains(words, offsets):
+    return ((words[offsets >> 6] >> (offsets & 63).astype(np.uint64)) & ONE).astype(bool)
+
+def _and(left, right):
+    if _sparse(left) and _sparse(right):
+        return np.intersect1d(left, right, assume_unique=True)
+    if _sparse(left):
+        return left[_contains(right, left)]
+    if _sparse(right):
+        return right[_contains(left, right)]
+    words = _normalize(left & right)
+    return np.array([], dtype=np.uint16) if words is None else words
+
+def _or(left, right):
+    if _sparse(left) and _sparse(right):
+        union = np.union1d(left, right)
+        return union if len(union) <= ARRAY_LIMIT else _to_words(union)
+    return _words(left) | _words(right)
+
+class BitmapCatalog:
+    """Bitmap of every filter evaluated over one dataset, computed once and reused.
+
+    Keyed by the filter's column, operator and value, so the same filter in
+    another query (or another interpreter reading the same unchanged file)
+    is an AND of cached bitmaps instead of a scan. Filters that depend on
+    today's date are evaluated every time.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._bitmaps = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cached(self, filter_op):
+        return _key(filter_op) in self._bitmaps
+
+    def bitmap(self, frame, filter_op, text_indexes=None, date_indexes=None):
+        """Rows of frame (the whole dataset) that satisfy filter_op"""
+        key = _key(filter_op)
+        with self._lock:
+            if key in self._bitmaps:
+                self._bitmaps.move_to_end(key)
+                return self._bitmaps[key]
+        bitmap = RoaringBitmap.from_mask(filter_predicate(filter_op).mask(frame, text_indexes, date_indexes))
+        expression = filter_op.get('expression')
+        if expression is None or not expression.time_dependent():
+            with self._lock:
+                self._bitmaps[key] = bitmap
+                while len(self._bitmaps) > MAX_BITMAPS:
+                    self._bitmaps.popitem(last=False)
+        return bitmap
+
+    def select(self, frame, filters, text_indexes=None, date_indexes=None):
+        """AND of the bitmaps of filters; None when there are no filters"""
+        selected = None
+        for filter_op in filters:
+            bitmap = self.bitmap(frame, filter_op, text_indexes, date_indexes)
+            selected = bitmap if selected is None else selected & bitmap
+        return selected
+
+def _key(filter_op):
+    return filter_key(filter_op) + (filter_op.get('expression') is not None,)
+
+_catalogs = OrderedDict()
+_catalogs_lock = threading.Lock()
+
+def bitmap_catalog_for(frame, key=None):
+    """Bitmap catalog of a dataset; with a (path, fingerprint) key it is shared across interpreters"""
+    if key is None:
+        return BitmapCatalog(len(frame))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        # Every load of an unchanged file has the same rows, whatever columns were parsed
+        if catalog is not None and catalog.size == len(frame):
+            _catalogs.move_to_end(key)
+            return catalog
+        catalog = _catalogs[key] = BitmapCatalog(len(frame))
+        while len(_catalogs) > MAX_CATALOGS:
+            _catalogs.popitem(last=False)
+        return catalog
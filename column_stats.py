@@ -0,0 +1,352 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from dates import coerce_date, format_date, format_dates, is_date_column
+
+STATS_VERSION = 2
+HISTOGRAM_BINS = 20
+TOP_K = 10
+UNKNOWN_SELECTIVITY = 0.5
+
+def file_fingerprint(filename):
+    """Size and modification time of a file, used to detect stale metadata"""
+    stat = os.stat(filename)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def stats_filename(filename):
+    return f"{filename}.stats.json"
+
+def filter_key(filter_op):
+    return (filter_op['column'], filter_op['operator'], repr(filter_op['value']))
+
+class ColumnStats:
+    """Summary of a single column: range, nulls, distinct values and distribution"""
+
+    def __init__(self, name, numeric, row_count, null_count, distinct_count,
+                 minimum=None, maximum=None, total=None, histogram=None, top_values=None, temporal=False):
+        self.name = name
+        self.numeric = numeric
+        # Date columns are summarized as YYYY-MM-DD text, which sorts like the dates
+        self.temporal = temporal
+        self.row_count = row_count
+        self.null_count = null_count
+        self.distinct_count = distinct_count
+        self.minimum = minimum
+        self.maximum = maximum
+        self.total = total
+        # Numeric columns: {'edges': [...], 'counts': [...]}
+        self.histogram = histogram
+        # Text columns: [[value, count], ...] for the most frequent values
+        self.top_values = top_values or []
+
+    @classmethod
+    def from_series(cls, series):
+        if is_date_column(series):
+            stats = cls.from_series(format_dates(series.to_frame())[series.name])
+            stats.temporal = True
+            return stats
+        values = series.dropna()
+        null_count = int(len(series) - len(values))
+        distinct_count = int(values.nunique())
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            array = values.to_numpy(dtype='float64')
+            histogram = None
+            if len(array):
+                counts, edges = np.histogram(array, bins=HISTOGRAM_BINS)
+                histogram = {'edges': edges.tolist(), 'counts': counts.tolist()}
+            return cls(series.name, True, len(series), null_count, distinct_count,
+                       float(array.min()) if len(array) else None,
+                       float(array.max()) if len(array) else None,
+                       float(array.sum()), histogram)
+        minimum = maximum = None
+        if len(values) and all(isinstance(v, str) for v in values.head(1000)):
+            try:
+                minimum, maximum = str(values.min()), str(values.max())
+            except TypeError:
+                pass
+        top_values = [[str(value), int(count)] for value, count in values.value_counts().head(TOP_K).items()]
+        return cls(series.name, False, len(series), null_count, distinct_count,
+                   minimum, maximum, top_values=top_values)
+
+    def merge_series(self, series):
+        """Fold appended rows into the statistics. Returns False if the column changed type"""
+        if is_date_column(series) != self.temporal:
+            return False
+        if self.temporal:
+            series = format_dates(series.to_frame())[series.name]
+        numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        values = series.dropna()
+        if len(values) and numeric != self.numeric:
+            return False
+        self.row_count += len(series)
+        self.null_count += int(len(series) - len(values))
+        if not len(values):
+            return True
+        # Upper bound: keeps the exhaustive top-k check on the safe side
+        self.distinct_count = min(self.distinct_count + int(values.nunique()), self.row_count - self.null_count)
+        if self.numeric:
+            array = values.to_numpy(dtype='float64')
+            self.total = (self.total or 0.0) + float(array.sum())
+            self.minimum = float(array.min()) if self.minimum is None else min(self.minimum, float(array.min()))
+            self.maximum = float(array.max()) if self.maximum is None else max(self.maximum, float(array.max()))
+            if self.histogram is None:
+                counts, edges = np.histogram(array, bins=HISTOGRAM_BINS)
+                self.histogram = {'edges': edges.tolist(), 'counts': counts.tolist()}
+            else:
+                edges = self.histogram['edges']
+                edges[0] = min(edges[0], self.minimum)
+                edges[-1] = max(edges[-1], self.maximum)
+                counts, _ = np.histogram(array, bins=edges)
+                self.histogram['counts'] = [a + int(b) for a, b in zip(self.histogram['counts'], counts)]
+            return True
+        if self.minimum is not None and all(isinstance(v, str) for v in values.head(1000)):
+            try:
+                self.minimum = min(self.minimum, str(values.min()))
+                self.maximum = max(self.maximum, str(values.max()))
+            except TypeError:
+                self.minimum = self.maximum = None
+        else:
+            self.minimum = self.maximum = None
+        merged = {value: count for value, count in self.top_values}
+        for value, count in values.value_counts().items():
+            merged[str(value)] = merged.get(str(value), 0) + int(count)
+        self.top_values = [[value, count] for value, count in
+                           sorted(merged.items(), key=lambda item: -item[1])[:TOP_K]]
+        return True
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def classify(self, operator, value):
+        """Return 'always', 'never' or None when the statistics cannot decide"""
+        if self.row_count == 0:
+            return 'never'
+        value = self._normalize(value)
+        if not self._comparable(value):
+            return None
+        low, high = self.minimum, self.maximum
+        if low is None:
+            if self.null_count == self.row_count:
+                return 'never' if operator != '!=' else 'always'
+            # Mixed text column without a usable range, only the top-k list can help
+            if operator in ('==', '!=') and not self._may_contain(value):
+                return 'never' if operator == '==' else 'always'
+            return None
+        complete = self.null_count == 0
+        if operator == 'starts_with':
+            # Every string with this prefix sorts between the prefix and the prefix followed by the last code point
+            if high < value or (low > value and not low.startswith(value)):
+                return 'never'
+            return None
+        if operator in ('contains', 'like'):
+            return None
+        if operator == 'between':
+            lower, upper = value
+            if lower > upper or upper < low or lower > high:
+                return 'never'
+            if complete and lower <= low and upper >= high:
+                return 'always'
+            return None
+        if operator == '>':
+            if value >= high:
+                return 'never'
+            if complete and value < low:
+                return 'always'
+        elif operator == '>=':
+            if value > high:
+                return 'never'
+            if complete and value <= low:
+                return 'always'
+        elif operator == '<':
+            if value <= low:
+                return 'never'
+            if complete and value > high:
+                return 'always'
+        elif operator == '<=':
+            if value < low:
+                return 'never'
+            if complete and value >= high:
+                return 'always'
+        elif operator == '==':
+            if value < low or value > high or not self._may_contain(value):
+                return 'never'
+            if complete and low == high:
+                return 'always'
+        elif operator == '!=':
+            # NaN != value is True, so nulls do not matter here
+            if value < low or value > high or not self._may_contain(value):
+                return 'always'
+            if low == high and self.null_count == 0:
+                return 'never'
+        return None
+
+    def selectivity(self, operator, value):
+        """Estimated fraction of rows that satisfy the comparison"""
+        value = self._normalize(value)
+        if not self._comparable(value) or self.row_count == 0:
+            return UNKNOWN_SELECTIVITY
+        if operator == '==':
+            return self._equal_fraction(value)
+        if operator == '!=':
+            return 1.0 - self._equal_fraction(value)
+        if not self.numeric or not self.histogram:
+            return UNKNOWN_SELECTIVITY
+        if operator == 'between':
+            return max(0.0, self._fraction_below(value[1]) - self._fraction_below(value[0]))
+        below = self._fraction_below(value)
+        if operator in ('<', '<='):
+            return below
+        return max(0.0, (self.row_count - self.null_count) / self.row_count - below)
+
+    def _normalize(self, value):
+        # Date filter values (literals or YYYY-MM-DD text) compared as the stored text form
+        if not self.temporal:
+            return value
+        if isinstance(value, list):
+            return [self._normalize(item) for item in value]
+        try:
+            return format_date(coerce_date(value))
+        except ValueError:
+            return None
+
+    def _comparable(self, value):
+        if self.numeric:
+            values = value if isinstance(value, list) else [value]
+            return all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+        if self.temporal and isinstance(value, list):
+            return all(isinstance(v, str) for v in value)
+        return isinstance(value, str)
+
+    def _may_contain(self, value):
+        # The top-k list is exhaustive when the column has few distinct values
+        if self.numeric or self.distinct_count > len(self.top_values):
+            return True
+        return any(candidate == value for candidate, _ in self.top_values)
+
+    def _equal_fraction(self, value):
+        for candidate, count in self.top_values:
+            if candidate == value:
+                return count / self.row_count
+        if self.distinct_count == 0:
+            return 0.0
+        listed = sum(count for _, count in self.top_values)
+        remaining = max(self.distinct_count - len(self.top_values), 1)
+        return (self.row_count - self.null_count - listed) / remaining / self.row_count
+
+    def _fraction_below(self, value):
+        edges = self.histogram['edges']
+        counts = self.histogram['counts']
+        if value <= edges[0]:
+            return 0.0
+        rows = 0.0
+        for i, count in enumerate(counts):
+            left, right = edges[i], edges[i + 1]
+            if value >= right:
+                rows += count
+            else:
+                rows += count * (value - left) / (right - left)
+                break
+        return rows / self.row_count
+
+class StatisticsCatalog:
+    """Per-column statistics for a loaded dataset"""
+
+    def __init__(self, row_count, columns, fingerprint=None):
+        self.row_count = row_count
+        self.columns = columns
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_frame(cls, frame, fingerprint=None):
+        columns = {name: ColumnStats.from_series(frame[name]) for name in frame.columns}
+        return cls(len(frame), columns, fingerprint)
+
+    def to_dict(self):
+        return {
+            'version': STATS_VERSION,
+            'fingerprint': self.fingerprint,
+            'row_count': self.row_count,
+            'columns': {name: column.to_dict() for name, column in self.columns.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        columns = {name: ColumnStats.from_dict(column) for name, column in data['columns'].items()}
+        return cls(data['row_count'], columns, data.get('fingerprint'))
+
+    def merge_frame(self, frame, fingerprint=None):
+        """Update the catalog with appended rows. Returns False when it must be rebuilt"""
+        if list(frame.columns) != list(self.columns):
+            return False
+        for name in frame.columns:
+            if not self.columns[name].merge_series(frame[name]):
+                return False
+        self.row_count += len(frame)
+        self.fingerprint = fingerprint
+        return True
+
+    def column(self, name):
+        return self.columns.get(name)
+
+    def plan_filters(self, filters, seen=()):
+        """Drop duplicate and always-true filters and order the rest by selectivity.
+
+        seen holds the keys of filters that were already applied. Returns
+        (filters, never_matches). never_matches is True when the statistics
+        prove that no row can satisfy every filter.
+        """
+        planned = []
+        seen = set(seen)
+        for filter_op in filters:
+            key = filter_key(filter_op)
+            if key in seen:
+                continue
+            seen.add(key)
+            stats = None if filter_op.get('expression') is not None else self.column(filter_op['column'])
+            if stats is None:
+                planned.append((UNKNOWN_SELECTIVITY, len(planned), filter_op))
+                continue
+            verdict = stats.classify(filter_op['operator'], filter_op['value'])
+            if verdict == 'never':
+                return [filter_op], True
+            if verdict == 'always':
+                continue
+            planned.append((stats.selectivity(filter_op['operator'], filter_op['value']), len(planned), filter_op))
+        planned.sort(key=lambda item: (item[0], item[1]))
+        return [filter_op for _, _, filter_op in planned], False
+
+def load_statistics(filename, frame, persist=True):
+    """Return the catalog for a CSV file, reusing the persisted copy when it is still fresh.
+
+    With persist=False a new catalog is only kept in memory, for frames
+    that hold just some of the file's columns.
+    """
+    try:
+        fingerprint = file_fingerprint(filename)
+    except OSError:
+        return StatisticsCatalog.from_frame(frame)
+    try:
+        with open(stats_filename(filename), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == STATS_VERSION and data.get('fingerprint') == fingerprint \
+                and data.get('row_count') == len(frame):
+            return StatisticsCatalog.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    catalog = StatisticsCatalog.from_frame(frame, fingerprint)
+    if persist:
+        save_statistics(filename, catalog)
+    return catalog
+
+def save_statistics(filename, catalog):
+    try:
+        with open(stats_filename(filename), 'w', encoding='utf-8') as f:
+            json.dump(catalog.to_dict(), f, ensure_ascii=False)
+    except OSError:
+        # Read-only location: keep the statistics in memory only
+        pass
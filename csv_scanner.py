@@ -0,0 +1,175 @@
+import os
+import mmap
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from column_stats import file_fingerprint
+from dates import parse_date_columns
+
+# Bytes examined per step while indexing, bounds the temporary masks
+SCAN_CHUNK = 1 << 24
+# Rows gathered per step when copying fields out of the mapped file
+BLOCK_ROWS = 65536
+MAX_SCANNERS = 4
+# Same texts pandas reads as missing values by default
+NA_VALUES = ('', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null')
+NA_BYTES = np.array([value.encode('ascii') for value in NA_VALUES])
+TRUE_BYTES = np.array([b'True', b'TRUE', b'true'])
+FALSE_BYTES = np.array([b'False', b'FALSE', b'false'])
+
+class CsvScanError(ValueError):
+    """The file uses CSV features the scanner does not handle (quotes, ragged rows)"""
+
+class CsvScanner:
+    """Memory-mapped CSV file with the offset of every field, found in one pass.
+
+    Columns are parsed only when asked for: numbers go straight from the
+    mapped bytes into NumPy arrays and text is decoded by row offset, so
+    columns nobody filters on are only decoded for the rows that are
+    output. Types follow pandas.read_csv (int64, float64, bool, str and
+    YYYY-MM-DD dates). Quoted fields are not supported.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.fingerprint = file_fingerprint(filename)
+        with open(filename, 'rb') as csv_file:
+            try:
+                self._map = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise CsvScanError(f"Archivo vacío: {filename}")
+        self.buffer = np.frombuffer(self._map, dtype=np.uint8)
+        newlines, commas = self._scan()
+        starts, ends = _lines(self.buffer, newlines)
+        header = self.buffer[starts[0]:ends[0]].tobytes().decode('utf-8')
+        self.columns = header.split(',')
+        starts, ends = starts[1:], ends[1:]
+        self.row_count = len(starts)
+        # Field j of row r spans bounds[r, j] up to bounds[r, j + 1] - 1 (the separator)
+        dtype = np.uint32 if len(self.buffer) < np.iinfo(np.uint32).max else np.int64
+        self.bounds = np.empty((self.row_count, len(self.columns) + 1), dtype=dtype)
+        self.bounds[:, 0] = starts
+        self.bounds[:, -1] = ends + 1
+        if self.row_count and len(self.columns) > 1:
+            rows = np.searchsorted(starts, commas, side='right') - 1
+            commas = commas[rows >= 0]
+            counts = np.bincount(rows[rows >= 0], minlength=self.row_count)
+            ragged = np.flatnonzero(counts != len(self.columns) - 1)
+            if len(ragged):
+                raise CsvScanError(f"La fila {ragged[0] + 2} tiene {counts[ragged[0]] + 1} campos, "
+                                   f"se esperaban {len(self.columns)}")
+            self.bounds[:, 1:-1] = (commas + 1).reshape(self.row_count, len(self.columns) - 1)
+        self._parsed = {}
+        self._lock = threading.Lock()
+
+    def _scan(self):
+        newlines, commas = [], []
+        for offset in range(0, len(self.buffer), SCAN_CHUNK):
+            chunk = self.buffer[offset:offset + SCAN_CHUNK]
+            if (chunk == ord('"')).any():
+                raise CsvScanError(f"El archivo tiene campos entre comillas: {self.filename}")
+            newlines.append(np.flatnonzero(chunk == ord('\n')) + offset)
+            commas.append(np.flatnonzero(chunk == ord(',')) + offset)
+        return np.concatenate(newlines), np.concatenate(commas)
+
+    def column(self, name):
+        """Whole column as a Series, parsed on first use and kept"""
+        with self._lock:
+            if name not in self._parsed:
+                self._parsed[name] = self._series(name, None)
+            return self._parsed[name]
+
+    def frame(self, columns=None):
+        """DataFrame with the given columns (all when None), in file order"""
+        names = [name for name in self.columns if columns is None or name in columns]
+        return pd.DataFrame({name: self.column(name) for name in names}, index=pd.RangeIndex(self.row_count))
+
+    def complete(self, frame):
+        """Rows of frame with every column of the file, decoding only those rows of the missing ones"""
+        missing = [name for name in self.columns if name not in frame.columns]
+        if not missing:
+            return frame
+        rows = np.asarray(frame.index, dtype=np.intp)
+        parts = {}
+        for name in self.columns:
+            if name in frame.columns:
+                parts[name] = frame[name]
+            elif name in self._parsed:
+                parts[name] = self._parsed[name].iloc[rows].set_axis(frame.index)
+            else:
+                parts[name] = self._series(name, rows).set_axis(frame.index)
+        return pd.DataFrame(parts, index=frame.index)
+
+    def _series(self, name, rows):
+        if name not in self.columns:
+            raise KeyError(name)
+        raw = self._fields(self.columns.index(name), rows)
+        series = pd.Series(_convert(raw), name=name)
+        return parse_date_columns(series.to_frame())[name]
+
+    def _fields(self, position, rows):
+        # Fixed-width bytes array of one column, padded with NULs that numpy drops
+        bounds = self.bounds if rows is None else self.bounds[rows]
+        starts = bounds[:, position].astype(np.int64)
+        lengths = bounds[:, position + 1].astype(np.int64) - 1 - starts
+        width = max(int(lengths.max()) if len(lengths) else 0, 1)
+        out = np.zeros((len(starts), width), dtype=np.uint8)
+        offsets = np.arange(width)
+        for block in range(0, len(starts), BLOCK_ROWS):
+            block_starts = starts[block:block + BLOCK_ROWS, None]
+            valid = offsets < lengths[block:block + BLOCK_ROWS, None]
+            out[block:block + BLOCK_ROWS] = np.where(valid, self.buffer[np.where(valid, block_starts + offsets, 0)], 0)
+        return out.view(f'S{width}').ravel()
+
+def _lines(buffer, newlines):
+    ends = newlines
+    if len(buffer) and buffer[-1] != ord('\n'):
+        ends = np.append(ends, len(buffer))
+    starts = np.concatenate(([0], newlines + 1))[:len(ends)]
+    # Windows line endings and blank lines, which pandas skips
+    carriage = (ends > starts) & (buffer[np.maximum(ends - 1, 0)] == ord('\r'))
+    ends = ends - carriage
+    keep = ends > starts
+    if not keep.any():
+        raise CsvScanError("El archivo no tiene cabecera")
+    return starts[keep], ends[keep]
+
+def _convert(raw):
+    """NumPy values of a column from its raw fields, with the type pandas would infer"""
+    missing = np.isin(raw, NA_BYTES)
+    if not missing.any():
+        try:
+            return raw.astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+        truth = np.isin(raw, TRUE_BYTES)
+        if (truth | np.isin(raw, FALSE_BYTES)).all():
+            return truth
+    try:
+        return np.where(missing, b'nan', raw).astype(np.float64)
+    except ValueError:
+        pass
+    text = pd.Series(np.char.decode(raw, 'utf-8'), dtype='str')
+    text[missing] = np.nan
+    return text
+
+_scanners = OrderedDict()
+_scanners_lock = threading.Lock()
+
+def scanner_for(filename):
+    """Scanner of a CSV file, shared in the process while the file is unchanged"""
+    key = os.path.abspath(filename)
+    with _scanners_lock:
+        scanner = _scanners.get(key)
+        if scanner is not None and scanner.fingerprint == file_fingerprint(filename):
+            _scanners.move_to_end(key)
+            return scanner
+    scanner = CsvScanner(filename)
+    with _scanners_lock:
+        _scanners[key] = scanner
+        _scanners.move_to_end(key)
+        while len(_scanners) > MAX_SCANNERS:
+            _scanners.popitem(last=False)
+    return scanner
@@ -0,0 +1,162 @@
+import re
+import datetime
+import numpy as np
+import pandas as pd
+from expressions import COMPARISONS
+
+DATE_FORMAT = '%Y-%m-%d'
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+RANGE_OPERATORS = ('>', '<', '>=', '<=', '==', '!=', 'between')
+
+def is_date_column(series):
+    return pd.api.types.is_datetime64_any_dtype(series)
+
+def parse_date_columns(frame):
+    """Convert text columns holding only YYYY-MM-DD dates to datetime64, once per load"""
+    for name in frame.columns:
+        parsed = parse_dates([frame[name]])
+        if parsed is not None:
+            frame[name] = parsed[0]
+    return frame
+
+def parse_dates(pieces):
+    """The pieces of one column (consecutive row ranges) as datetime64, or None if it is not a date column"""
+    series = pieces[0]
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series) or is_date_column(series):
+        return None
+    sample = _first_value(pieces)
+    if not isinstance(sample, str) or not DATE_PATTERN.fullmatch(sample):
+        return None
+    parsed = [pd.to_datetime(piece, format=DATE_FORMAT, errors='coerce') for piece in pieces]
+    # Any value that is not a date keeps the column as text
+    if any(values.isna().sum() != piece.isna().sum() for values, piece in zip(parsed, pieces)):
+        return None
+    return parsed
+
+def _first_value(pieces):
+    for piece in pieces:
+        if len(piece) and not pd.isna(piece.iloc[0]):
+            return piece.iloc[0]
+        present = piece.notna().to_numpy()
+        if present.any():
+            return piece.iloc[present.argmax()]
+    return None
+
+def read_csv(source):
+    return parse_date_columns(pd.read_csv(source))
+
+def coerce_date(value):
+    """Timestamp for a date literal, a YYYY-MM-DD string or a date object"""
+    if isinstance(value, pd.Timestamp):
+        return value
+    if isinstance(value, (str, datetime.date, np.datetime64)):
+        try:
+            timestamp = pd.Timestamp(value)
+        except ValueError:
+            timestamp = pd.NaT
+        if not pd.isna(timestamp):
+            return timestamp
+    raise ValueError(f"Fecha no válida: {value!r}")
+
+def format_date(value):
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).strftime(DATE_FORMAT)
+
+def format_dates(frame):
+    """Frame with its date columns written back as YYYY-MM-DD text, for output"""
+    columns = [name for name in frame.columns if is_date_column(frame[name])]
+    if not columns:
+        return frame
+    frame = frame.copy()
+    for name in columns:
+        frame[name] = frame[name].dt.strftime(DATE_FORMAT)
+    return frame
+
+def _nanoseconds(series):
+    return series.to_numpy(dtype='datetime64[ns]').view('int64')
+
+def _bound(value):
+    return coerce_date(value).as_unit('ns').value
+
+class DateIndex:
+    """Row positions of a date column sorted by date, built once per loaded dataset.
+
+    Range filters become two binary searches over the sorted dates.
+    """
+
+    def __init__(self, series):
+        values = _nanoseconds(series)
+        valid = ~series.isna().to_numpy()
+        positions = np.flatnonzero(valid)
+        self.values = values
+        self.order = positions[np.argsort(values[positions], kind='stable')]
+        self.sorted_values = values[self.order]
+
+    def mask(self, operator, value):
+        mask = np.zeros(len(self.values), dtype=bool)
+        if operator == '!=':
+            # NaT != value is True, like NaN
+            mask[:] = True
+            mask[self.positions('==', value)] = False
+            return mask
+        mask[self.positions(operator, value)] = True
+        return mask
+
+    def positions(self, operator, value):
+        search = self.sorted_values.searchsorted
+        if operator == 'between':
+            low, high = search(_bound(value[0]), 'left'), search(_bound(value[1]), 'right')
+            return self.order[low:max(low, high)]
+        bound = _bound(value)
+        if operator == '>':
+            return self.order[search(bound, 'right'):]
+        if operator == '>=':
+            return self.order[search(bound, 'left'):]
+        if operator == '<':
+            return self.order[:search(bound, 'left')]
+        if operator == '<=':
+            return self.order[:search(bound, 'right')]
+        return self.order[search(bound, 'left'):search(bound, 'right')]
+
+class DateIndexCatalog:
+    """Date indexes of a loaded dataset, one per date column, created on first use.
+
+    Frames passed in must be row subsets of the dataset that keep its index
+    labels (filtered or sampled selections).
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.columns = {}
+
+    def column(self, name):
+        if name not in self.columns:
+            self.columns[name] = DateIndex(self.frame[name])
+        return self.columns[name]
+
+    def _positions(self, frame):
+        return None if frame is self.frame else self.frame.index.get_indexer(frame.index)
+
+    def mask(self, frame, column, operator, value):
+        full = self.column(column).mask(operator, value)
+        positions = self._positions(frame)
+        return full if positions is None else full[positions]
+
+def date_mask(frame, column, operator, value, catalog=None):
+    """Rows of frame whose date column satisfies a comparison or between"""
+    if operator not in RANGE_OPERATORS:
+        raise ValueError(f"El operador {operator} no se aplica a la columna de fecha '{column}'")
+    if operator == 'between':
+        value = [coerce_date(value[0]), coerce_date(value[1])]
+    elif operator in ('==', '!=') and isinstance(value, str) and not DATE_PATTERN.fullmatch(value):
+        # A text that is not a date never equals a date
+        return np.full(len(frame), operator == '!=')
+    else:
+        value = coerce_date(value)
+    if catalog is not None:
+        return catalog.mask(frame, column, operator, value)
+    series = frame[column]
+    if operator == 'between':
+        return ((series >= value[0]) & (series <= value[1])).to_numpy()
+    return np.asarray(COMPARISONS[operator](series, value), dtype=bool)
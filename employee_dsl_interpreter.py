@@ -1,22 +1,166 @@
-import json
-import pandas as pd
+import os
+import sys
+import copy
+import time
+import contextlib
+import datetime
 from antlr4 import *
 from EmployeeDSLLexer import EmployeeDSLLexer
 from EmployeeDSLParser import EmployeeDSLParser
 from EmployeeDSLVisitor import EmployeeDSLVisitor
+from query_result import QueryResult
+from expressions import CompiledExpression
+from column_stats import UNKNOWN_SELECTIVITY, load_statistics, filter_key, file_fingerprint
+from incremental import load_incremental
+from result_cache import cache_key, dataset_key
+from hash_join import JoinError, hash_join, push_down
+from aggregation import aggregation_name, aggregation_signature
+from sampling import estimate_aggregates, reservoir_for
+from text_index import TEXT_OPERATORS, TextIndexCatalog
+from dates import DateIndexCatalog, coerce_date, is_date_column
+from sort_index import WALK_FRACTION, SortIndexCatalog, describe_sort, sort_keys
+from csv_scanner import CsvScanError, scanner_for
+from parallel_csv import read_csv_parallel
+from query_plan import PlanNode, QueryPlan
+from predicates import Predicate, filter_predicate
+from bitmaps import bitmap_catalog_for
+from shared_datasets import shared_dataset
+from query_limits import SAMPLE_ROWS, QueryCancelled, QueryLimitExceeded, CancellationToken, QueryLimits, row_bytes, record_bytes
+from backends import Backend, PandasBackend
+from sqlite_backend import SQLiteBackend
+
+# 'mmap' scans the CSV and parses only the columns a query refers to; 'parallel' parses byte ranges in worker processes
+LOADERS = ('pandas', 'mmap', 'parallel')
+# Where the operators run: in memory, or in a SQLite copy of the file with on-disk indexes
+BACKENDS = {'pandas': PandasBackend, 'sqlite': SQLiteBackend}
+
+class Parameter:
+    """Placeholder for a literal in a prepared script: $name or positional ?"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        if isinstance(self.name, int):
+            return f"?{self.name + 1}"
+        return f"${self.name}"
+
+    def __eq__(self, other):
+        return isinstance(other, Parameter) and other.name == self.name
+
+    def __hash__(self):
+        return hash(('parameter', self.name))
+
+def bind_value(value, params):
+    if isinstance(value, list):
+        return [bind_value(item, params) for item in value]
+    if not isinstance(value, Parameter):
+        return value
+    try:
+        bound = params[value.name]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"Falta el valor del parámetro {value!r}")
+    if isinstance(bound, (int, float)) and not isinstance(bound, bool):
+        # Numeric literals in scripts are always floats
+        return float(bound)
+    if isinstance(bound, str):
+        return bound
+    if isinstance(bound, datetime.date):
+        return coerce_date(bound)
+    raise TypeError(f"Valor no soportado para el parámetro {value!r}: {bound!r}")
+
+def bind_filter(filter_op, params):
+    bound = dict(filter_op, value=bind_value(filter_op['value'], params))
+    bound['predicate'] = Predicate(bound)
+    return bound
+
+def has_parameters(value):
+    if isinstance(value, list):
+        return any(isinstance(item, Parameter) for item in value)
+    return isinstance(value, Parameter)
+
+def apply_filter(filtered_data, filter_op, text_indexes=None, date_indexes=None):
+    # text_indexes / date_indexes: catalogs of the dataset filtered_data was selected from
+    return filtered_data[filter_predicate(filter_op).mask(filtered_data, text_indexes, date_indexes)]
+
+def filter_access(frame, filter_op, text_indexes=None, date_indexes=None):
+    # How apply_filter reads the rows of frame for filter_op, same dispatch order
+    column = filter_op['column']
+    if filter_op.get('expression') is not None:
+        return 'expresión vectorizada'
+    if filter_op['operator'] in TEXT_OPERATORS:
+        return 'índice de texto' if text_indexes is not None else 'recorrido de texto'
+    if column in frame.columns and is_date_column(frame[column]):
+        return 'índice de fechas' if date_indexes is not None else 'recorrido de fechas'
+    return 'recorrido vectorizado'
+
+def describe_filter(filter_op):
+    return f"{filter_op['column']} {filter_op['operator']} {filter_op['value']}"
 
 class EmployeeDSLInterpreter(EmployeeDSLVisitor):
-    def __init__(self):
+    def __init__(self, materialize=True, incremental=False, result_cache=None, params=None,
+                 dataset_cache=None, join_chunk_size=None, loader='pandas', explain=False, cancel_event=None,
+                 limits=None, backend='pandas'):
+        if loader not in LOADERS:
+            raise ValueError(f"Cargador desconocido: {loader}. Use uno de {', '.join(LOADERS)}")
+        if not isinstance(backend, Backend):
+            if backend not in BACKENDS:
+                raise ValueError(f"Backend desconocido: {backend}. Use uno de {', '.join(BACKENDS)}")
+            backend = BACKENDS[backend]()
+        self.backend = backend
+        self.materialize = materialize
+        self.loader = loader
+        self._scanner = None
+        self.incremental = incremental
+        self.result_cache = result_cache
+        self.params = params
+        self.dataset_cache = dataset_cache
+        self.join_chunk_size = join_chunk_size
+        # Datasets loaded with 'load "x.csv" as alias;' and the joins against them
+        self.named_sources = {}
+        self.named_data = {}
+        self.joins = []
+        self._join_cache = None
+        self._positional_count = 0
+        self.source = None
+        self._pending_load = None
         self.data = None
+        self.statistics = None
+        self.text_indexes = None
+        self.date_indexes = None
+        self.sort_indexes = None
+        self.bitmaps = None
         self.filters = []
         self.aggregations = []
         self.sorting = None
+        # 'sample N%;' runs the query on a sample and scales the aggregates up
+        self.sampling = None
+        self._reservoir = None
+        # 'limit N offset M;' or 'limit N after "cursor";' returns one page of the result
+        self.paging = None
         self.last_result = None
+        self.results = []
+        # explain=True analyzes every print: the result carries its plan with row counts and timings
+        self.explain = explain
+        self.last_plan = None
+        self._plan = None
+        self._timings = None
+        self._load_access = None
+        self._load_seconds = None
+        # Selection, sort and aggregates of the previous print, narrowed by later filters
+        self._query_state = None
+        # A threading.Event set from another thread stops the script at the next statement or operator
+        self.cancel_event = cancel_event
+        # Wall time, rows and memory allowed to this execution, counted from here
+        self.limits = limits
+        self._budget = limits.start() if limits is not None else None
+        self._row_bytes = 0
 
     def visitProgram(self, ctx):
         # Visit all statements
         result = None
         for statement in ctx.statement():
+            self._checkpoint()
             res = self.visit(statement)
             # Capture the result of print statement
             if isinstance(res, dict):
@@ -28,9 +172,156 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
 
     def visitLoadStatement(self, ctx):
         filename = ctx.STRING_LITERAL().getText()[1:-1]
-        self.data = pd.read_csv(filename)
+        if ctx.AS():
+            self.load_named_source(ctx.IDENTIFIER().getText(), filename)
+            return None
+        self.load_source(filename)
+        return None
+
+    def visitSampleStatement(self, ctx):
+        percent = float(ctx.NUMBER().getText())
+        if not 0 < percent <= 100:
+            raise ValueError(f"Porcentaje de muestra fuera de rango (0-100]: {ctx.NUMBER().getText()}")
+        self.sampling = {
+            'fraction': percent / 100.0,
+            'column': ctx.STRING_LITERAL().getText()[1:-1] if ctx.BY() else None
+        }
+        return None
+
+    def visitLimitStatement(self, ctx):
+        numbers = [token.getText() for token in ctx.NUMBER()]
+        limit = _whole_number(numbers[0], "El límite")
+        if limit < 1:
+            raise ValueError(f"El límite debe ser mayor que cero: {numbers[0]}")
+        after = None
+        if ctx.STRING_LITERAL():
+            after = ctx.STRING_LITERAL().getText()[1:-1]
+        elif ctx.PARAMETER():
+            after = self._parameter(ctx.PARAMETER().getText())
+            if self.params is not None:
+                after = bind_value(after, self.params)
+        self.paging = {
+            'limit': limit,
+            'offset': _whole_number(numbers[1], "El desplazamiento") if ctx.OFFSET() else 0,
+            'after': after
+        }
+        return None
+
+    def load_named_source(self, alias, filename):
+        # Read lazily, the first join that needs it loads the file
+        self.named_sources[alias] = filename
+        self.named_data.pop(alias, None)
+
+    def visitJoinStatement(self, ctx):
+        alias = ctx.IDENTIFIER().getText()
+        columns = [token.getText()[1:-1] for token in ctx.STRING_LITERAL()]
+        self.joins.append({
+            'alias': alias,
+            'left_column': columns[0],
+            'right_column': columns[1] if len(columns) > 1 else columns[0]
+        })
         return None
 
+    def load_source(self, filename):
+        self.source = filename
+        if not self.backend.in_memory:
+            # The backend opens the file when a print runs
+            self.data = None
+            self._pending_load = None
+            return
+        if self.result_cache is not None or self.loader == 'mmap':
+            # Defer reading the file until a print misses the cache or knows which columns it needs
+            self.data = None
+            self._pending_load = filename
+            return
+        self._load(filename)
+
+    def _load(self, filename):
+        self._pending_load = None
+        started = time.perf_counter()
+        if self.loader == 'mmap' and not self.incremental:
+            self.data, self.statistics = self._scan(filename)
+        else:
+            self.data, self.statistics = self._read(filename)
+        self._load_seconds = time.perf_counter() - started
+        self._record(('scan',), len(self.data), started)
+        for filter_op in self.filters:
+            if not has_parameters(filter_op['value']):
+                filter_predicate(filter_op).check(self.data)
+        entry = self.dataset_cache.get(os.path.abspath(filename)) if self.dataset_cache is not None else None
+        if entry is not None and entry['data'] is self.data:
+            # Prepared scripts keep the text indexes with the cached dataset
+            self.text_indexes = entry.setdefault('text_indexes', TextIndexCatalog(self.data))
+            self.date_indexes = entry.setdefault('date_indexes', DateIndexCatalog(self.data))
+            self.sort_indexes = entry.setdefault('sort_indexes', SortIndexCatalog(self.data))
+        else:
+            self.text_indexes = TextIndexCatalog(self.data)
+            self.date_indexes = DateIndexCatalog(self.data)
+            self.sort_indexes = SortIndexCatalog(self.data)
+        # Filter bitmaps are shared by every load of the unchanged file
+        self.bitmaps = bitmap_catalog_for(self.data, dataset_key(filename))
+        if self._budget is not None:
+            self._row_bytes = row_bytes(self.data)
+
+    def _read(self, filename):
+        if self.incremental:
+            # Reuse the rows already read in this process and parse only the appended ones
+            self._load_access = 'lectura incremental'
+            return load_incremental(filename)
+        shared = shared_dataset(filename)
+        if shared is not None:
+            # Published by a parent process: the columns are read in place, not copied
+            self._load_access = 'memoria compartida'
+            return shared.frame, shared.statistics
+        if self.dataset_cache is not None:
+            key = os.path.abspath(filename)
+            fingerprint = file_fingerprint(filename)
+            entry = self.dataset_cache.get(key)
+            if entry is not None and entry['fingerprint'] == fingerprint:
+                self._load_access = 'conjunto en memoria'
+                return entry['data'], entry['statistics']
+        self._load_access = 'read_csv en paralelo' if self.loader == 'parallel' else 'read_csv'
+        data = read_csv_parallel(filename) if self.loader == 'parallel' else self.backend.load(filename)
+        statistics = load_statistics(filename, data)
+        if self.dataset_cache is not None:
+            self.dataset_cache[key] = {'fingerprint': fingerprint, 'data': data, 'statistics': statistics}
+        return data, statistics
+
+    def _scan(self, filename):
+        try:
+            scanner = scanner_for(filename)
+        except CsvScanError as error:
+            print(f"DEBUG: mmap loader cannot read {filename} ({error}), using pandas")
+            self._scanner = None
+            return self._read(filename)
+        self._scanner = scanner
+        data = scanner.frame(self._referenced_columns())
+        self._load_access = f"mmap, {len(data.columns)} de {len(scanner.columns)} columnas"
+        print(f"DEBUG: Scanned {len(data.columns)} of {len(scanner.columns)} columns")
+        # Statistics of a partial frame are not written next to the file
+        return data, load_statistics(filename, data, persist=len(data.columns) == len(scanner.columns))
+
+    def _referenced_columns(self):
+        # Columns of the loaded dataset the query reads, None for all of them
+        if self.joins:
+            return None
+        columns = set()
+        for filter_op in self.filters:
+            expression = filter_op.get('expression')
+            columns.update(expression.columns() if expression is not None else [filter_op['column']])
+        columns.update(agg['column'] for agg in self.aggregations if agg.get('column'))
+        if self.sorting:
+            columns.update(self.sorting['columns'])
+        if self.sampling and self.sampling['column']:
+            columns.add(self.sampling['column'])
+        return columns
+
+    def _missing_columns(self):
+        columns = self._referenced_columns()
+        if columns is None:
+            return len(self.data.columns) < len(self._scanner.columns)
+        return bool(columns & set(self._scanner.columns) - set(self.data.columns))
+
     def visitFilterStatement(self, ctx):
         # Handle AND / OR compositions of filters
         if ctx.AND():
@@ -55,8 +346,8 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
             self.filters.extend(combined_filters)
             return combined_filters
 
-        # Basic filter
-        if ctx.COLUMN() and ctx.STRING_LITERAL():
+        # Basic filter (skipped when the parser had to recover from a syntax error)
+        if ctx.COLUMN() and ctx.STRING_LITERAL() and ctx.operator():
             column = ctx.STRING_LITERAL().getText()[1:-1]
             operator = self.visit(ctx.operator())
             value = self.visit(ctx.value())
@@ -65,10 +356,42 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
                 'operator': operator,
                 'value': value
             }
+            self._compile_filter(filter_obj)
+            self.filters.append(filter_obj)
+            return [filter_obj]
+
+        # Filter over a computed column expression
+        if ctx.expression() and ctx.operator():
+            expression = CompiledExpression(self.visit(ctx.expression()))
+            filter_obj = {
+                'column': expression.text,
+                'operator': self.visit(ctx.operator()),
+                'value': self.visit(ctx.value()),
+                'expression': expression
+            }
+            self._compile_filter(filter_obj)
             self.filters.append(filter_obj)
             return [filter_obj]
         return []
 
+    def _compile_filter(self, filter_op):
+        # Operator and literal are resolved once here; with the data already loaded the types are checked too
+        filter_op['predicate'] = Predicate(filter_op)
+        if self.data is not None and not has_parameters(filter_op['value']):
+            filter_op['predicate'].check(self.data)
+
+    def visitExpression(self, ctx):
+        if ctx.COLUMN():
+            return ('column', ctx.STRING_LITERAL().getText()[1:-1])
+        if ctx.IDENTIFIER():
+            return ('call', ctx.IDENTIFIER().getText(), self.visit(ctx.expression(0)))
+        if ctx.LPAREN():
+            return self.visit(ctx.expression(0))
+        if ctx.NUMBER():
+            return ('number', float(ctx.NUMBER().getText()))
+        operator = ctx.getChild(1).getText()
+        return ('binary', operator, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+
     def visitOperator(self, ctx):
         if ctx.GT(): return '>'
         if ctx.LT(): return '<'
@@ -77,6 +400,9 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
         if ctx.EQ(): return '=='
         if ctx.NEQ(): return '!='
         if ctx.BETWEEN(): return 'between'
+        if ctx.STARTS_WITH(): return 'starts_with'
+        if ctx.CONTAINS(): return 'contains'
+        if ctx.LIKE(): return 'like'
         return None
 
     def visitValue(self, ctx):
@@ -88,12 +414,27 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
                 return float(number_token.getText())
         elif ctx.STRING_LITERAL():
             return ctx.STRING_LITERAL().getText()[1:-1]
+        elif ctx.DATE_LITERAL():
+            dates = [coerce_date(token.getText()) for token in ctx.DATE_LITERAL()]
+            return dates if ctx.AND() else dates[0]
         elif ctx.NUMBER() and ctx.AND():
             min_val = float(ctx.NUMBER(0).getText())
             max_val = float(ctx.NUMBER(1).getText())
             return [min_val, max_val]
+        elif ctx.PARAMETER():
+            parameters = [self._parameter(token.getText()) for token in ctx.PARAMETER()]
+            value = parameters if ctx.AND() else parameters[0]
+            if self.params is not None:
+                return bind_value(value, self.params)
+            return value
         return None
 
+    def _parameter(self, text):
+        if text == '?':
+            self._positional_count += 1
+            return Parameter(self._positional_count - 1)
+        return Parameter(text[1:])
+
     def visitAggregateStatement(self, ctx):
         aggregation_func = self.visit(ctx.aggregateFunction())
         column = None
@@ -110,91 +451,609 @@ class EmployeeDSLInterpreter(EmployeeDSLVisitor):
         if column is None:
             if ctx.STRING_LITERAL():
                 column = ctx.STRING_LITERAL().getText()[1:-1]
-        self.aggregations.append({
+        aggregation = {
             'function': aggregation_func,
             'column': column
-        })
+        }
+        function_ctx = ctx.aggregateFunction()
+        if function_ctx.PERCENTILE():
+            percentile = float(function_ctx.NUMBER().getText())
+            if percentile > 100:
+                raise ValueError(f"Percentil fuera de rango (0-100): {function_ctx.NUMBER().getText()}")
+            aggregation['percentile'] = percentile
+        if function_ctx.APPROX():
+            aggregation['approximate'] = True
+        self.aggregations.append(aggregation)
         return None
 
     def visitAggregateFunction(self, ctx):
+        if ctx.COUNT() and ctx.DISTINCT(): return 'count_distinct'
         if ctx.COUNT(): return 'count'
         if ctx.SUM(): return 'sum'
         if ctx.AVERAGE(): return 'average'
+        if ctx.MIN(): return 'min'
+        if ctx.MAX(): return 'max'
+        if ctx.STDDEV(): return 'stddev'
+        if ctx.PERCENTILE(): return 'percentile'
+        if ctx.MEDIAN(): return 'median'
         return None
 
     def visitSortStatement(self, ctx):
-        column = ctx.STRING_LITERAL().getText()[1:-1]
-        ascending = ctx.ASC() is not None
+        keys = [self.visit(key) for key in ctx.sortKey()]
         self.sorting = {
-            'column': column,
-            'ascending': ascending
+            'columns': [column for column, _ in keys],
+            'ascending': [ascending for _, ascending in keys]
         }
         return None
 
+    def visitSortKey(self, ctx):
+        return ctx.STRING_LITERAL().getText()[1:-1], ctx.ASC() is not None
+
     def visitPrintStatement(self, ctx):
-        result = self._execute_query()
+        return self.run_print()
+
+    def visitExplainStatement(self, ctx):
+        if ctx.ANALYZE():
+            return self.run_print(analyze=True)
+        plan = self.explain_plan()
+        print("Plan de consulta:")
+        print(plan.render())
+        return None
+
+    def run_print(self, analyze=False):
+        result = self._execute_query(analyze or self.explain)
         self.last_result = result
+        self.results.append(result)
+        return result
+
+    def explain_plan(self):
+        """Plan the next print would run, with estimated row counts, without running it"""
+        self._check_parameters()
+        key = self._cache_key()
+        if key is not None and key in self.result_cache:
+            plan = QueryPlan(PlanNode('Resultado', 'caché de resultados', key=('result',)))
+        else:
+            self._ensure_loaded()
+            state = self._query_state
+            reusable = state is not None and not self.joins and self.sampling is None and state['data'] is self.data
+            plan = self._build_plan(state if reusable else None)
+        self.last_plan = plan
+        return plan
+
+    def _execute_query(self, analyze=False):
+        if not analyze:
+            return self._run_query()
+        # Operators report (key, rows, seconds) while they run, the plan gets them at the end
+        self._plan, self._timings = None, []
+        started = time.perf_counter()
+        try:
+            result = self._run_query()
+            timings = self._timings
+        finally:
+            self._timings = None
+        plan = self._plan or self._build_plan()
+        for node_key, rows, seconds in timings:
+            plan.record(node_key, rows, seconds)
+        plan.record(('result',), result['record_count'], time.perf_counter() - started)
+        self.last_plan = plan
+        # Cached results are shared, the plan goes on a copy
+        result = copy.copy(result)
+        result['plan'] = plan
         return result
 
-    def _execute_query(self):
+    def _check_parameters(self):
+        unbound = [filter_op for filter_op in self.filters if has_parameters(filter_op['value'])]
+        if unbound:
+            raise ValueError(f"El script tiene parámetros sin valor ({unbound[0]['value']!r}); "
+                             f"use prepare() y execute() o pase params")
+
+    def _cache_key(self):
+        if self.result_cache is None or self.source is None or not self._cacheable():
+            return None
+        joins = [(join['alias'], self.named_sources.get(join['alias']), join['left_column'], join['right_column'])
+                 for join in self.joins]
+        # Pages share one cached entry holding the whole selection, built without records
+        return cache_key(self.source, self.filters, self.aggregations, self.sorting,
+                         self.materialize and self.paging is None, joins, self.sampling)
+
+    def _ensure_loaded(self):
+        if self._pending_load is not None:
+            self._load(self._pending_load)
+        elif self._scanner is not None and self.data is not None and self._missing_columns():
+            # A later print reads columns the scanned frame does not have yet
+            self._load(self.source)
+
+    def _record(self, key, rows, started, held=None):
+        # Called after every operator, which is also where a cancelled query stops.
+        # held: rows left in memory when the operator kept fewer than it produced (a streamed join)
+        if self._timings is not None:
+            self._timings.append((key, rows, time.perf_counter() - started))
+        self._checkpoint()
+        if self._budget is not None and key[0] not in ('scan', 'aggregate'):
+            self._budget.check(key[0], rows if held is None else held, self._row_bytes)
+
+    def _checkpoint(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise QueryCancelled("Consulta cancelada")
+        if self._budget is not None:
+            self._budget.check_time()
+
+    def _run_query(self):
+        self._check_parameters()
+        key = self._cache_key()
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                print(f"DEBUG: Result cache hit: {cached['record_count']} records")
+                if self._timings is not None:
+                    self._plan = self._cache_hit_plan()
+                return self._page(cached)
+        self._ensure_loaded()
+        if not self.backend.in_memory and self.source is not None:
+            result = self._backend_query()
+            if key is not None:
+                self.result_cache.put(key, result, rows=result['record_count'])
+            return self._page(result)
         if self.data is None:
-            return {
-                'filtered_data': [],
+            return self._page(QueryResult(None, {}, self.materialize and self.paging is None))
+        base, filters = self.data, self.filters
+        if self.joins:
+            base, filters = self._joined_input()
+        sample = None
+        if self.sampling is not None:
+            sample = self._sample(base)
+            base = sample.frame
+        state = self._query_state
+        if self._timings is not None:
+            self._plan = self._build_plan(state if state is not None and state['data'] is base else None)
+        if state is None or state['data'] is not base:
+            # First print after a load (or a change below a join): nothing to reuse yet
+            state = self._query_state = {
+                'data': base,
+                'frame': base,
+                'applied': 0,
+                'seen': set(),
+                'never': False,
+                'version': 0,
+                'sorted': None,
                 'aggregations': {},
-                'record_count': 0
+                'intervals': {},
+                'bitmap': None
             }
-        filtered_data = self.data.copy()
-        print(f"DEBUG: Initial data count: {len(filtered_data)}")
-        for i, filter_op in enumerate(self.filters):
-            column = filter_op['column']
-            operator = filter_op['operator']
-            value = filter_op['value']
-            if operator == '>':
-                filtered_data = filtered_data[filtered_data[column] > value]
-            elif operator == '<':
-                filtered_data = filtered_data[filtered_data[column] < value]
-            elif operator == '>=':
-                filtered_data = filtered_data[filtered_data[column] >= value]
-            elif operator == '<=':
-                filtered_data = filtered_data[filtered_data[column] <= value]
-            elif operator == '==':
-                filtered_data = filtered_data[filtered_data[column] == value]
-            elif operator == '!=':
-                filtered_data = filtered_data[filtered_data[column] != value]
-            elif operator == 'between':
-                min_val, max_val = value
-                filtered_data = filtered_data[(filtered_data[column] >= min_val) & (filtered_data[column] <= max_val)]
-            print(f"DEBUG: After filter {i+1} ({column} {operator} {value}): {len(filtered_data)} records")
-        if self.sorting:
-            filtered_data = filtered_data.sort_values(
-                by=self.sorting['column'],
-                ascending=self.sorting['ascending']
-            )
-            print(f"DEBUG: After sorting by {self.sorting['column']} ascending={self.sorting['ascending']}")
+            print(f"DEBUG: Initial data count: {len(base)}")
+        else:
+            print(f"DEBUG: Reusing {len(state['frame'])} records from the previous print")
+            self._record(('reuse',), len(state['frame']), time.perf_counter())
+        new_filters = filters[state['applied']:]
+        if new_filters and not state['never']:
+            self._narrow(state, new_filters)
+        state['applied'] = len(filters)
+        filtered_data = state['frame']
+        sort_key = sort_keys(self.sorting) if self.sorting else None
+        if sort_key is not None:
+            started = time.perf_counter()
+            if state['sorted'] is not None and state['sorted'][0] == (state['version'], sort_key):
+                filtered_data = state['sorted'][1]
+                print(f"DEBUG: Reusing sort by {describe_sort(self.sorting)}")
+            else:
+                if self._budget is not None:
+                    # A sort yields as many rows as it reads, so an oversized one is refused before it runs
+                    self._budget.check('sort', len(filtered_data), self._row_bytes)
+                # Cached permutations of the loaded dataset; a joined input is sorted directly
+                filtered_data = self.backend.sort(filtered_data, self.sorting, None if self.joins else self.sort_indexes)
+                state['sorted'] = ((state['version'], sort_key), filtered_data)
+                print(f"DEBUG: After sorting by {describe_sort(self.sorting)}")
+            self._record(('sort',), len(filtered_data), started)
+        # Aggregates do not depend on row order, so they are computed on the unsorted selection
+        started = time.perf_counter()
+        computed = {}
+        missing = []
+        for agg in self.aggregations:
+            agg_key = (state['version'],) + aggregation_signature(agg)
+            if agg_key in state['aggregations']:
+                computed[aggregation_name(agg)] = state['aggregations'][agg_key]
+            elif agg.get('function') == 'count' and state['frame'] is self.data and self.statistics is not None:
+                # No filter survived planning, the row count comes from the catalog
+                computed[aggregation_name(agg)] = self.statistics.row_count
+            else:
+                missing.append(agg)
+        if missing and sample is not None:
+            # Count, sum, average and distinct counts are scaled up; the rest describe the sample rows
+            estimated, intervals = estimate_aggregates(sample, state['frame'], missing)
+            computed.update(estimated)
+            for agg in missing:
+                if aggregation_name(agg) in intervals:
+                    state['intervals'][(state['version'],) + aggregation_signature(agg)] = intervals[aggregation_name(agg)]
+            missing = [agg for agg in missing if aggregation_name(agg) not in estimated]
+        if missing:
+            computed.update(self.backend.aggregate(state['frame'], missing))
         aggregation_results = {}
         for agg in self.aggregations:
-            func = agg.get('function')
-            column = agg.get('column')
-            if func == 'count':
-                aggregation_results[f'count_{column}'] = len(filtered_data)
-            elif func == 'sum':
-                aggregation_results[f'sum_{column}'] = filtered_data[column].sum()
-            elif func == 'average':
-                aggregation_results[f'average_{column}'] = filtered_data[column].mean()
-        result = {
-            'filtered_data': json.loads(filtered_data.to_json(orient='records')),
-            'aggregations': aggregation_results,
-            'record_count': len(filtered_data)
-        }
+            name = aggregation_name(agg)
+            if name in computed:
+                aggregation_results[name] = computed[name]
+                state['aggregations'][(state['version'],) + aggregation_signature(agg)] = computed[name]
+        if self.aggregations:
+            self._record(('aggregate',), 1, started)
+        complete = None
+        if self._scanner is not None and not self.joins and len(self.data.columns) < len(self._scanner.columns):
+            complete = self._scanner.complete
+        if self._budget is not None and self.materialize and self.paging is None:
+            self._budget.check('result', len(filtered_data), record_bytes(filtered_data))
+        result = self.backend.materialize(filtered_data, aggregation_results, self.materialize and self.paging is None,
+                                          self.sorting, complete)
+        if sample is not None:
+            result['sample'] = sample.describe()
+            result['confidence_intervals'] = {
+                aggregation_name(agg): state['intervals'][(state['version'],) + aggregation_signature(agg)]
+                for agg in self.aggregations
+                if (state['version'],) + aggregation_signature(agg) in state['intervals']
+            }
+            print(f"DEBUG: Sampled {len(sample.frame)} of {sample.describe()['population']} records")
         print(f"DEBUG: Final result record count: {len(filtered_data)}")
-        return result
+        if key is not None:
+            self.result_cache.put(key, result, rows=len(filtered_data))
+        return self._page(result)
+
+    def _backend_relation(self):
+        if self.joins or self.sampling is not None:
+            raise ValueError(f"El backend {self.backend.name} no admite join ni sample")
+        relation = self.backend.load(self.source)
+        for filter_op in self.filters:
+            relation = self.backend.filter(relation, filter_op)
+        if self.sorting:
+            relation = self.backend.sort(relation, self.sorting)
+        return relation
+
+    def _backend_query(self):
+        # Filters and sort become one backend query; rows are only counted here, not read
+        started = time.perf_counter()
+        relation = self._backend_relation()
+        rows = self.backend.count(relation)
+        self._record(('backend',), rows, started)
+        print(f"DEBUG: {self.backend.name} selected {rows} records")
+        aggregations = {}
+        if self.aggregations:
+            started = time.perf_counter()
+            aggregations = self.backend.aggregate(relation, self.aggregations)
+            self._record(('aggregate',), 1, started)
+        materialize = self.materialize and self.paging is None
+        if self._budget is not None and materialize:
+            first = next(iter(self.backend.iter_frames(relation, SAMPLE_ROWS)), None)
+            if first is not None:
+                self._budget.check('result', rows, record_bytes(first))
+        print(f"DEBUG: Final result record count: {rows}")
+        return self.backend.materialize(relation, aggregations, materialize, self.sorting)
+
+    def _backend_plan(self):
+        relation = self._backend_relation()
+        filters = ', '.join(describe_filter(filter_op) for filter_op in self.filters)
+        node = PlanNode(f"Consulta {self.backend.name}" + (f": {filters}" if filters else ''),
+                        self.backend.explain(relation), key=('backend',))
+        if self.aggregations:
+            node = PlanNode('Agregados', None, 1, ('aggregate',), [node])
+        return QueryPlan(PlanNode('Resultado', None, None, ('result',), [node]))
+
+    def _page(self, result):
+        if self.paging is None:
+            return result
+        if has_parameters(self.paging['after']):
+            raise ValueError(f"El script tiene parámetros sin valor ({self.paging['after']!r}); "
+                             f"use prepare() y execute() o pase params")
+        started = time.perf_counter()
+        page = result.page(self.paging['limit'], self.paging['offset'], self.paging['after'], self.materialize)
+        self._record(('limit',), page['record_count'], started)
+        print(f"DEBUG: Page of {page['record_count']} records from position {page['page']['offset']}")
+        return page
+
+    def _joined_input(self):
+        # Filters that only touch one input run below the join, the rest are returned
+        sides = []
+        for join in self.joins:
+            alias = join['alias']
+            if alias not in self.named_sources:
+                raise JoinError(f"Conjunto de datos desconocido: {alias}. Use load \"archivo.csv\" as {alias};")
+            sides.append((alias, set(self._named_frame(alias).columns)))
+        left_filters, side_filters, remaining = push_down(self.filters, set(self.data.columns), sides)
+        # With join_chunk_size the last join is streamed: each chunk is narrowed by the remaining filters as it
+        # arrives, so only the kept rows and one chunk exist at a time. _narrow applies them again, at no cost.
+        streamed = remaining if self.join_chunk_size is not None else []
+        signature = (
+            tuple(sorted({filter_key(filter_op) for filter_op in left_filters})),
+            tuple((alias, tuple(sorted({filter_key(filter_op) for filter_op in side}))) for alias, side in side_filters.items()),
+            tuple((join['alias'], join['left_column'], join['right_column']) for join in self.joins),
+            tuple(sorted({filter_key(filter_op) for filter_op in streamed}))
+        )
+        cached = self._join_cache
+        if cached is not None and cached[0] == signature and cached[1] is self.data \
+                and all(cached[2].get(alias) is self.named_data[alias] for alias, _ in sides):
+            return cached[3], remaining
+        joined = self._filter_input(self.data, left_filters)
+        for join in self.joins:
+            alias = join['alias']
+            right = self._filter_input(self.named_data[alias], side_filters[alias], alias)
+            started = time.perf_counter()
+            kept = [] if streamed and join is self.joins[-1] else None
+            checkpoint = None
+            if self._budget is not None:
+                self._row_bytes = row_bytes(joined) + row_bytes(right)
+                checkpoint = self._join_checkpoint(alias, kept)
+            joined_rows = [0]
+            def keep(chunk):
+                joined_rows[0] += len(chunk)
+                if kept is None:
+                    return chunk
+                for filter_op in streamed:
+                    chunk = apply_filter(chunk, filter_op)
+                kept.append(len(chunk))
+                return chunk
+            joined = hash_join(joined, right, join['left_column'], join['right_column'], alias, self.join_chunk_size,
+                               checkpoint, keep)
+            self._record(('join', alias), joined_rows[0], started, len(joined))
+            print(f"DEBUG: After join with {alias} on {join['left_column']} = {join['right_column']}: {joined_rows[0]} records")
+            if kept is not None:
+                print(f"DEBUG: Kept {len(joined)} joined records after filtering each chunk")
+        self._join_cache = (signature, self.data, dict(self.named_data), joined)
+        return joined, remaining
+
+    def _join_checkpoint(self, alias, kept=None):
+        # kept: row counts of the chunks a streamed join has kept so far, the only ones still in memory
+        previous = [0]
+        def checkpoint(rows):
+            # Called with the rows joined so far, before the next chunk is assembled
+            self._checkpoint()
+            if kept is not None:
+                chunk, previous[0] = rows - previous[0], rows
+                rows = sum(kept) + chunk
+            self._budget.check('join', rows, self._row_bytes)
+        return checkpoint
+
+    def _named_frame(self, alias):
+        if alias not in self.named_data:
+            started = time.perf_counter()
+            self.named_data[alias] = self._read(self.named_sources[alias])[0]
+            self._record(('scan', alias), len(self.named_data[alias]), started)
+        return self.named_data[alias]
 
-def parse_and_interpret(input_string):
+    def _sample(self, base):
+        started = time.perf_counter()
+        if self._reservoir is None or self._reservoir.frame is not base:
+            # Reservoirs of plain files are shared per (path, fingerprint); joined inputs get their own
+            key = dataset_key(self.source) if self.source is not None and not self.joins else None
+            self._reservoir = reservoir_for(base, key)
+        sample = self._reservoir.sample(self.sampling['fraction'], self.sampling['column'])
+        self._record(('sample',), len(sample.frame), started)
+        return sample
+
+    def _filter_input(self, frame, filters, side=None):
+        seen = set()
+        for filter_op in filters:
+            if filter_key(filter_op) in seen:
+                continue
+            seen.add(filter_key(filter_op))
+            started = time.perf_counter()
+            frame = apply_filter(frame, filter_op)
+            self._record(('pushdown', side, filter_key(filter_op)), len(frame), started)
+            print(f"DEBUG: Pushed below join ({filter_op['column']} {filter_op['operator']} {filter_op['value']}): {len(frame)} records")
+        return frame
+
+    def _narrow(self, state, new_filters):
+        # Filters are conjunctive, so the previous selection only ever shrinks
+        filters = new_filters
+        never_matches = False
+        if self.statistics is not None:
+            filters, never_matches = self.statistics.plan_filters(new_filters, state['seen'])
+        if len(filters) < len(new_filters):
+            print(f"DEBUG: Statistics removed {len(new_filters) - len(filters)} redundant or always-true filters")
+        for filter_op in new_filters:
+            state['seen'].add(filter_key(filter_op))
+        if not filters:
+            return
+        state['version'] += 1
+        if never_matches:
+            # Column ranges prove that no row can pass, skip the scan entirely
+            filter_op = filters[0]
+            state['never'] = True
+            state['frame'] = state['frame'].iloc[0:0]
+            self._record(('filter', filter_key(filter_op)), 0, time.perf_counter())
+            print(f"DEBUG: Statistics show no row matches ({filter_op['column']} {filter_op['operator']} {filter_op['value']}): 0 records")
+            return
+        if self._uses_bitmaps(state):
+            # AND of the cached bitmap of each filter over the whole dataset, rows are taken once at the end
+            selected = state['bitmap']
+            for i, filter_op in enumerate(filters, state['applied'] + 1):
+                started = time.perf_counter()
+                bitmap = self.bitmaps.bitmap(self.data, filter_op, self.text_indexes, self.date_indexes)
+                selected = bitmap if selected is None else selected & bitmap
+                self._record(('filter', filter_key(filter_op)), selected.count(), started)
+                print(f"DEBUG: After filter {i} ({filter_op['column']} {filter_op['operator']} {filter_op['value']}): {selected.count()} records")
+            state['bitmap'] = selected
+            state['frame'] = self.data.iloc[selected.positions()]
+            return
+        filtered_data = state['frame']
+        # Indexes map rows by index label, which a join does not preserve
+        text_indexes = None if self.joins else self.text_indexes
+        date_indexes = None if self.joins else self.date_indexes
+        for i, filter_op in enumerate(filters, state['applied'] + 1):
+            started = time.perf_counter()
+            filtered_data = self.backend.filter(filtered_data, filter_op, text_indexes, date_indexes)
+            self._record(('filter', filter_key(filter_op)), len(filtered_data), started)
+            print(f"DEBUG: After filter {i} ({filter_op['column']} {filter_op['operator']} {filter_op['value']}): {len(filtered_data)} records")
+        state['frame'] = filtered_data
+
+    def _build_plan(self, state=None):
+        """Operator tree of the current query with estimated rows; state is the selection of the previous print it narrows"""
+        if not self.backend.in_memory and self.source is not None:
+            return self._backend_plan()
+        if self.data is None:
+            return QueryPlan(PlanNode('Resultado', 'sin datos', 0, ('result',)))
+        node, filters = self._join_plan() if self.joins else (self._scan_node(), self.filters)
+        if state is not None:
+            node = PlanNode('Selección del print anterior', 'reutilizada', len(state['frame']), ('reuse',))
+            new_filters, seen = filters[state['applied']:], state['seen']
+            if state['never']:
+                new_filters = []
+        else:
+            if self.sampling is not None:
+                by = f" por {self.sampling['column']}" if self.sampling['column'] else ''
+                node = PlanNode(f"Muestra {self.sampling['fraction'] * 100:g}%{by}", 'reservorio',
+                                _scaled(node.estimated, self.sampling['fraction']), ('sample',), [node])
+            new_filters, seen = filters, set()
+        planned, never_matches = new_filters, False
+        if self.statistics is not None:
+            planned, never_matches = self.statistics.plan_filters(new_filters, seen)
+        text_indexes = None if self.joins else self.text_indexes
+        date_indexes = None if self.joins else self.date_indexes
+        bitmaps = self._uses_bitmaps(state) if state is not None else \
+            self.bitmaps is not None and not self.joins and self.sampling is None
+        for filter_op in planned:
+            if never_matches:
+                access, rows = 'descartado por estadísticas', 0
+            elif bitmaps and self.bitmaps.cached(filter_op):
+                access, rows = 'bitmap en caché', _scaled(node.estimated, self._selectivity(filter_op))
+            else:
+                access = filter_access(self.data, filter_op, text_indexes, date_indexes)
+                if bitmaps:
+                    access = f"bitmap, {access}"
+                rows = _scaled(node.estimated, self._selectivity(filter_op))
+            node = PlanNode(f"Filtro {describe_filter(filter_op)}", access, rows,
+                            ('filter', filter_key(filter_op)), [node])
+        selected = node.estimated
+        if self.sorting:
+            node = PlanNode(f"Orden {describe_sort(self.sorting)}", self._sort_access(state, new_filters, selected),
+                            selected, ('sort',), [node])
+        if self.paging is not None:
+            start = 'tras cursor' if self.paging['after'] else f"desde {self.paging['offset']}"
+            rows = None if selected is None else max(0, min(self.paging['limit'], selected - self.paging['offset']))
+            node = PlanNode(f"Límite {self.paging['limit']} {start}", 'búsqueda binaria' if self.paging['after'] else 'corte',
+                            rows, ('limit',), [node])
+        children = [node]
+        if self.aggregations:
+            names = ', '.join(aggregation_name(agg) for agg in self.aggregations)
+            children.append(PlanNode(f"Agregación {names}", 'sobre la selección sin ordenar', 1, ('aggregate',)))
+        return QueryPlan(PlanNode('Resultado', None, node.estimated, ('result',), children))
+
+    def _cache_hit_plan(self):
+        node = PlanNode('Resultado', 'caché de resultados', None, ('result',))
+        if self.paging is not None:
+            node.children.append(PlanNode(f"Límite {self.paging['limit']}", 'corte', None, ('limit',)))
+        return QueryPlan(node)
+
+    def _scan_node(self, alias=None):
+        if alias is not None:
+            frame = self.named_data[alias]
+            return PlanNode(f"Lectura {self.named_sources[alias]}", 'read_csv', len(frame), ('scan', alias))
+        estimated = self.statistics.row_count if self.statistics is not None else len(self.data)
+        node = PlanNode(f"Lectura {self.source}", self._load_access, estimated, ('scan',))
+        if self._timings is not None and not any(key == ('scan',) for key, _, _ in self._timings):
+            # Read by an earlier statement, this print starts from the rows in memory
+            node.access = f"{self._load_access}, ya cargado"
+            node.actual = len(self.data)
+        return node
+
+    def _join_plan(self):
+        sides = [(join['alias'], set(self._named_frame(join['alias']).columns)) for join in self.joins]
+        left_filters, side_filters, remaining = push_down(self.filters, set(self.data.columns), sides)
+        node = self._pushdown_plan(self._scan_node(), left_filters, None)
+        for join in self.joins:
+            alias = join['alias']
+            right = self._pushdown_plan(self._scan_node(alias), side_filters[alias], alias)
+            node = PlanNode(f"Join {alias} ({join['left_column']} = {join['right_column']})", 'hash join',
+                            None, ('join', alias), [node, right])
+        return node, remaining
+
+    def _pushdown_plan(self, node, filters, side):
+        seen = set()
+        for filter_op in filters:
+            if filter_key(filter_op) in seen:
+                continue
+            seen.add(filter_key(filter_op))
+            # The statistics describe the main file only
+            selectivity = self._selectivity(filter_op) if side is None else UNKNOWN_SELECTIVITY
+            node = PlanNode(f"Filtro bajo el join {describe_filter(filter_op)}", 'recorrido vectorizado',
+                            _scaled(node.estimated, selectivity), ('pushdown', side, filter_key(filter_op)), [node])
+        return node
+
+    def _selectivity(self, filter_op):
+        stats = None
+        if self.statistics is not None and filter_op.get('expression') is None:
+            stats = self.statistics.column(filter_op['column'])
+        return UNKNOWN_SELECTIVITY if stats is None else stats.selectivity(filter_op['operator'], filter_op['value'])
+
+    def _sort_access(self, state, new_filters, rows):
+        keys = sort_keys(self.sorting)
+        if state is not None and not new_filters and state['sorted'] is not None \
+                and state['sorted'][0] == (state['version'], keys):
+            return 'orden reutilizado'
+        if self.joins or self.sort_indexes is None:
+            return 'sort_values estable'
+        if self.sort_indexes.cached(keys):
+            return 'permutación en caché'
+        if rows is not None and rows < len(self.data) * WALK_FRACTION:
+            return 'rangos de la selección'
+        return 'permutación nueva'
+
+    def _uses_bitmaps(self, state):
+        # Only selections of the whole loaded dataset, not of a join or a sample
+        return self.bitmaps is not None and not self.joins and state['data'] is self.data \
+            and (state['frame'] is self.data or state['bitmap'] is not None)
+
+    def _cacheable(self):
+        # Results that depend on today's date must not be reused
+        return not any(filter_op.get('expression') is not None and filter_op['expression'].time_dependent()
+                       for filter_op in self.filters)
+
+def _scaled(rows, fraction):
+    return None if rows is None else rows * fraction
+
+def _whole_number(text, label):
+    number = float(text)
+    if not number.is_integer():
+        raise ValueError(f"{label} debe ser un número entero: {text}")
+    return int(number)
+
+def parse_script(input_string):
     input_stream = InputStream(input_string)
     lexer = EmployeeDSLLexer(input_stream)
     token_stream = CommonTokenStream(lexer)
     parser = EmployeeDSLParser(token_stream)
-    tree = parser.program()
-    interpreter = EmployeeDSLInterpreter()
+    return parser.program()
+
+def parse_and_interpret(input_string, materialize=True, incremental=False, result_cache=None, params=None,
+                        loader='pandas', explain=False, limits=None, cancel_token=None, backend='pandas'):
+    # limits is a QueryLimits; cancel_token a CancellationToken (or threading.Event) another thread may trigger
+    tree = parse_script(input_string)
+    interpreter = EmployeeDSLInterpreter(materialize=materialize, incremental=incremental,
+                                         result_cache=result_cache, params=params, loader=loader, explain=explain,
+                                         cancel_event=cancel_token, limits=limits, backend=backend)
     result = interpreter.visit(tree)
     return result
+
+def parse_and_interpret_all(input_string, materialize=True, incremental=False, result_cache=None, params=None,
+                            loader='pandas', explain=False, limits=None, cancel_token=None, backend='pandas'):
+    # One result per print statement, in order
+    tree = parse_script(input_string)
+    interpreter = EmployeeDSLInterpreter(materialize=materialize, incremental=incremental,
+                                         result_cache=result_cache, params=params, loader=loader, explain=explain,
+                                         cancel_event=cancel_token, limits=limits, backend=backend)
+    result = interpreter.visit(tree)
+    return interpreter.results or [result]
+
+def export_script(input_string, destination=None, fmt='ndjson', chunk_size=10000, loader='pandas',
+                  limits=None, cancel_token=None, backend='pandas'):
+    # Runs the script without building filtered_data and streams the rows out
+    tree = parse_script(input_string)
+    interpreter = EmployeeDSLInterpreter(materialize=False, loader=loader, cancel_event=cancel_token, limits=limits,
+                                         backend=backend)
+    if destination is None:
+        # Keep the DEBUG trace out of the exported stream
+        with contextlib.redirect_stdout(sys.stderr):
+            result = interpreter.visit(tree)
+    else:
+        result = interpreter.visit(tree)
+    if limits is not None or cancel_token is not None:
+        # Time and cancellation are also checked between chunks; cached results are shared, so a copy carries the check
+        result = copy.copy(result)
+        result.checkpoint = interpreter._checkpoint
+    result.write(destination, fmt, chunk_size)
+    return result
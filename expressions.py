@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Expression trees are nested tuples built by the interpreter:
+#   ('column', name) | ('number', value) | ('binary', op, left, right) | ('call', name, arg)
+
+BINARY_OPERATORS = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.divide,
+}
+
+COMPARISONS = {
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+def _days_since(values):
+    dates = pd.to_datetime(values, errors='coerce')
+    today = pd.Timestamp.today().normalize()
+    return ((today - dates) / pd.Timedelta(days=1)).to_numpy(dtype='float64', na_value=np.nan)
+
+def _years_since(values):
+    return _days_since(values) / 365.25
+
+def _year(values):
+    dates = pd.to_datetime(values, errors='coerce')
+    return pd.Series(dates).dt.year.to_numpy(dtype='float64', na_value=np.nan)
+
+# Functions whose value changes with the current date
+TIME_DEPENDENT_FUNCTIONS = ('days_since', 'years_since')
+
+FUNCTIONS = {
+    'days_since': _days_since,
+    'years_since': _years_since,
+    'year': _year,
+}
+
+class ExpressionError(ValueError):
+    pass
+
+def expression_text(tree):
+    """Readable form of an expression tree, used for DEBUG output and result keys"""
+    kind = tree[0]
+    if kind == 'column':
+        return tree[1]
+    if kind == 'number':
+        return repr(tree[1])
+    if kind == 'call':
+        return f"{tree[1]}({expression_text(tree[2])})"
+    return f"({expression_text(tree[2])} {tree[1]} {expression_text(tree[3])})"
+
+class CompiledExpression:
+    """Arithmetic expression over columns evaluated as whole-array operations"""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.text = expression_text(tree)
+        self.variables = {}
+        self.source = self._compile(tree)
+
+    def _compile(self, tree):
+        # Build a numexpr source string; columns and function calls become named inputs
+        kind = tree[0]
+        if kind == 'number':
+            return repr(float(tree[1]))
+        if kind == 'binary':
+            return f"({self._compile(tree[2])} {tree[1]} {self._compile(tree[3])})"
+        if kind == 'call' and tree[1] not in FUNCTIONS:
+            raise ExpressionError(f"Función desconocida: {tree[1]}")
+        for name, node in self.variables.items():
+            if node == tree:
+                return name
+        name = f"v{len(self.variables)}"
+        self.variables[name] = tree
+        return name
+
+    def columns(self):
+        found = []
+        def walk(node):
+            if node[0] == 'column':
+                if node[1] not in found:
+                    found.append(node[1])
+            elif node[0] == 'binary':
+                walk(node[2])
+                walk(node[3])
+            elif node[0] == 'call':
+                walk(node[2])
+        walk(self.tree)
+        return found
+
+    def time_dependent(self):
+        def walk(node):
+            if node[0] == 'binary':
+                return walk(node[2]) or walk(node[3])
+            if node[0] == 'call':
+                return node[1] in TIME_DEPENDENT_FUNCTIONS or walk(node[2])
+            return False
+        return walk(self.tree)
+
+    def _inputs(self, frame):
+        inputs = {}
+        for name, node in self.variables.items():
+            if node[0] == 'column':
+                inputs[name] = _numeric_column(frame, node[1])
+            else:
+                inputs[name] = FUNCTIONS[node[1]](self._raw_input(frame, node[2]))
+        return inputs
+
+    def _raw_input(self, frame, node):
+        # Function arguments may be non-numeric (e.g. a date column)
+        if node[0] == 'column':
+            if node[1] not in frame.columns:
+                raise ExpressionError(f"Columna desconocida: {node[1]}")
+            return frame[node[1]]
+        return CompiledExpression(node).evaluate(frame)
+
+    def _evaluate_numpy(self, node, inputs):
+        kind = node[0]
+        if kind == 'number':
+            return float(node[1])
+        if kind == 'binary':
+            left = self._evaluate_numpy(node[2], inputs)
+            right = self._evaluate_numpy(node[3], inputs)
+            return BINARY_OPERATORS[node[1]](left, right)
+        for name, variable in self.variables.items():
+            if variable == node:
+                return inputs[name]
+
+    def evaluate(self, frame):
+        """Return the expression value for every row of frame as a float array"""
+        inputs = self._inputs(frame)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if numexpr is not None:
+                values = numexpr.evaluate(self.source, local_dict=inputs)
+            else:
+                values = self._evaluate_numpy(self.tree, inputs)
+        return np.broadcast_to(values, (len(frame),))
+
+    def mask(self, frame, operator, value):
+        """Evaluate the expression and the comparison in a single pass, returning a boolean mask"""
+        if isinstance(value, str):
+            raise ExpressionError(f"No se puede comparar la expresión {self.text} con el texto '{value}'")
+        inputs = self._inputs(frame)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if numexpr is not None:
+                if operator == 'between':
+                    source = f"(({self.source}) >= {float(value[0])!r}) & (({self.source}) <= {float(value[1])!r})"
+                else:
+                    source = f"({self.source}) {operator} {float(value)!r}"
+                selected = numexpr.evaluate(source, local_dict=inputs)
+            else:
+                values = self._evaluate_numpy(self.tree, inputs)
+                if operator == 'between':
+                    selected = (values >= value[0]) & (values <= value[1])
+                else:
+                    selected = COMPARISONS[operator](values, value)
+        return np.broadcast_to(selected, (len(frame),))
+
+def _numeric_column(frame, column):
+    if column not in frame.columns:
+        raise ExpressionError(f"Columna desconocida: {column}")
+    try:
+        return frame[column].to_numpy(dtype='float64', na_value=np.nan)
+    except (TypeError, ValueError):
+        raise ExpressionError(f"La columna '{column}' no es numérica y no puede usarse en una expresión")
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+class JoinError(ValueError):
+    pass
+
+def _build_table(keys):
+    # Group the build-side positions by key: positions of key k are order[starts[k]:starts[k] + counts[k]]
+    codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+    valid = codes >= 0
+    order = np.flatnonzero(valid)[np.argsort(codes[valid], kind='stable')]
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(counts) else counts
+    return pd.Index(uniques), order, starts, counts
+
+def _probe(table, probe_keys):
+    uniques, order, starts, counts = table
+    codes = uniques.get_indexer(probe_keys) if len(uniques) else np.full(len(probe_keys), -1)
+    matched = np.flatnonzero(codes >= 0)
+    repeats = counts[codes[matched]]
+    probe_positions = np.repeat(matched, repeats)
+    # Offset of every output row inside its key group
+    group_starts = np.repeat(starts[codes[matched]], repeats)
+    offsets = np.arange(len(probe_positions)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    build_positions = order[group_starts + offsets]
+    return probe_positions, build_positions
+
+def joined_columns(left_columns, right_columns, left_on, right_on, alias):
+    """Output names of the right-hand columns; clashes are prefixed with the dataset alias"""
+    names = {}
+    for column in right_columns:
+        if column == right_on and right_on == left_on:
+            continue
+        names[column] = f"{alias}.{column}" if column in left_columns else column
+    return names
+
+def iter_hash_join(left, right, left_on, right_on, alias, chunk_size=None, checkpoint=None):
+    """Inner hash join that yields the output in chunks.
+
+    Output rows follow the order of the left input. With chunk_size the
+    table is built on the right input and the left input is probed in
+    slices, so only one chunk of joined rows exists at a time. Without it
+    the table is built on the smaller input and the output comes as one
+    chunk. checkpoint, if given, is called with the number of rows joined
+    so far (the next chunk included) before each chunk is assembled, and
+    may raise to stop.
+    """
+    if left_on not in left.columns:
+        raise JoinError(f"Columna de unión desconocida: {left_on}")
+    if right_on not in right.columns:
+        raise JoinError(f"Columna de unión desconocida en {alias}: {right_on}")
+    right_names = joined_columns(set(left.columns), right.columns, left_on, right_on, alias)
+    right_part = right[list(right_names)].rename(columns=right_names)
+    streamed = chunk_size is not None
+    chunk_size = chunk_size or max(len(left), 1)
+    joined = 0
+    if streamed or len(right) <= len(left):
+        # Build on the right side, probe with slices of the left side
+        table = _build_table(right[right_on].to_numpy())
+        for start in range(0, max(len(left), 1), chunk_size):
+            chunk = left.iloc[start:start + chunk_size]
+            left_positions, right_positions = _probe(table, chunk[left_on].to_numpy())
+            joined += len(left_positions)
+            if checkpoint is not None:
+                checkpoint(joined)
+            yield _assemble(chunk, right_part, left_positions, right_positions)
+    else:
+        # Build on the smaller left side and probe it with the whole right side
+        table = _build_table(left[left_on].to_numpy())
+        right_positions, left_positions = _probe(table, right[right_on].to_numpy())
+        # Restore the left order so the result does not depend on which side was built
+        order = np.lexsort((right_positions, left_positions))
+        left_positions, right_positions = left_positions[order], right_positions[order]
+        if checkpoint is not None:
+            checkpoint(len(left_positions))
+        yield _assemble(left, right_part, left_positions, right_positions)
+
+def _assemble(left, right_part, left_positions, right_positions):
+    left_rows = left.iloc[left_positions].reset_index(drop=True)
+    right_rows = right_part.iloc[right_positions].reset_index(drop=True)
+    return pd.concat([left_rows, right_rows], axis=1)
+
+def hash_join(left, right, left_on, right_on, alias, chunk_size=None, checkpoint=None, keep=None):
+    """The whole join as one DataFrame; keep, if given, filters each chunk before it is kept"""
+    chunks = []
+    for chunk in iter_hash_join(left, right, left_on, right_on, alias, chunk_size, checkpoint):
+        chunks.append(chunk if keep is None else keep(chunk))
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def filter_columns(filter_op):
+    expression = filter_op.get('expression')
+    if expression is not None:
+        return expression.columns()
+    return [filter_op['column']]
+
+def push_down(filters, left_columns, sides):
+    """Split filters into the ones that can run below the joins.
+
+    sides is a list of (alias, columns). Returns (left_filters,
+    side_filters, remaining): a filter goes to the left input when all its
+    columns exist there, otherwise to the single side dataset that has
+    them (either plain or as alias.column). Anything else runs after the
+    joins.
+    """
+    left_filters = []
+    side_filters = {alias: [] for alias, _ in sides}
+    remaining = []
+    for filter_op in filters:
+        columns = filter_columns(filter_op)
+        if all(column in left_columns for column in columns):
+            left_filters.append(filter_op)
+            continue
+        target = None
+        for alias, side_columns in sides:
+            if filter_op.get('expression') is None:
+                column = columns[0]
+                if column.startswith(f"{alias}.") and column[len(alias) + 1:] in side_columns:
+                    target = (alias, dict(filter_op, column=column[len(alias) + 1:]))
+                    break
+                if column in side_columns:
+                    target = (alias, filter_op)
+                    break
+            elif all(column in side_columns for column in columns):
+                target = (alias, filter_op)
+                break
+        if target is None:
+            remaining.append(filter_op)
+        else:
+            side_filters[target[0]].append(target[1])
+    return left_filters, side_filters, remaining
@@ -0,0 +1,250 @@
+import io
+import os
+import json
+import threading
+import pandas as pd
+from aggregation import AggregationEngine
+from column_stats import StatisticsCatalog, file_fingerprint, load_statistics, save_statistics
+from dates import read_csv
+from parallel_csv import last_record_end
+
+BLOCK_SIZE = 64 * 1024 * 1024
+TAIL_CHECK_BYTES = 64
+# Version 2 keeps AggregationEngine partial states instead of separate sums and counts
+STATE_VERSION = 2
+
+class AppendOnlyCsv:
+    """Reads a CSV file that only grows, returning the rows appended since the last read.
+
+    Only complete records are consumed: a row that is still being written
+    (no trailing newline yet, or a quoted field still open) is picked up on
+    the next read. If the header, the size or the bytes just before the
+    saved offset change, the file was rewritten and reading starts over.
+    """
+
+    def __init__(self, filename, offset=0, header=None, tail_check=None):
+        self.filename = filename
+        self.offset = offset
+        self.header = header
+        self.tail_check = tail_check
+
+    def to_dict(self):
+        return {
+            'offset': self.offset,
+            'header': self.header.decode('utf-8') if self.header is not None else None,
+            'tail_check': self.tail_check
+        }
+
+    @classmethod
+    def from_dict(cls, filename, data):
+        header = data.get('header')
+        return cls(filename, data.get('offset', 0),
+                   header.encode('utf-8') if header is not None else None,
+                   data.get('tail_check'))
+
+    def _tail(self, f, offset):
+        start = max(offset - TAIL_CHECK_BYTES, 0)
+        f.seek(start)
+        return f.read(offset - start).hex()
+
+    def check(self):
+        """Return True when the saved offset is still valid for the file on disk"""
+        if self.header is None:
+            return False
+        size = os.path.getsize(self.filename)
+        if size < self.offset:
+            return False
+        with open(self.filename, 'rb') as f:
+            if f.readline() != self.header:
+                return False
+            return self._tail(f, self.offset) == self.tail_check
+
+    def read_new_rows(self, block_size=BLOCK_SIZE):
+        """Return (reset, frames) with the rows appended since the last call"""
+        reset = not self.check()
+        if reset:
+            with open(self.filename, 'rb') as f:
+                self.header = f.readline()
+            self.offset = len(self.header)
+        frames = list(self.iter_range(self.offset, os.path.getsize(self.filename), block_size, advance=True))
+        return reset, frames
+
+    def iter_range(self, start, end, block_size=BLOCK_SIZE, advance=False):
+        """Parse the complete records between two byte offsets in blocks of about block_size bytes"""
+        with open(self.filename, 'rb') as f:
+            position = start
+            pending = b''
+            while position < end:
+                f.seek(position)
+                block = pending + f.read(min(block_size, end - position))
+                position = f.tell()
+                # Only a newline outside quotes ends a record, as in parallel_csv
+                cut = last_record_end(block)
+                if cut == 0:
+                    pending = block
+                    continue
+                pending = block[cut:]
+                lines = block[:cut]
+                if advance:
+                    self.offset += len(lines)
+                    self.tail_check = self._tail(f, self.offset)
+                yield read_csv(io.BytesIO(self.header + lines))
+
+class StandingQuery:
+    """Filters and aggregations of a script whose results are maintained incrementally.
+
+    The aggregates are kept as AggregationEngine partial states: each batch
+    of appended rows adds one partial, with every column counted once
+    however many aggregates name it.
+    """
+
+    def __init__(self, name, script, filters, aggregations, state=None):
+        self.name = name
+        self.script = script
+        self.filters = filters
+        self.aggregations = aggregations
+        self.engine = AggregationEngine(aggregations)
+        self.partial = self.engine.state_from_dict(state) if state else self.engine.empty()
+
+    def reset(self):
+        self.partial = self.engine.empty()
+
+    def update(self, frame):
+        from employee_dsl_interpreter import apply_filter
+        for filter_op in self.filters:
+            frame = apply_filter(frame, filter_op)
+        self.partial = self.engine.merge(self.partial, self.engine.partial(frame))
+
+    def results(self):
+        return self.engine.finalize(self.partial)
+
+    def state(self):
+        return self.engine.state_to_dict(self.partial)
+
+def compile_standing_query(name, script, state=None):
+    # Imported here because the interpreter itself imports this module for incremental loads
+    from employee_dsl_interpreter import EmployeeDSLInterpreter, parse_script
+    interpreter = EmployeeDSLInterpreter()
+    for statement in parse_script(script).statement():
+        if statement.loadStatement() or statement.printStatement():
+            continue
+        interpreter.visit(statement)
+    for filter_op in interpreter.filters:
+        expression = filter_op.get('expression')
+        if expression is not None and expression.time_dependent():
+            raise ValueError(f"El filtro {expression.text} depende de la fecha actual y no puede mantenerse incrementalmente")
+    for agg in interpreter.aggregations:
+        if agg.get('function') not in ('count', 'sum', 'average'):
+            raise ValueError(f"La agregación {agg.get('function')} no puede mantenerse incrementalmente")
+    return StandingQuery(name, script, interpreter.filters, interpreter.aggregations, state)
+
+class IncrementalAggregator:
+    """Keeps count/sum/average of registered scripts up to date for an append-only CSV.
+
+    The byte offset, the aggregate state of every standing query and the
+    column statistics are persisted, so each refresh only parses the rows
+    appended since the previous one.
+    """
+
+    def __init__(self, filename, state_file=None):
+        self.filename = filename
+        self.state_file = state_file or f"{filename}.incremental.json"
+        self.reader = AppendOnlyCsv(filename)
+        self.queries = {}
+        self.statistics = None
+        self._pending = set()
+        self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != STATE_VERSION:
+            return
+        self.reader = AppendOnlyCsv.from_dict(self.filename, data.get('reader', {}))
+        for name, query in data.get('queries', {}).items():
+            self.queries[name] = compile_standing_query(name, query['script'], query['state'])
+        if data.get('statistics'):
+            self.statistics = StatisticsCatalog.from_dict(data['statistics'])
+
+    def save(self):
+        data = {
+            'version': STATE_VERSION,
+            'reader': self.reader.to_dict(),
+            'queries': {name: {'script': query.script, 'state': query.state()}
+                        for name, query in self.queries.items() if name not in self._pending},
+            'statistics': self.statistics.to_dict() if self.statistics is not None else None
+        }
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def register(self, name, script):
+        """Add a standing query. Its aggregates are backfilled on the next refresh"""
+        existing = self.queries.get(name)
+        if existing is not None and existing.script == script:
+            return existing
+        query = compile_standing_query(name, script)
+        self.queries[name] = query
+        self._pending.add(name)
+        return query
+
+    def unregister(self, name):
+        self.queries.pop(name, None)
+        self._pending.discard(name)
+
+    def refresh(self):
+        """Read the appended rows, update every standing query and return their aggregations"""
+        reset = not self.reader.check()
+        if not reset and self._pending:
+            # New queries need the rows that were already consumed by the others
+            for frame in self.reader.iter_range(len(self.reader.header), self.reader.offset):
+                for name in self._pending:
+                    self.queries[name].update(frame)
+        reset, frames = self.reader.read_new_rows()
+        if reset:
+            for query in self.queries.values():
+                query.reset()
+            self.statistics = None
+        for frame in frames:
+            for query in self.queries.values():
+                query.update(frame)
+            self._update_statistics(frame)
+        self._pending.clear()
+        if self.statistics is not None:
+            self.statistics.fingerprint = file_fingerprint(self.filename)
+            save_statistics(self.filename, self.statistics)
+        self.save()
+        return {name: query.results() for name, query in self.queries.items()}
+
+    def _update_statistics(self, frame):
+        if self.statistics is None:
+            self.statistics = StatisticsCatalog.from_frame(frame)
+        elif not self.statistics.merge_frame(frame):
+            # A column changed type: fall back to a full pass over the file
+            self.statistics = load_statistics(self.filename, read_csv(self.filename))
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+def load_incremental(filename):
+    """Return (frame, statistics) for a CSV, parsing only the rows appended since the last call"""
+    key = os.path.abspath(filename)
+    with _loaded_lock:
+        cached = _loaded.get(key)
+        if cached is None:
+            cached = _loaded[key] = {'reader': AppendOnlyCsv(filename), 'frame': None, 'statistics': None}
+        reset, frames = cached['reader'].read_new_rows()
+        if reset or cached['frame'] is None:
+            frame = pd.concat(frames, ignore_index=True) if frames else read_csv(filename)
+            cached['frame'] = frame
+            cached['statistics'] = load_statistics(filename, frame)
+        elif frames:
+            new_rows = pd.concat(frames, ignore_index=True)
+            cached['frame'] = pd.concat([cached['frame'], new_rows], ignore_index=True)
+            fingerprint = file_fingerprint(filename)
+            if not cached['statistics'].merge_frame(new_rows, fingerprint):
+                cached['statistics'] = StatisticsCatalog.from_frame(cached['frame'], fingerprint)
+            save_statistics(filename, cached['statistics'])
+        return cached['frame'], cached['statistics']
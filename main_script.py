@@ -1,7 +1,15 @@
 import os
 import sys
 import json
-from employee_dsl_interpreter import parse_and_interpret
+
+# EMPLOYEE_DSL_ENGINE=numpy runs the scripts on numpy_engine, which starts without importing pandas
+ENGINE = os.environ.get('EMPLOYEE_DSL_ENGINE', 'pandas')
+if ENGINE == 'numpy':
+    from numpy_engine import parse_and_interpret, export_script
+elif ENGINE == 'pandas':
+    from employee_dsl_interpreter import parse_and_interpret, export_script
+else:
+    sys.exit(f"Motor desconocido en EMPLOYEE_DSL_ENGINE: {ENGINE}. Use 'pandas' o 'numpy'")
 
 def print_result(result, script_name):
     """Format and print the execution result"""
@@ -169,7 +177,6 @@ def interactive_mode():
 import os
 import sys
 import json
-import pandas as pd
 from antlr4 import *
 from EmployeeDSLLexer import EmployeeDSLLexer
 from EmployeeDSLParser import EmployeeDSLParser
@@ -183,27 +190,51 @@ def print_result(result, script_name):
     
     # Print number of records
     print(f"Registros encontrados: {result['record_count']}")
+    if 'sample' in result:
+        sample = result['sample']
+        print(f"Muestra: {sample['rows']} de {sample['population']} registros ({sample['fraction']:.2%})")
+    if 'page' in result:
+        page = result['page']
+        print(f"Página: filas {page['offset'] + 1} a {page['offset'] + result['record_count']} de {page['total']}")
+        if page['next_cursor']:
+            print(f"Siguiente página: limit {page['limit']} after \"{page['next_cursor']}\";")
     
     # Print aggregations
     if result['aggregations']:
         print("\nAgregaciones:")
         for agg_name, agg_value in result['aggregations'].items():
             # Format the function and column name
-            parts = agg_name.split('_', 1)
-            func = parts[0]
-            column = parts[1] if len(parts) > 1 else ""
+            if agg_name.startswith('count_distinct_'):
+                func, column = 'count_distinct', agg_name[len('count_distinct_'):]
+            elif agg_name.startswith('approx_count_distinct_'):
+                func, column = 'approx_count_distinct', agg_name[len('approx_count_distinct_'):]
+            elif agg_name.startswith('percentile_') or agg_name.startswith('approx_percentile_'):
+                parts = agg_name.split('_', 3 if agg_name.startswith('approx_') else 2)
+                func, column = '_'.join(parts[:-1]), parts[-1]
+            elif agg_name.startswith('approx_median_'):
+                func, column = 'approx_median', agg_name[len('approx_median_'):]
+            else:
+                parts = agg_name.split('_', 1)
+                func = parts[0]
+                column = parts[1] if len(parts) > 1 else ""
+            label = func.replace('_', ' ').capitalize()
             
             # Format the value based on the type
-            if func == 'count':
+            if func in ('count', 'count_distinct', 'approx_count_distinct'):
                 formatted_value = f"{agg_value}"
-            elif func == 'sum':
+            elif func in ('sum', 'average', 'stddev'):
                 formatted_value = f"{agg_value:.2f}"
-            elif func == 'average':
+            elif isinstance(agg_value, float):
                 formatted_value = f"{agg_value:.2f}"
             else:
                 formatted_value = str(agg_value)
+            
+            # Sampled queries carry a 95% confidence interval for the scaled aggregates
+            interval = result.get('confidence_intervals', {}).get(agg_name)
+            if interval is not None:
+                formatted_value += f" (IC 95%: {interval[0]:.2f} - {interval[1]:.2f})"
                 
-            print(f"{func.capitalize()} de {column}: {formatted_value}")
+            print(f"{label} de {column}: {formatted_value}")
     
     # Print first few records of filtered data
     if result['record_count'] > 0:
@@ -214,23 +245,28 @@ def print_result(result, script_name):
     # If there are more records, indicate how many more
     if result['record_count'] > 5:
         print(f"... y {result['record_count'] - 5} registros más.")
+
+    # Plan with estimated and actual rows, from explain analyze or --explain
+    if 'plan' in result:
+        print("\nPlan de consulta:")
+        print(result['plan'].render())
     
     print(f"{'=' * 50}\n")
 
-def run_script_file(script_file):
+def run_script_file(script_file, explain=False):
     """Run a script from a file"""
     with open(script_file, 'r', encoding='utf-8') as f:
         script_content = f.read()
     
     try:
-        result = parse_and_interpret(script_content)
+        result = parse_and_interpret(script_content, explain=explain)
         print_result(result, script_file)
         return True
     except Exception as e:
         print(f"Error al ejecutar el script {script_file}: {str(e)}")
         return False
 
-def run_example_scripts(scripts_dir='scripts'):
+def run_example_scripts(scripts_dir='scripts', explain=False):
     """Run all script files in the specified directory"""
     # Create scripts directory if it doesn't exist
     if not os.path.exists(scripts_dir):
@@ -249,12 +285,12 @@ def run_example_scripts(scripts_dir='scripts'):
     success_count = 0
     for script_file in sorted(script_files):
         full_path = os.path.join(scripts_dir, script_file)
-        if run_script_file(full_path):
+        if run_script_file(full_path, explain):
             success_count += 1
     
     print(f"\nEjecución completada: {success_count} de {len(script_files)} scripts ejecutados correctamente.")
 
-def run_scripts_from_json(example_file='example_scripts.json'):
+def run_scripts_from_json(example_file='example_scripts.json', explain=False):
     """Run all scripts directly from the JSON file"""
     if not os.path.exists(example_file):
         print(f"El archivo de ejemplos '{example_file}' no existe.")
@@ -269,7 +305,7 @@ def run_scripts_from_json(example_file='example_scripts.json'):
         script_num = script.get('numero', 'unknown')
         script_title = script.get('titulo', 'Sin título')
         try:
-            result = parse_and_interpret(script_content)
+            result = parse_and_interpret(script_content, explain=explain)
             print_result(result, f"Script {script_num}: {script_title}")
             success_count += 1
         except Exception as e:
@@ -301,15 +337,36 @@ def extract_examples_to_files(example_file='example_scripts.json', output_dir='s
         print(f"Script {num} extraído a {filename}")
 
 
-def run_specific_script(script_number, scripts_dir='scripts'):
+def run_specific_script(script_number, scripts_dir='scripts', explain=False):
     """Run a specific script by number"""
     script_file = f"{scripts_dir}/script_{script_number.zfill(2)}.dsl"
     if os.path.exists(script_file):
-        run_script_file(script_file)
+        run_script_file(script_file, explain)
     else:
         print(f"El script {script_number} no existe en '{script_file}'")
 
-def interactive_mode():
+def export_specific_script(script_number, fmt='ndjson', output_file=None, example_file='example_scripts.json'):
+    """Run a script from the JSON file and stream its rows as NDJSON or CSV"""
+    if fmt not in ('ndjson', 'csv'):
+        print(f"Formato desconocido: {fmt}. Use 'ndjson' o 'csv'.")
+        return
+    if not os.path.exists(example_file):
+        print(f"El archivo de ejemplos '{example_file}' no existe.")
+        return
+    with open(example_file, 'r', encoding='utf-8') as f:
+        scripts = json.load(f)
+    selected = [s for s in scripts if str(s.get('numero')) == str(script_number)]
+    if not selected:
+        print(f"El script {script_number} no existe en '{example_file}'")
+        return
+    try:
+        result = export_script(selected[0].get('contenido', ''), output_file, fmt)
+        if output_file:
+            print(f"{result['record_count']} registros exportados a {output_file}")
+    except Exception as e:
+        print(f"Error al exportar el script {script_number}: {str(e)}", file=sys.stderr)
+
+def interactive_mode(explain=False):
     """Run in interactive mode"""
     print("Modo interactivo del DSL para Empleados")
     print("Ingrese comandos DSL línea por línea. Escriba 'exit' para salir.")
@@ -326,10 +383,10 @@ def interactive_mode():
         
         # Check if the command is complete (ends with semicolon)
         if line.strip().endswith(';'):
-            # Check if it's a print command
-            if line.strip().startswith('print'):
+            # Check if it's a print or explain command
+            if line.strip().startswith(('print', 'explain')):
                 try:
-                    result = parse_and_interpret(script)
+                    result = parse_and_interpret(script, explain=explain)
                     print_result(result, "Consulta interactiva")
                     script = ""  # Reset for the next query
                 except Exception as e:
@@ -376,6 +433,8 @@ def select_test_script(example_file='example_scripts.json'):
 
 def select_columns(csv_file='empleados.csv'):
     """Let the user select one or more columns from the CSV file"""
+    # Imported here so the numpy engine can run scripts without loading pandas
+    import pandas as pd
     if not os.path.exists(csv_file):
         print(f"El archivo '{csv_file}' no existe.")
         return None
@@ -405,6 +464,7 @@ def select_columns(csv_file='empleados.csv'):
 
 def display_selected_columns(columns, csv_file='empleados.csv'):
     """Display the selected columns from the CSV file"""
+    import pandas as pd
     if not os.path.exists(csv_file):
         print(f"El archivo '{csv_file}' no existe.")
         return
@@ -448,15 +508,23 @@ def menu_mode():
 
 def main():
     """Main function to run the DSL interpreter"""
+    # --explain can go anywhere on the command line
+    explain = '--explain' in sys.argv
+    if explain:
+        sys.argv = [arg for arg in sys.argv if arg != '--explain']
     if len(sys.argv) < 2:
-        print("Uso: python main.py [OPCIÓN]")
+        print("Uso: python main.py [OPCIÓN] [--explain]")
         print("Opciones:")
         print("  extract           - Extrae los scripts de ejemplo a archivos individuales")
         print("  run-all           - Ejecuta todos los scripts de ejemplo")
         print("  run NUMBER        - Ejecuta un script específico por número")
         print("  run-json          - Ejecuta todos los scripts directamente desde el JSON")
+        print("  export NUMBER [ndjson|csv] [ARCHIVO]")
+        print("                    - Exporta las filas de un script en streaming (stdout si no hay archivo)")
         print("  interactive       - Modo interactivo para ejecutar comandos DSL")
         print("  menu              - Menú interactivo para tests y columnas")
+        print("  --explain         - Muestra el plan de cada consulta con filas estimadas, reales y tiempos")
+        print("Con EMPLOYEE_DSL_ENGINE=numpy los scripts se ejecutan con el motor NumPy, sin cargar pandas")
         return
     
     command = sys.argv[1].lower()
@@ -464,13 +532,17 @@ def main():
     if command == 'extract':
         extract_examples_to_files()
     elif command == 'run-all':
-        run_example_scripts()
+        run_example_scripts(explain=explain)
     elif command == 'run-json':
-        run_scripts_from_json()
+        run_scripts_from_json(explain=explain)
     elif command == 'run' and len(sys.argv) > 2:
-        run_specific_script(sys.argv[2])
+        run_specific_script(sys.argv[2], explain=explain)
+    elif command == 'export' and len(sys.argv) > 2:
+        fmt = sys.argv[3].lower() if len(sys.argv) > 3 else 'ndjson'
+        output_file = sys.argv[4] if len(sys.argv) > 4 else None
+        export_specific_script(sys.argv[2], fmt, output_file)
     elif command == 'interactive':
-        interactive_mode()
+        interactive_mode(explain)
     elif command == 'menu':
         menu_mode()
     else:
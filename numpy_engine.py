@@ -0,0 +1,506 @@
+import re
+import csv
+import sys
+import json
+import math
+import contextlib
+import numpy as np
+from antlr4 import InputStream, CommonTokenStream
+from EmployeeDSLLexer import EmployeeDSLLexer
+from EmployeeDSLParser import EmployeeDSLParser
+from EmployeeDSLVisitor import EmployeeDSLVisitor
+
+# This module must not import pandas, nor any module of the interpreter that does;
+# the constants below follow dates.py, expressions.py, text_index.py and aggregation.py.
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+INT_PATTERN = re.compile(r'[+-]?[0-9]+')
+RANGE_OPERATORS = ('>', '<', '>=', '<=', '==', '!=', 'between')
+TEXT_OPERATORS = ('starts_with', 'contains', 'like')
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'average', 'min', 'max')
+BLOCK_SIZE = 65536
+DEFAULT_CHUNK_SIZE = 10000
+# Decimals pandas keeps when it writes floats to JSON
+FLOAT_DECIMALS = 10
+
+COMPARISONS = {
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+# Cells read as missing, as in pandas.read_csv
+NA_VALUES = frozenset(['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                       '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'])
+BOOLEANS = {'True': True, 'TRUE': True, 'true': True, 'False': False, 'FALSE': False, 'false': False}
+
+class FilterTypeError(ValueError):
+    """The literal of a filter cannot be compared with the values of its column"""
+
+class UnsupportedFeature(ValueError):
+    """The script uses something only the pandas engine runs"""
+
+class Table:
+    """A CSV file as one NumPy array per column, in file order.
+
+    Integer columns without gaps are int64, other numbers float64 with NaN,
+    YYYY-MM-DD columns datetime64[D] with NaT, True/False columns bool and
+    everything else object arrays of str with None for a missing value.
+    """
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def column(self, name):
+        if name not in self.columns:
+            raise KeyError(name)
+        return self.columns[name]
+
+def read_csv(filename):
+    """Table of a CSV file with a header row, typed like dates.read_csv types it"""
+    with open(filename, 'r', encoding='utf-8', newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"El archivo '{filename}' está vacío")
+        rows = []
+        for row in reader:
+            if not row:
+                # Blank lines are skipped, as pandas does
+                continue
+            if len(row) > len(header):
+                raise ValueError(f"Línea {reader.line_num} de '{filename}': se esperaban {len(header)} campos "
+                                 f"y hay {len(row)}")
+            if len(row) < len(header):
+                row = row + [''] * (len(header) - len(row))
+            rows.append(row)
+    cells = list(zip(*rows)) if rows else [() for _ in header]
+    return Table({name: _column(texts) for name, texts in zip(header, cells)}, len(rows))
+
+def _column(texts):
+    missing = [text in NA_VALUES for text in texts]
+    present = [text for text, absent in zip(texts, missing) if not absent]
+    if not present:
+        return np.full(len(texts), np.nan)
+    if len(present) == len(texts):
+        if all(INT_PATTERN.fullmatch(text) for text in texts):
+            values = [int(text) for text in texts]
+            if all(-2 ** 63 <= value < 2 ** 63 for value in values):
+                return np.array(values, dtype=np.int64)
+        if all(text in BOOLEANS for text in texts):
+            return np.array([BOOLEANS[text] for text in texts], dtype=bool)
+    numbers = _floats(texts, missing)
+    if numbers is not None:
+        return numbers
+    if DATE_PATTERN.fullmatch(present[0]) and all(DATE_PATTERN.fullmatch(text) for text in present):
+        try:
+            return np.array(['NaT' if absent else text for text, absent in zip(texts, missing)],
+                            dtype='datetime64[D]')
+        except ValueError:
+            # An impossible day such as 2023-02-30 keeps the column as text
+            pass
+    return np.array([None if absent else text for text, absent in zip(texts, missing)], dtype=object)
+
+def _floats(texts, missing):
+    values = np.empty(len(texts))
+    for position, (text, absent) in enumerate(zip(texts, missing)):
+        if absent:
+            values[position] = np.nan
+            continue
+        if '_' in text:
+            # float() would accept 1_000, pandas does not
+            return None
+        try:
+            values[position] = float(text)
+        except ValueError:
+            return None
+    return values
+
+def _missing(values):
+    kind = values.dtype.kind
+    if kind == 'f':
+        return np.isnan(values)
+    if kind == 'M':
+        return np.isnat(values)
+    if kind == 'O':
+        return np.equal(values, None)
+    return np.zeros(len(values), dtype=bool)
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+def coerce_date(value):
+    """datetime64 for a date literal or an ISO date string"""
+    if isinstance(value, np.datetime64) and not np.isnat(value):
+        return value
+    if isinstance(value, str):
+        try:
+            return np.datetime64(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Fecha no válida: {value!r}")
+
+def like_regex(pattern):
+    """Regular expression equivalent to a LIKE pattern: % is any run of characters, _ exactly one"""
+    parts = ['.*' if char == '%' else '.' if char == '_' else re.escape(char) for char in pattern]
+    return re.compile(''.join(parts), re.DOTALL)
+
+def filter_mask(table, filter_op):
+    """Boolean mask over the rows of table for one filter, with the pandas engine's semantics"""
+    column, operator, value = filter_op['column'], filter_op['operator'], filter_op['value']
+    values = table.column(column)
+    kind = values.dtype.kind
+    if operator in TEXT_OPERATORS:
+        if kind == 'M':
+            # pandas matches dates by their ISO text with microseconds
+            values = np.array([None if text == 'NaT' else text
+                               for text in np.datetime_as_string(values.astype('datetime64[us]'))], dtype=object)
+        elif kind != 'O':
+            raise ValueError(f"La columna '{column}' no es de texto")
+        return _text_mask(values, operator, value)
+    literals = value if isinstance(value, list) else [value]
+    if kind == 'M':
+        if any(_is_number(literal) for literal in literals):
+            raise _mismatch('de fechas', column, value)
+        return _date_mask(values, column, operator, value)
+    if kind in 'biuf':
+        if not all(_is_number(literal) for literal in literals):
+            raise _mismatch('numérica', column, value)
+        return _compare(values, operator, value)
+    if not all(isinstance(literal, str) for literal in literals):
+        raise _mismatch('de texto', column, value)
+    # Missing text only satisfies !=, like NaN in pandas
+    present = ~_missing(values)
+    mask = np.full(len(values), operator == '!=')
+    mask[present] = _compare(values[present], operator, value)
+    return mask
+
+def _mismatch(kind, column, value):
+    return FilterTypeError(f"No se puede comparar la columna {kind} '{column}' con {value!r}")
+
+def _compare(values, operator, value):
+    if operator == 'between':
+        return np.asarray((values >= value[0]) & (values <= value[1]), dtype=bool)
+    return np.asarray(COMPARISONS[operator](values, value), dtype=bool)
+
+def _date_mask(values, column, operator, value):
+    if operator not in RANGE_OPERATORS:
+        raise ValueError(f"El operador {operator} no se aplica a la columna de fecha '{column}'")
+    if operator == 'between':
+        value = [coerce_date(value[0]), coerce_date(value[1])]
+    elif operator in ('==', '!=') and isinstance(value, str) and not DATE_PATTERN.fullmatch(value):
+        # A text that is not a date never equals a date
+        return np.full(len(values), operator == '!=')
+    else:
+        value = coerce_date(value)
+    return _compare(values, operator, value)
+
+def _text_mask(values, operator, value):
+    if not isinstance(value, str):
+        raise ValueError(f"El operador {operator} requiere un texto, no {value!r}")
+    if operator == 'starts_with':
+        matches = lambda text: text.startswith(value)
+    elif operator == 'contains':
+        matches = lambda text: value in text
+    else:
+        regex = like_regex(value)
+        matches = lambda text: regex.fullmatch(text) is not None
+    return np.fromiter((text is not None and matches(text) for text in values), dtype=bool, count=len(values))
+
+def sort_positions(table, positions, sorting):
+    """positions ordered by every key of sorting: stable, missing values last"""
+    ranks = []
+    for column, ascending in zip(sorting['columns'], sorting['ascending']):
+        values = table.column(column)[positions]
+        present = ~_missing(values)
+        uniques, codes = np.unique(values[present], return_inverse=True)
+        rank = np.full(len(values), len(uniques), dtype=np.int64)
+        rank[present] = codes if ascending else len(uniques) - 1 - codes
+        ranks.append(rank)
+    # lexsort is stable and takes the primary key last
+    return positions[np.lexsort(ranks[::-1])] if ranks else positions
+
+def aggregate(table, positions, aggregations):
+    """{aggregation name: value} over the rows at positions, like AggregationEngine"""
+    results = {}
+    for agg in aggregations:
+        func, column = agg['function'], agg['column']
+        name = f'{func}_{column}'
+        if func == 'count':
+            results[name] = len(positions)
+        else:
+            results[name] = _aggregate(func, column, table.column(column)[positions])
+    return results
+
+def _aggregate(func, column, values):
+    kind = values.dtype.kind
+    if kind not in 'iuf':
+        if func in ('sum', 'average'):
+            raise ValueError(f"La columna '{column}' no es numérica")
+        values = values[~_missing(values)]
+        if not len(values):
+            return math.nan
+        value = values.min() if func == 'min' else values.max()
+        if kind == 'M':
+            return str(np.datetime_as_string(value, unit='D'))
+        return value.item() if hasattr(value, 'item') else value
+    count, total, minimum, maximum = 0, 0, None, None
+    # Same blocks and the same order of additions as AggregationEngine, so sums agree to the last bit
+    for start in range(0, len(values), BLOCK_SIZE):
+        block = values[start:start + BLOCK_SIZE]
+        if kind == 'f':
+            block = block[~np.isnan(block)]
+        if not len(block):
+            continue
+        count += len(block)
+        total = total + block.sum().item()
+        low, high = block.min().item(), block.max().item()
+        minimum = low if minimum is None else min(minimum, low)
+        maximum = high if maximum is None else max(maximum, high)
+    if func == 'sum':
+        return total
+    if func == 'average':
+        return total / count if count else math.nan
+    value = minimum if func == 'min' else maximum
+    return value if value is not None else math.nan
+
+def records(table, positions):
+    """Rows at positions as JSON-ready dicts: dates as YYYY-MM-DD, missing values as None"""
+    names = list(table.columns)
+    columns = [_plain(table.columns[name][positions]) for name in names]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+def _plain(values):
+    kind = values.dtype.kind
+    if kind == 'f':
+        return [round(value, FLOAT_DECIMALS) if math.isfinite(value) else None for value in values.tolist()]
+    if kind == 'M':
+        return [None if text == 'NaT' else text for text in np.datetime_as_string(values, unit='D').tolist()]
+    return values.tolist()
+
+class NumpyResult(dict):
+    """Result of a print statement on the NumPy engine: the table and the selected row positions"""
+
+    def __init__(self, table, positions, aggregations, materialize=True):
+        super().__init__()
+        self.table = table
+        self.positions = positions
+        self['aggregations'] = aggregations
+        self['record_count'] = len(positions) if table is not None else 0
+        if materialize:
+            self['filtered_data'] = self.to_records()
+
+    def __missing__(self, key):
+        if key == 'filtered_data':
+            self[key] = self.to_records()
+            return self[key]
+        raise KeyError(key)
+
+    def to_records(self):
+        return records(self.table, self.positions) if self.table is not None else []
+
+    def iter_records(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield the selected rows one dict at a time, converting chunk by chunk"""
+        if self.table is None:
+            return
+        for start in range(0, len(self.positions), chunk_size):
+            yield from records(self.table, self.positions[start:start + chunk_size])
+
+    def write_ndjson(self, destination=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows as NDJSON to a path, a file object or stdout"""
+        def write_rows(out_file):
+            written = 0
+            for record in self.iter_records(chunk_size):
+                out_file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                written += 1
+            return written
+        return _write(destination, write_rows)
+
+    def write_csv(self, destination=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows as CSV to a path, a file object or stdout"""
+        def write_rows(out_file):
+            if self.table is None:
+                return 0
+            writer = csv.writer(out_file, lineterminator='\n')
+            writer.writerow(list(self.table.columns))
+            written = 0
+            for record in self.iter_records(chunk_size):
+                writer.writerow(['' if value is None else value for value in record.values()])
+                written += 1
+            return written
+        return _write(destination, write_rows)
+
+    def write(self, destination=None, fmt='ndjson', chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows in the given format ('ndjson' or 'csv')"""
+        if fmt == 'ndjson':
+            return self.write_ndjson(destination, chunk_size)
+        if fmt == 'csv':
+            return self.write_csv(destination, chunk_size)
+        raise ValueError(f"Formato de salida no soportado: {fmt}")
+
+def _write(destination, write_rows):
+    if destination is None:
+        out_file = sys.stdout
+    elif isinstance(destination, (str, bytes)) or hasattr(destination, '__fspath__'):
+        with open(destination, 'w', encoding='utf-8', newline='') as out_file:
+            return write_rows(out_file)
+    else:
+        out_file = destination
+    written = write_rows(out_file)
+    out_file.flush()
+    return written
+
+class NumpyInterpreter(EmployeeDSLVisitor):
+    """Runs scripts made of load, filter, sort, aggregate and print on NumPy arrays.
+
+    Filters, sorts and aggregates keep the pandas engine's results; joins,
+    samples, pages, expressions, parameters, explain and the statistical
+    aggregates raise UnsupportedFeature.
+    """
+
+    def __init__(self, materialize=True):
+        self.materialize = materialize
+        self.table = None
+        self.filters = []
+        self.aggregations = []
+        self.sorting = None
+        self.results = []
+
+    def visitProgram(self, ctx):
+        result = None
+        for statement in ctx.statement():
+            res = self.visit(statement)
+            if isinstance(res, dict):
+                result = res
+        if result is None:
+            result = self.run_print()
+        return result
+
+    def visitLoadStatement(self, ctx):
+        if ctx.AS():
+            raise _unsupported('load ... as')
+        self.table = read_csv(ctx.STRING_LITERAL().getText()[1:-1])
+        return None
+
+    def visitJoinStatement(self, ctx):
+        raise _unsupported('join')
+
+    def visitSampleStatement(self, ctx):
+        raise _unsupported('sample')
+
+    def visitLimitStatement(self, ctx):
+        raise _unsupported('limit')
+
+    def visitExplainStatement(self, ctx):
+        raise _unsupported('explain')
+
+    def visitFilterStatement(self, ctx):
+        if ctx.AND() or ctx.OR():
+            # Both combinations narrow the selection, as in the pandas engine
+            return self.visit(ctx.filterStatement(0)) + self.visit(ctx.filterStatement(1))
+        if ctx.expression():
+            raise _unsupported('filtros sobre expresiones')
+        if ctx.COLUMN() and ctx.STRING_LITERAL() and ctx.operator():
+            filter_op = {
+                'column': ctx.STRING_LITERAL().getText()[1:-1],
+                'operator': self.visit(ctx.operator()),
+                'value': self.visit(ctx.value())
+            }
+            self.filters.append(filter_op)
+            return [filter_op]
+        return []
+
+    def visitOperator(self, ctx):
+        for operator in (ctx.GT(), ctx.LT(), ctx.GTE(), ctx.LTE(), ctx.EQ(), ctx.NEQ(), ctx.BETWEEN(),
+                         ctx.STARTS_WITH(), ctx.CONTAINS(), ctx.LIKE()):
+            if operator is not None:
+                return operator.getText()
+        return None
+
+    def visitValue(self, ctx):
+        if ctx.PARAMETER():
+            raise _unsupported('parámetros')
+        if ctx.STRING_LITERAL():
+            return ctx.STRING_LITERAL().getText()[1:-1]
+        tokens = ctx.NUMBER() or ctx.DATE_LITERAL()
+        if not tokens:
+            return None
+        convert = float if ctx.NUMBER() else coerce_date
+        values = [convert(token.getText()) for token in tokens]
+        return values if ctx.AND() else values[0]
+
+    def visitAggregateStatement(self, ctx):
+        function_ctx = ctx.aggregateFunction()
+        func = function_ctx.getText()
+        if func not in AGGREGATE_FUNCTIONS:
+            raise _unsupported(f"el agregado {' '.join(child.getText() for child in function_ctx.getChildren())}")
+        self.aggregations.append({'function': func, 'column': ctx.STRING_LITERAL().getText()[1:-1]})
+        return None
+
+    def visitSortStatement(self, ctx):
+        keys = [(key.STRING_LITERAL().getText()[1:-1], key.ASC() is not None) for key in ctx.sortKey()]
+        self.sorting = {
+            'columns': [column for column, _ in keys],
+            'ascending': [ascending for _, ascending in keys]
+        }
+        return None
+
+    def visitPrintStatement(self, ctx):
+        return self.run_print()
+
+    def run_print(self):
+        result = self._run_query()
+        self.results.append(result)
+        return result
+
+    def _run_query(self):
+        if self.table is None:
+            return NumpyResult(None, None, {}, self.materialize)
+        print(f"DEBUG: Initial data count: {self.table.rows}")
+        mask = np.ones(self.table.rows, dtype=bool)
+        for i, filter_op in enumerate(self.filters, 1):
+            mask &= filter_mask(self.table, filter_op)
+            print(f"DEBUG: After filter {i} ({filter_op['column']} {filter_op['operator']} {filter_op['value']}): "
+                  f"{int(mask.sum())} records")
+        positions = np.flatnonzero(mask)
+        # Aggregated in file order, like the pandas engine, so float sums add up in the same order
+        aggregations = aggregate(self.table, positions, self.aggregations)
+        if self.sorting:
+            positions = sort_positions(self.table, positions, self.sorting)
+        print(f"DEBUG: Final result record count: {len(positions)}")
+        return NumpyResult(self.table, positions, aggregations, self.materialize)
+
+def _unsupported(feature):
+    return UnsupportedFeature(f"El motor numpy no admite {feature}; use el motor pandas")
+
+def parse_script(input_string):
+    parser = EmployeeDSLParser(CommonTokenStream(EmployeeDSLLexer(InputStream(input_string))))
+    return parser.program()
+
+def parse_and_interpret(input_string, materialize=True, explain=False):
+    # Same entry point as the pandas engine for the options both share
+    if explain:
+        raise _unsupported('explain')
+    return NumpyInterpreter(materialize=materialize).visit(parse_script(input_string))
+
+def parse_and_interpret_all(input_string, materialize=True):
+    # One result per print statement, in order
+    interpreter = NumpyInterpreter(materialize=materialize)
+    result = interpreter.visit(parse_script(input_string))
+    return interpreter.results or [result]
+
+def export_script(input_string, destination=None, fmt='ndjson', chunk_size=DEFAULT_CHUNK_SIZE):
+    # Runs the script without building filtered_data and streams the rows out
+    interpreter = NumpyInterpreter(materialize=False)
+    tree = parse_script(input_string)
+    if destination is None:
+        # Keep the DEBUG trace out of the exported stream
+        with contextlib.redirect_stdout(sys.stderr):
+            result = interpreter.visit(tree)
+    else:
+        result = interpreter.visit(tree)
+    result.write(destination, fmt, chunk_size)
+    return result
@@ -0,0 +1,95 @@
+import json
+import base64
+import binascii
+import numpy as np
+import pandas as pd
+from dates import coerce_date, is_date_column
+from sort_index import sort_keys
+
+def paging_position(frame, paging, sorting=None):
+    """Row position of frame where the page starts: the offset, or the first row after the cursor"""
+    if paging.get('after'):
+        return position_after(frame, paging['after'], sorting)
+    return paging.get('offset', 0)
+
+def encode_cursor(frame, position, sorting=None):
+    """Opaque cursor for the row at position: its sort key values plus its row label.
+
+    The cursor does not depend on the row's position, so it stays valid
+    while rows are added or removed before it.
+    """
+    keys = sort_keys(sorting) if sorting else ()
+    payload = {
+        'sort': [[column, ascending] for column, ascending in keys],
+        'values': [_plain(frame[column].iat[position]) for column, _ in keys],
+        'row': _plain(frame.index[position])
+    }
+    text = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, sorting=None):
+    """(sort key values, row label) of a cursor made for the same sort"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        keys = [tuple(key) for key in payload['sort']]
+        values, row = payload['values'], payload['row']
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise ValueError(f"Cursor no válido: {cursor!r}")
+    if keys != list(sort_keys(sorting) if sorting else ()):
+        raise ValueError("El cursor no corresponde al orden de la consulta")
+    return values, row
+
+def position_after(frame, cursor, sorting=None):
+    """First row position of a sorted frame that comes strictly after the cursor.
+
+    Rows are ordered by their sort keys (missing values last) and then by
+    row label, the tie order of a stable sort, so a binary search over the
+    already sorted frame finds the spot without scanning it.
+    """
+    values, row = decode_cursor(cursor, sorting)
+    keys = sort_keys(sorting) if sorting else ()
+    columns = [frame[column] for column, _ in keys]
+    target = [_column_value(series, value) for series, value in zip(columns, values)]
+    directions = [ascending for _, ascending in keys]
+    low, high = 0, len(frame)
+    while low < high:
+        middle = (low + high) // 2
+        current = [series.iat[middle] for series in columns]
+        if _compare(current, frame.index[middle], target, row, directions) <= 0:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+def _compare(values, label, target, target_label, directions):
+    for value, other, ascending in zip(values, target, directions):
+        missing, other_missing = _missing(value), _missing(other)
+        if missing or other_missing:
+            if missing and other_missing:
+                continue
+            # Missing values sort last in both directions
+            return 1 if missing else -1
+        if value == other:
+            continue
+        order = -1 if value < other else 1
+        return order if ascending else -order
+    return int(label > target_label) - int(label < target_label)
+
+def _missing(value):
+    return value is None or (not isinstance(value, str) and pd.isna(value))
+
+def _column_value(series, value):
+    if value is not None and is_date_column(series):
+        return coerce_date(value)
+    return value
+
+def _plain(value):
+    # JSON friendly copy of a cell or label
+    if _missing(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -0,0 +1,160 @@
+import io
+import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from dates import parse_date_columns, parse_dates
+
+# Smaller files are read in this process, starting workers would cost more than it saves
+MIN_PARALLEL_BYTES = 32 * 1024 * 1024
+SCAN_CHUNK = 1 << 24
+# Bytes inspected at a time while looking for the end of the record that crosses a split point
+BOUNDARY_WINDOW = 1 << 20
+QUOTE = ord('"')
+NEWLINE = ord('\n')
+
+def split_ranges(filename, parts):
+    """(header, [(start, end), ...]): about parts byte ranges that each hold whole records.
+
+    A newline only ends a record when an even number of quotes comes
+    before it (doubled quotes inside a quoted field count twice), so
+    quoted fields containing newlines never straddle two ranges.
+    """
+    with open(filename, 'rb') as csv_file:
+        size = os.fstat(csv_file.fileno()).st_size
+        if size == 0:
+            return b'', []
+        with mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffer = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                header_end = _record_end(buffer, 0, 0)
+                step = max((size - header_end) // max(parts, 1), 1)
+                targets = list(range(header_end + step, size, step))[:max(parts - 1, 0)]
+                boundaries = [header_end]
+                position, parity = header_end, 0
+                for target in targets:
+                    parity = (parity + _quotes(buffer, position, target)) % 2
+                    position = target
+                    boundary = _record_end(buffer, position, parity)
+                    if boundary > boundaries[-1] and boundary < size:
+                        boundaries.append(boundary)
+                boundaries.append(size)
+                header = buffer[:header_end].tobytes()
+            finally:
+                # The array must not outlive the mapping it points into
+                del buffer
+    return header, [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+def _quotes(buffer, start, end):
+    return sum(int(np.count_nonzero(buffer[offset:min(offset + SCAN_CHUNK, end)] == QUOTE))
+               for offset in range(start, end, SCAN_CHUNK))
+
+def _window_ends(window, parity):
+    # Positions of the newlines of window that are outside quotes, and the quote parity after it
+    inside = (parity + np.cumsum(window == QUOTE)) % 2
+    return np.flatnonzero((window == NEWLINE) & (inside == 0)), int(inside[-1])
+
+def _record_end(buffer, position, parity):
+    # Offset just after the first newline at or after position that is outside quotes
+    while position < len(buffer):
+        window = buffer[position:position + BOUNDARY_WINDOW]
+        ends, parity = _window_ends(window, parity)
+        if len(ends):
+            return position + int(ends[0]) + 1
+        position += len(window)
+    return len(buffer)
+
+def last_record_end(data, parity=0):
+    """Offset just after the last complete record of data (0 if there is none).
+
+    data must start at a record boundary, with parity the quote parity
+    there; the newline rule is the one split_ranges uses.
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    end = 0
+    for position in range(0, len(buffer), BOUNDARY_WINDOW):
+        ends, parity = _window_ends(buffer[position:position + BOUNDARY_WINDOW], parity)
+        if len(ends):
+            end = position + int(ends[-1]) + 1
+    return end
+
+def _parse_range(filename, header, start, end, text_columns=()):
+    with open(filename, 'rb') as csv_file:
+        csv_file.seek(start)
+        body = csv_file.read(end - start)
+    dtype = {column: 'str' for column in text_columns} or None
+    return pd.read_csv(io.BytesIO(header + body), dtype=dtype)
+
+def read_partitions(filename, workers=None):
+    """The rows of a CSV file as DataFrames, one per byte range, parsed by worker processes.
+
+    Every partition has the same columns and types that pandas.read_csv
+    would infer for the whole file, and its index continues the row
+    numbers of the previous one. Partitions can be aggregated one by one
+    with AggregationEngine.partial() and merge(), or concatenated.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or os.path.getsize(filename) < MIN_PARALLEL_BYTES:
+        return [parse_date_columns(pd.read_csv(filename))]
+    header, ranges = split_ranges(filename, workers)
+    if len(ranges) < 2:
+        return [parse_date_columns(pd.read_csv(filename))]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        partitions = list(pool.map(_parse_range, *zip(*[(filename, header, start, end) for start, end in ranges])))
+        text_columns = _mixed_columns(partitions)
+        if text_columns:
+            # Numbers in one range and text in another: the whole column is text, as in a single read
+            partitions = list(pool.map(_parse_range, *zip(*[(filename, header, start, end, text_columns)
+                                                             for start, end in ranges])))
+    return _align(partitions)
+
+def read_csv_parallel(filename, workers=None):
+    """Same frame as dates.read_csv, parsed in parallel for large files"""
+    partitions = read_partitions(filename, workers)
+    if len(partitions) == 1:
+        return partitions[0]
+    return pd.concat(partitions)
+
+def _mixed_columns(partitions):
+    columns = []
+    for name in partitions[0].columns:
+        # A range where the column is empty reads as float NaN, which does not decide the type
+        dtypes = {partition[name].dtype for partition in partitions if partition[name].notna().any()}
+        if len(dtypes) > 1 and not all(_is_number(dtype) for dtype in dtypes):
+            columns.append(name)
+    return tuple(columns)
+
+def _align(partitions):
+    # Same dtype in every partition, dates decided over the whole column, row numbers continuing
+    for name in partitions[0].columns:
+        if len({partition[name].dtype for partition in partitions}) > 1:
+            _unify(partitions, name)
+        dates = parse_dates([partition[name] for partition in partitions])
+        if dates is not None:
+            for partition, values in zip(partitions, dates):
+                partition[name] = values
+    offset = 0
+    for partition in partitions:
+        partition.index = pd.RangeIndex(offset, offset + len(partition))
+        offset += len(partition)
+    return partitions
+
+def _unify(partitions, name):
+    # Partitions where the column is empty read it as float NaN, the others decide the type
+    filled = [partition[name] for partition in partitions if partition[name].notna().any()]
+    dtypes = {column.dtype for column in filled}
+    if len(dtypes) != 1:
+        dtype = np.dtype('float64')
+    else:
+        dtype = dtypes.pop()
+        if len(filled) < len(partitions) and pd.api.types.is_integer_dtype(dtype):
+            dtype = np.dtype('float64')
+        elif len(filled) < len(partitions) and pd.api.types.is_bool_dtype(dtype):
+            dtype = np.dtype(object)
+    for partition in partitions:
+        if partition[name].dtype != dtype:
+            partition[name] = partition[name].astype(dtype)
+
+def _is_number(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
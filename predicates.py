@@ -0,0 +1,162 @@
+import math
+import numpy as np
+import pandas as pd
+from expressions import COMPARISONS
+from text_index import TEXT_OPERATORS, text_mask
+from dates import date_mask, is_date_column
+
+# Integer columns compare against an int64 literal only inside this range
+INT64_LIMIT = 2 ** 63
+
+class FilterTypeError(ValueError):
+    """The literal of a filter cannot be compared with the values of its column"""
+
+class Predicate:
+    """A filter compiled once into a function that returns its row mask.
+
+    The operator is resolved to a NumPy ufunc when the filter is visited.
+    The first time the filter meets its column, the literal is cast to the
+    column's type (a type mismatch raises FilterTypeError) and the mask
+    function for that type is kept, so later executions of the same plan
+    go straight to the ufunc.
+    """
+
+    def __init__(self, filter_op):
+        self.column = filter_op['column']
+        self.operator = filter_op['operator']
+        self.value = filter_op['value']
+        self.expression = filter_op.get('expression')
+        self.ufunc = COMPARISONS.get(self.operator)
+        # Mask functions per column dtype
+        self._functions = {}
+        if self.expression is not None:
+            if isinstance(self.value, str):
+                raise FilterTypeError(f"No se puede comparar la expresión {self.expression.text} con el texto '{self.value}'")
+            # Expressions are numeric: dates or texts, also as bounds of a between, are rejected here
+            literals = self.value if isinstance(self.value, list) else [self.value]
+            if not all(_is_number(literal) or _is_parameter(literal) for literal in literals):
+                raise FilterTypeError(f"No se puede comparar la expresión {self.expression.text} con {self.value!r}")
+            self.mask = self._expression_mask
+        elif self.operator in TEXT_OPERATORS:
+            self.mask = self._text_mask
+        else:
+            self.mask = self._column_mask
+
+    def compiled_for(self, filter_op):
+        # Copies of a filter with another column or value need their own predicate
+        return filter_op['column'] == self.column and filter_op['operator'] == self.operator \
+            and filter_op['value'] is self.value
+
+    def check(self, frame):
+        """Compile for the column as frame has it, raising FilterTypeError if the literal does not fit"""
+        if self.expression is None and self.operator not in TEXT_OPERATORS and self.column in frame.columns:
+            self._function(frame[self.column])
+
+    def _expression_mask(self, frame, text_indexes=None, date_indexes=None):
+        return self.expression.mask(frame, self.operator, self.value)
+
+    def _text_mask(self, frame, text_indexes=None, date_indexes=None):
+        return text_mask(frame, self.column, self.operator, self.value, text_indexes)
+
+    def _column_mask(self, frame, text_indexes=None, date_indexes=None):
+        series = frame[self.column]
+        return self._function(series)(series, frame, date_indexes)
+
+    def _function(self, series):
+        function = self._functions.get(series.dtype)
+        if function is None:
+            function = self._functions[series.dtype] = self._compile(series)
+        return function
+
+    def _compile(self, series):
+        literals = self.value if isinstance(self.value, list) else [self.value]
+        if is_date_column(series):
+            if any(_is_number(literal) for literal in literals):
+                raise self._mismatch('de fechas')
+            # Running it on no rows validates the operator and the date literals now
+            date_mask(series.iloc[:0].to_frame(), self.column, self.operator, self.value)
+            return self._date_function()
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+            if not all(_is_number(literal) for literal in literals):
+                raise self._mismatch('numérica')
+            return self._numeric_function(dtype)
+        if isinstance(dtype, pd.StringDtype) and not all(isinstance(literal, str) for literal in literals):
+            raise self._mismatch('de texto')
+        # Text and mixed object columns keep pandas comparison semantics
+        return self._pandas_function()
+
+    def _mismatch(self, kind):
+        return FilterTypeError(f"No se puede comparar la columna {kind} '{self.column}' con {self.value!r}")
+
+    def _date_function(self):
+        column, operator, value = self.column, self.operator, self.value
+        def mask(series, frame, date_indexes):
+            return date_mask(frame, column, operator, value, date_indexes)
+        return mask
+
+    def _numeric_function(self, dtype):
+        if self.operator == 'between':
+            # Inclusive bounds always round to a comparison, never to a constant
+            low_ufunc, low_value = _cast(dtype, '>=', self.value[0])
+            high_ufunc, high_value = _cast(dtype, '<=', self.value[1])
+            def between(series, frame, date_indexes):
+                values = series.to_numpy()
+                return low_ufunc(values, low_value) & high_ufunc(values, high_value)
+            return between
+        ufunc, literal = _cast(dtype, self.operator, self.value)
+        if ufunc is None:
+            return _constant(literal)
+        def compare(series, frame, date_indexes):
+            return ufunc(series.to_numpy(), literal)
+        return compare
+
+    def _pandas_function(self):
+        if self.operator == 'between':
+            low, high = self.value
+            def between(series, frame, date_indexes):
+                return np.asarray((series >= low) & (series <= high), dtype=bool)
+            return between
+        ufunc, value = self.ufunc, self.value
+        def compare(series, frame, date_indexes):
+            return np.asarray(ufunc(series, value), dtype=bool)
+        return compare
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+
+def _is_parameter(value):
+    # Placeholders of prepared scripts are checked again once bound; imported here to avoid a cycle
+    from employee_dsl_interpreter import Parameter
+    return isinstance(value, Parameter)
+
+def _cast(dtype, operator, value):
+    """(ufunc, literal) giving the same rows as the float comparison, or (None, constant result).
+
+    Integer columns are compared with an int64 literal, rounded so that
+    the comparison keeps its meaning, instead of converting every value
+    to float.
+    """
+    value = float(value)
+    if dtype.kind != 'i' or not math.isfinite(value) or abs(value) >= INT64_LIMIT:
+        return COMPARISONS[operator], value
+    if value.is_integer():
+        return COMPARISONS[operator], np.int64(value)
+    if operator in ('>', '<='):
+        return COMPARISONS[operator], np.int64(math.floor(value))
+    if operator in ('>=', '<'):
+        return COMPARISONS[operator], np.int64(math.ceil(value))
+    # An integer never equals a fraction
+    return None, operator == '!='
+
+def _constant(result):
+    def mask(series, frame, date_indexes):
+        return np.full(len(series), result)
+    return mask
+
+def filter_predicate(filter_op):
+    """Compiled predicate of a filter; filters built without one (or copied with another value) are compiled here"""
+    predicate = filter_op.get('predicate')
+    if predicate is None or not predicate.compiled_for(filter_op):
+        predicate = Predicate(filter_op)
+    return predicate
@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+from employee_dsl_interpreter import (EmployeeDSLInterpreter, Parameter, apply_filter, bind_filter,
+                                      bind_value, has_parameters, parse_script)
+from query_result import QueryResult
+from aggregation import AggregationEngine
+from text_index import TEXT_OPERATORS
+from dates import coerce_date, is_date_column
+from sort_index import sort_frame
+from predicates import Predicate
+
+EMPTY_POSITIONS = np.array([], dtype=np.intp)
+
+class PreparedScript:
+    """A script parsed once; placeholders ($name or ?) are bound on every execution"""
+
+    def __init__(self, script):
+        self.script = script
+        self.steps = []
+        self.parameters = []
+        # Loaded frames and statistics, reused while the source file is unchanged
+        self.datasets = {}
+        compiler = EmployeeDSLInterpreter()
+        for statement in parse_script(script).statement():
+            if statement.loadStatement():
+                load = statement.loadStatement()
+                filename = load.STRING_LITERAL().getText()[1:-1]
+                if load.AS():
+                    self.steps.append(('load_as', (load.IDENTIFIER().getText(), filename)))
+                else:
+                    self.steps.append(('load', filename))
+            elif statement.joinStatement():
+                before = len(compiler.joins)
+                compiler.visit(statement)
+                self.steps.append(('join', compiler.joins[before]))
+            elif statement.printStatement():
+                self.steps.append(('print', None))
+            elif statement.filterStatement():
+                before = len(compiler.filters)
+                compiler.visit(statement)
+                self.steps.append(('filter', compiler.filters[before:]))
+            elif statement.aggregateStatement():
+                before = len(compiler.aggregations)
+                compiler.visit(statement)
+                self.steps.append(('aggregate', compiler.aggregations[before:]))
+            elif statement.sortStatement():
+                compiler.visit(statement)
+                self.steps.append(('sort', compiler.sorting))
+            elif statement.sampleStatement():
+                compiler.visit(statement)
+                self.steps.append(('sample', compiler.sampling))
+            elif statement.limitStatement():
+                compiler.visit(statement)
+                self.steps.append(('limit', compiler.paging))
+            elif statement.explainStatement():
+                self.steps.append(('explain', statement.explainStatement().ANALYZE() is not None))
+        values = []
+        for filter_op in compiler.filters:
+            values.extend(filter_op['value'] if isinstance(filter_op['value'], list) else [filter_op['value']])
+        if compiler.paging is not None:
+            values.append(compiler.paging['after'])
+        for value in values:
+            if isinstance(value, Parameter) and value.name not in self.parameters:
+                self.parameters.append(value.name)
+
+    def _interpreter(self, materialize, result_cache=None):
+        return EmployeeDSLInterpreter(materialize=materialize, result_cache=result_cache,
+                                      dataset_cache=self.datasets)
+
+    def execute(self, params=None, materialize=True, result_cache=None):
+        """Bind params (a dict for $name, a sequence for ?) and run the compiled statements"""
+        params = {} if params is None else params
+        interpreter = self._interpreter(materialize, result_cache)
+        for kind, payload in self.steps:
+            if kind == 'load':
+                interpreter.load_source(payload)
+            elif kind == 'load_as':
+                interpreter.load_named_source(*payload)
+            elif kind == 'join':
+                interpreter.joins.append(payload)
+            elif kind == 'filter':
+                interpreter.filters.extend(bind_filter(filter_op, params) for filter_op in payload)
+            elif kind == 'aggregate':
+                interpreter.aggregations.extend(payload)
+            elif kind == 'sort':
+                interpreter.sorting = payload
+            elif kind == 'sample':
+                interpreter.sampling = payload
+            elif kind == 'limit':
+                interpreter.paging = dict(payload, after=bind_value(payload['after'], params))
+            elif kind == 'print':
+                interpreter.run_print()
+            elif kind == 'explain' and payload:
+                interpreter.run_print(analyze=True)
+            elif kind == 'explain':
+                print("Plan de consulta:")
+                print(interpreter.explain_plan().render())
+        if interpreter.results:
+            return interpreter.results[-1]
+        return interpreter._execute_query()
+
+    def final_plan(self):
+        """(source, filters, aggregations, sorting, paging) in effect at the last print"""
+        source, filters, aggregations, sorting, paging = None, [], [], None, None
+        last_print = max([i for i, (kind, _) in enumerate(self.steps) if kind == 'print'], default=len(self.steps))
+        for kind, payload in self.steps[:last_print]:
+            if kind == 'load':
+                source = payload
+            elif kind == 'filter':
+                filters.extend(payload)
+            elif kind == 'aggregate':
+                aggregations.extend(payload)
+            elif kind == 'sort':
+                sorting = payload
+            elif kind == 'limit':
+                paging = payload
+        return source, filters, aggregations, sorting, paging
+
+    def execute_many(self, param_sets, materialize=True):
+        """Run the script for every parameter set in one batch.
+
+        Filters without placeholders are applied once. Each parameterized
+        filter gets a hash or sorted index over the remaining rows, so every
+        parameter set is answered with lookups instead of a new scan.
+        """
+        if any(kind in ('join', 'sample', 'explain') for kind, _ in self.steps):
+            # Pushdown, estimates and plans depend on the bound filters, run each set through the interpreter
+            return [self.execute(params, materialize) for params in param_sets]
+        source, filters, aggregations, sorting, paging = self.final_plan()
+        interpreter = self._interpreter(materialize)
+        if source is not None:
+            interpreter.load_source(source)
+        if interpreter.data is None:
+            return [QueryResult(None, {}, materialize) for _ in param_sets]
+        constant = [filter_op for filter_op in filters if not has_parameters(filter_op['value'])]
+        parameterized = [filter_op for filter_op in filters if has_parameters(filter_op['value'])]
+        base = interpreter.data
+        planned, never_matches = interpreter.statistics.plan_filters(constant)
+        if never_matches:
+            base = base.iloc[0:0]
+        elif planned:
+            # Bitmaps of the constant filters are cached per dataset, shared with other scripts and batches
+            selected = interpreter.bitmaps.select(base, planned, interpreter.text_indexes, interpreter.date_indexes)
+            base = base.iloc[selected.positions()]
+        indexes = [ParameterIndex(base, filter_op) for filter_op in parameterized]
+        engine = AggregationEngine(aggregations)
+        results = []
+        for params in param_sets:
+            positions = None
+            for index in indexes:
+                selected = index.positions(bind_value(index.filter_op['value'], params))
+                positions = selected if positions is None else np.intersect1d(positions, selected, assume_unique=True)
+            filtered_data = base if positions is None else base.iloc[np.sort(positions)]
+            aggregation_results = engine.compute(filtered_data)
+            if sorting:
+                filtered_data = sort_frame(filtered_data, sorting, interpreter.sort_indexes)
+            if paging is None:
+                results.append(QueryResult(filtered_data, aggregation_results, materialize, sorting))
+                continue
+            result = QueryResult(filtered_data, aggregation_results, False, sorting)
+            results.append(result.page(paging['limit'], paging['offset'], bind_value(paging['after'], params),
+                                       materialize))
+        return results
+
+class ParameterIndex:
+    """Lookup structure for one parameterized filter, built once per batch"""
+
+    def __init__(self, frame, filter_op):
+        self.frame = frame
+        self.filter_op = filter_op
+        self.operator = filter_op['operator']
+        self.kind = 'scan'
+        self.dates = False
+        if filter_op.get('expression') is not None or self.operator in TEXT_OPERATORS:
+            return
+        column = frame[filter_op['column']]
+        self.dates = is_date_column(column)
+        if self.operator in ('==', '!='):
+            # Row positions per distinct value; NaN never equals anything
+            self.groups = column.groupby(column, sort=False).indices
+            self.kind = 'hash'
+            return
+        values = column.to_numpy()
+        valid = np.flatnonzero(~pd.isna(values))
+        try:
+            order = np.argsort(values[valid], kind='stable')
+        except TypeError:
+            return
+        self.sorted_values = values[valid][order]
+        self.sorted_positions = valid[order]
+        self.kind = 'sorted'
+
+    def positions(self, value):
+        """Positions (within the batch base frame) of the rows that satisfy the bound filter"""
+        # Same type check as execute(): a value that does not fit the column raises FilterTypeError
+        Predicate(dict(self.filter_op, value=value)).check(self.frame)
+        if self.dates and self.kind != 'scan':
+            value = [coerce_date(item) for item in value] if isinstance(value, list) else coerce_date(value)
+        if self.kind == 'hash':
+            matched = self.groups.get(value, EMPTY_POSITIONS) if not isinstance(value, list) else EMPTY_POSITIONS
+            if self.operator == '==':
+                return matched
+            # NaN != value is True, so every unmatched row qualifies
+            return np.setdiff1d(np.arange(len(self.frame)), matched, assume_unique=True)
+        if self.kind == 'sorted':
+            return self._range(value)
+        filtered = apply_filter(self.frame, dict(self.filter_op, value=value))
+        return self.frame.index.get_indexer(filtered.index)
+
+    def _range(self, value):
+        if self.dates:
+            value = [item.to_datetime64() for item in value] if isinstance(value, list) else value.to_datetime64()
+        search = self.sorted_values.searchsorted
+        if self.operator == '>':
+            return self.sorted_positions[search(value, 'right'):]
+        if self.operator == '>=':
+            return self.sorted_positions[search(value, 'left'):]
+        if self.operator == '<':
+            return self.sorted_positions[:search(value, 'left')]
+        if self.operator == '<=':
+            return self.sorted_positions[:search(value, 'right')]
+        low, high = value
+        return self.sorted_positions[search(low, 'left'):max(search(high, 'right'), search(low, 'left'))]
+
+def prepare(script):
+    """Parse and compile a script once so it can be executed with different parameters"""
+    return PreparedScript(script)
+
+def execute(prepared, params=None, **options):
+    return prepared.execute(params, **options)
+
+def execute_many(prepared, param_sets, **options):
+    return prepared.execute_many(param_sets, **options)
@@ -0,0 +1,114 @@
+import time
+import threading
+
+# Rows read to estimate the bytes of one row of a frame
+SAMPLE_ROWS = 1000
+# Key, boxed value and dict slot of one field once a row becomes a record
+RECORD_FIELD_BYTES = 100
+MEGABYTE = 1024 * 1024
+
+# Operator of a plan key, as named in limit errors
+OPERATORS = {
+    'filter': 'un filtro',
+    'pushdown': 'un filtro',
+    'reuse': 'la selección reutilizada',
+    'sort': 'la ordenación',
+    'join': 'el join',
+    'sample': 'la muestra',
+    'limit': 'la página',
+    'result': 'el resultado'
+}
+
+class QueryCancelled(Exception):
+    """The query was cancelled while it ran"""
+
+    def to_dict(self):
+        return {'error': 'cancelled', 'message': str(self)}
+
+class QueryLimitExceeded(Exception):
+    """A query went over one of its QueryLimits; limit is 'timeout', 'max_rows' or 'max_memory'"""
+
+    def __init__(self, message, limit, value, maximum):
+        super().__init__(message)
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+    def to_dict(self):
+        return {'error': 'limit_exceeded', 'limit': self.limit, 'value': self.value,
+                'maximum': self.maximum, 'message': str(self)}
+
+class CancellationToken:
+    """Stops a running query from another thread: pass it to parse_and_interpret and call cancel()"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def is_set(self):
+        # Same check as threading.Event, so either can be given to the interpreter
+        return self._event.is_set()
+
+class QueryLimits:
+    """Per-query limits: wall time in seconds, rows an operator may produce and estimated memory in bytes.
+
+    The interpreter checks them between operators and between chunks of
+    joins and exports. The sort and the conversion of the result to
+    records are checked before they run, since their row count is known
+    in advance. The loaded dataset itself does not count against the
+    limits, only what the query builds from it. A single operator that is
+    already running is not interrupted.
+    """
+
+    def __init__(self, timeout=None, max_rows=None, max_memory=None):
+        for name, value in (('timeout', timeout), ('max_rows', max_rows), ('max_memory', max_memory)):
+            if value is not None and value <= 0:
+                raise ValueError(f"El límite {name} debe ser positivo: {value}")
+        self.timeout = timeout
+        self.max_rows = max_rows
+        self.max_memory = max_memory
+
+    def start(self):
+        """Budget of one execution; the wall time counts from here"""
+        return QueryBudget(self)
+
+class QueryBudget:
+    def __init__(self, limits):
+        self.limits = limits
+        self.started = time.monotonic()
+        self.deadline = None if limits.timeout is None else self.started + limits.timeout
+
+    def check_time(self):
+        now = time.monotonic()
+        if self.deadline is not None and now > self.deadline:
+            raise QueryLimitExceeded(f"La consulta superó el tiempo máximo de {self.limits.timeout:g} s",
+                                     'timeout', now - self.started, self.limits.timeout)
+
+    def check(self, operator, rows, row_bytes):
+        """Raise if an operator producing rows rows of row_bytes bytes goes over the limits"""
+        name = OPERATORS.get(operator, operator)
+        if self.limits.max_rows is not None and rows > self.limits.max_rows:
+            raise QueryLimitExceeded(f"La consulta superó el límite de filas: {name} produce {rows} filas "
+                                     f"(máximo {self.limits.max_rows})", 'max_rows', rows, self.limits.max_rows)
+        estimated = int(rows * row_bytes)
+        if self.limits.max_memory is not None and estimated > self.limits.max_memory:
+            raise QueryLimitExceeded(f"La consulta superó el límite de memoria: {name} necesita unos "
+                                     f"{estimated / MEGABYTE:.1f} MB (máximo {self.limits.max_memory / MEGABYTE:.1f} MB)",
+                                     'max_memory', estimated, self.limits.max_memory)
+
+def row_bytes(frame):
+    """Estimated bytes of one row of frame, strings included, from its first rows"""
+    sample = frame.iloc[:SAMPLE_ROWS]
+    if len(sample) == 0:
+        return 0
+    return float(sample.memory_usage(index=False, deep=True).sum()) / len(sample)
+
+def record_bytes(frame):
+    """Estimated bytes of one row of frame once it is also converted to a record"""
+    return row_bytes(frame) + len(frame.columns) * RECORD_FIELD_BYTES
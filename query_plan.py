@@ -0,0 +1,84 @@
+class PlanNode:
+    """One operator of a query plan: what it does, how it reads its input and how many rows it yields"""
+
+    def __init__(self, operator, access=None, estimated=None, key=None, children=()):
+        self.operator = operator
+        self.access = access
+        self.estimated = estimated
+        self.key = key
+        self.children = list(children)
+        # Filled in when the plan is executed (explain analyze or --explain)
+        self.actual = None
+        self.elapsed = None
+
+    def to_dict(self):
+        return {
+            'operator': self.operator,
+            'access': self.access,
+            'estimated_rows': self.estimated,
+            'actual_rows': self.actual,
+            'elapsed_ms': None if self.elapsed is None else self.elapsed * 1000,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+    def describe(self):
+        text = self.operator
+        if self.access:
+            text += f"  [{self.access}]"
+        figures = []
+        if self.estimated is not None:
+            figures.append(f"estimadas: {_rows(self.estimated)}")
+        if self.actual is not None:
+            figures.append(f"reales: {self.actual}")
+        if self.elapsed is not None:
+            figures.append(f"{self.elapsed * 1000:.2f} ms")
+        if figures:
+            text += f"  ({', '.join(figures)})"
+        return text
+
+class QueryPlan:
+    """Operator tree of one print, drawn top-down from the result to the file read.
+
+    Nodes carry a key so the executor can attach actual row counts and
+    timings to the operator it just ran.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.nodes = {}
+        self._index(root)
+
+    def _index(self, node):
+        if node.key is not None:
+            self.nodes[node.key] = node
+        for child in node.children:
+            self._index(child)
+
+    def record(self, key, rows, seconds):
+        node = self.nodes.get(key)
+        if node is not None:
+            node.actual = rows
+            node.elapsed = seconds if node.elapsed is None else node.elapsed + seconds
+
+    def analyzed(self):
+        return self.root.actual is not None
+
+    def to_dict(self):
+        return self.root.to_dict()
+
+    def render(self):
+        lines = [self.root.describe()]
+        _render_children(self.root, '', lines)
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.render()
+
+def _render_children(node, prefix, lines):
+    for position, child in enumerate(node.children):
+        last = position == len(node.children) - 1
+        lines.append(prefix + ('└── ' if last else '├── ') + child.describe())
+        _render_children(child, prefix + ('    ' if last else '│   '), lines)
+
+def _rows(estimate):
+    return f"{estimate:.0f}" if estimate >= 10 or estimate == int(estimate) else f"{estimate:.1f}"
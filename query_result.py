@@ -0,0 +1,128 @@
+import io
+import sys
+import json
+from dates import format_dates
+from pagination import encode_cursor, paging_position
+
+DEFAULT_CHUNK_SIZE = 10000
+
+class QueryResult(dict):
+    """Result of a print statement that keeps the selected rows as a DataFrame"""
+
+    def __init__(self, frame, aggregations, materialize=True, sorting=None, complete=None):
+        super().__init__()
+        self.frame = frame
+        # Sort of the query, needed to build and read keyset cursors
+        self.sorting = sorting
+        # Adds the columns a lazy loader left out to a slice of frame, right before output
+        self.complete = complete
+        # Called before every chunk of a stream, may raise to stop it (query limits, cancellation)
+        self.checkpoint = None
+        self['aggregations'] = aggregations
+        self['record_count'] = len(frame) if frame is not None else 0
+        if materialize:
+            self['filtered_data'] = self.to_records()
+
+    def __missing__(self, key):
+        # filtered_data is only built when someone actually asks for it
+        if key == 'filtered_data':
+            records = self.to_records()
+            self[key] = records
+            return records
+        raise KeyError(key)
+
+    def to_records(self):
+        """Materialize every selected row as a list of dicts"""
+        if self.frame is None:
+            return []
+        return json.loads(format_dates(self._output(self.frame)).to_json(orient='records'))
+
+    def page(self, limit, offset=0, after=None, materialize=True):
+        """Result holding only limit rows, from offset or after a cursor of a previous page.
+
+        Aggregates still describe the whole selection. Only the rows of the
+        page are converted to records; 'page' tells the total and the
+        cursor of the next page (None on the last one).
+        """
+        if self.frame is None:
+            return QueryResult(None, self['aggregations'], materialize, self.sorting, self.complete)
+        start = paging_position(self.frame, {'offset': offset, 'after': after}, self.sorting)
+        rows = self.frame.iloc[start:start + limit]
+        result = QueryResult(rows, self['aggregations'], materialize, self.sorting, self.complete)
+        for key in ('sample', 'confidence_intervals'):
+            if key in self:
+                result[key] = self[key]
+        has_more = start + limit < len(self.frame)
+        result['page'] = {
+            'offset': start,
+            'limit': limit,
+            'total': len(self.frame),
+            'next_cursor': encode_cursor(self.frame, start + limit - 1, self.sorting) if has_more else None
+        }
+        return result
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield the selected rows as DataFrame slices of at most chunk_size rows"""
+        if self.frame is None:
+            return
+        for start in range(0, len(self.frame), chunk_size):
+            if self.checkpoint is not None:
+                self.checkpoint()
+            yield self._output(self.frame.iloc[start:start + chunk_size])
+
+    def iter_records(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield the selected rows one dict at a time, converting chunk by chunk"""
+        for chunk in self.iter_chunks(chunk_size):
+            for record in json.loads(format_dates(chunk).to_json(orient='records')):
+                yield record
+
+    def write_ndjson(self, destination=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows as NDJSON to a path, a file object or stdout"""
+        return self._write(destination, chunk_size, _ndjson_chunk)
+
+    def write_csv(self, destination=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows as CSV to a path, a file object or stdout"""
+        return self._write(destination, chunk_size, _csv_chunk)
+
+    def write(self, destination=None, fmt='ndjson', chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream the selected rows in the given format ('ndjson' or 'csv')"""
+        if fmt == 'ndjson':
+            return self.write_ndjson(destination, chunk_size)
+        if fmt == 'csv':
+            return self.write_csv(destination, chunk_size)
+        raise ValueError(f"Formato de salida no soportado: {fmt}")
+
+    def _write(self, destination, chunk_size, encode_chunk):
+        if destination is None:
+            return self._write_to(sys.stdout, chunk_size, encode_chunk)
+        if isinstance(destination, (str, bytes)) or hasattr(destination, '__fspath__'):
+            with open(destination, 'w', encoding='utf-8', newline='') as out_file:
+                return self._write_to(out_file, chunk_size, encode_chunk)
+        return self._write_to(destination, chunk_size, encode_chunk)
+
+    def _write_to(self, out_file, chunk_size, encode_chunk):
+        written = 0
+        if self['record_count'] == 0 and self.frame is not None:
+            # Still emit the CSV header for an empty selection
+            out_file.write(encode_chunk(self._output(self.frame), True))
+        for chunk in self.iter_chunks(chunk_size):
+            out_file.write(encode_chunk(chunk, written == 0))
+            written += len(chunk)
+        out_file.flush()
+        return written
+
+    def _output(self, frame):
+        return frame if self.complete is None else self.complete(frame)
+
+def _ndjson_chunk(chunk, first):
+    if len(chunk) == 0:
+        return ''
+    text = format_dates(chunk).to_json(orient='records', lines=True, force_ascii=False)
+    if not text.endswith('\n'):
+        text += '\n'
+    return text
+
+def _csv_chunk(chunk, first):
+    buffer = io.StringIO()
+    format_dates(chunk).to_csv(buffer, index=False, header=first)
+    return buffer.getvalue()
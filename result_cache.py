@@ -0,0 +1,116 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from aggregation import aggregation_signature
+
+class ResultCache:
+    """LRU cache of query results with size and TTL based eviction.
+
+    Keys combine the dataset fingerprint with the normalized plan, so a
+    change to the source file never returns a stale result; entries for an
+    older fingerprint of the same file are dropped on the next miss.
+    Cached results are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries=128, max_rows=1000000, ttl=60.0):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry['stored_at'] > self.ttl:
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._drop_stale(key)
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['value']
+
+    def __contains__(self, key):
+        # Whether get() would hit, without touching the counters or the LRU order
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (self.ttl is None or time.monotonic() - entry['stored_at'] <= self.ttl)
+
+    def put(self, key, value, rows=0):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_rows is not None and rows > self.max_rows:
+                # Larger than the whole budget, not worth keeping
+                return
+            self._entries[key] = {'value': value, 'rows': rows, 'stored_at': time.monotonic()}
+            self._rows += rows
+            while len(self._entries) > self.max_entries or (self.max_rows is not None and self._rows > self.max_rows):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, filename=None):
+        """Drop every entry, or only the ones computed from filename"""
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                self._rows = 0
+                return
+            source = os.path.abspath(filename)
+            for key in [key for key in self._entries if key[0] == source]:
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'rows': self._rows
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._rows -= entry['rows']
+
+    def _drop_stale(self, key):
+        # Same file with a different fingerprint: the source changed
+        for other in [other for other in self._entries if other[0] == key[0] and other[1] != key[1]]:
+            self._remove(other)
+
+def dataset_key(filename):
+    """(absolute path, fingerprint) of the source file"""
+    stat = os.stat(filename)
+    return os.path.abspath(filename), (stat.st_size, stat.st_mtime_ns)
+
+def normalize_plan(filters, aggregations, sorting, materialize, joins=(), sampling=None):
+    """Canonical form of a compiled query: filter order and duplicates do not matter"""
+    normalized_filters = sorted({
+        (filter_op['column'], filter_op['operator'], repr(filter_op['value']),
+         filter_op.get('expression') is not None)
+        for filter_op in filters
+    })
+    normalized_aggregations = tuple(aggregation_signature(agg) for agg in aggregations)
+    normalized_sorting = (tuple(sorting['columns']), tuple(sorting['ascending'])) if sorting else None
+    # Joined datasets are identified by their own path and fingerprint
+    normalized_joins = tuple((alias, dataset_key(filename) if filename else None, left_column, right_column)
+                             for alias, filename, left_column, right_column in joins)
+    normalized_sampling = (sampling['fraction'], sampling['column']) if sampling else None
+    return (tuple(normalized_filters), normalized_aggregations, normalized_sorting, bool(materialize),
+            normalized_joins, normalized_sampling)
+
+def cache_key(filename, filters, aggregations, sorting, materialize, joins=(), sampling=None):
+    source, fingerprint = dataset_key(filename)
+    return source, fingerprint, normalize_plan(filters, aggregations, sorting, materialize, joins, sampling)
@@ -0,0 +1,165 @@
+import math
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from aggregation import aggregation_name
+
+SAMPLE_SEED = 0
+CONFIDENCE_Z = 1.96
+MAX_RESERVOIRS = 8
+
+ESTIMATED_FUNCTIONS = ('count', 'sum', 'average', 'count_distinct')
+
+class Sample:
+    """Rows drawn from a dataset plus the stratum sizes needed to scale them back up"""
+
+    def __init__(self, frame, strata, population, sizes, fraction, column):
+        self.frame = frame
+        # Stratum code of every sampled row, aligned with frame
+        self.strata = strata
+        self.population = population
+        self.sizes = sizes
+        self.fraction = fraction
+        self.column = column
+
+    def total(self, values):
+        """Stratified estimate of the population total of values and its variance"""
+        sizes = self.sizes.astype('float64')
+        population = self.population.astype('float64')
+        sums = np.bincount(self.strata, weights=values, minlength=len(sizes))
+        squares = np.bincount(self.strata, weights=values * values, minlength=len(sizes))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(sizes > 0, sums / sizes, 0.0)
+            deviations = np.where(sizes > 1, (squares - sizes * means * means) / (sizes - 1), 0.0)
+            variance = population * population * (1 - sizes / population) * np.maximum(deviations, 0.0) / sizes
+        return float(np.sum(population * means)), float(np.sum(np.where(sizes > 0, variance, 0.0)))
+
+    def describe(self):
+        return {
+            'fraction': self.fraction,
+            'column': self.column,
+            'rows': int(self.sizes.sum()),
+            'population': int(self.population.sum())
+        }
+
+class SampleReservoir:
+    """Random order of a dataset's rows, drawn once and cut to any sampling fraction.
+
+    A sample is a prefix of that order (per stratum when stratified), so
+    smaller samples are nested in larger ones and repeated queries see
+    the same rows.
+    """
+
+    def __init__(self, frame, seed=SAMPLE_SEED):
+        self.frame = frame
+        self.order = np.random.default_rng(seed).permutation(len(frame))
+        self._samples = {}
+
+    def sample(self, fraction, column=None):
+        key = (fraction, column)
+        if key not in self._samples:
+            self._samples[key] = self._draw(fraction, column)
+        return self._samples[key]
+
+    def _draw(self, fraction, column):
+        if column is None:
+            codes = np.zeros(len(self.frame), dtype=np.intp)
+            groups = 1
+        else:
+            if column not in self.frame.columns:
+                raise ValueError(f"Columna de estratificación desconocida: {column}")
+            codes, uniques = pd.factorize(self.frame[column], use_na_sentinel=False)
+            groups = len(uniques)
+        population = np.bincount(codes, minlength=groups)
+        # Two rows per stratum at least, so every stratum has a variance estimate
+        sizes = np.minimum(population, np.maximum(np.ceil(population * fraction).astype(np.int64), 2))
+        ordered_codes = codes[self.order]
+        grouping = np.argsort(ordered_codes, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(population)[:-1]))
+        # Rank of every row inside its stratum, following the random order
+        rank = np.empty(len(grouping), dtype=np.int64)
+        rank[grouping] = np.arange(len(grouping)) - starts[ordered_codes[grouping]]
+        positions = np.sort(self.order[rank < sizes[ordered_codes]])
+        return Sample(self.frame.iloc[positions], codes[positions], population, sizes, fraction, column)
+
+_reservoirs = OrderedDict()
+_reservoirs_lock = threading.Lock()
+
+def reservoir_for(frame, key=None):
+    """Reservoir of a dataset; with a (path, fingerprint) key it is shared across interpreters"""
+    if key is None:
+        return SampleReservoir(frame)
+    with _reservoirs_lock:
+        reservoir = _reservoirs.get(key)
+        # A frame with other columns (lazy loading) needs its own reservoir; the seeded order is the same
+        if reservoir is not None and len(reservoir.frame) == len(frame) and reservoir.frame.columns.equals(frame.columns):
+            _reservoirs.move_to_end(key)
+            return reservoir
+        reservoir = _reservoirs[key] = SampleReservoir(frame)
+        while len(_reservoirs) > MAX_RESERVOIRS:
+            _reservoirs.popitem(last=False)
+        return reservoir
+
+def _interval(estimate, variance, lower=None):
+    margin = CONFIDENCE_Z * math.sqrt(variance)
+    low = estimate - margin
+    if lower is not None:
+        low = max(low, lower)
+    return [low, estimate + margin]
+
+def _numeric(series):
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        raise ValueError(f"La columna '{series.name}' no es numérica")
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    return values, ~np.isnan(values)
+
+def estimate_aggregates(sample, matched, aggregations):
+    """Scale count, sum, average and count_distinct of the matched sample rows to the whole dataset.
+
+    Returns (values, intervals); intervals are 95% confidence intervals,
+    or hard bounds for distinct counts. Other aggregates are left out.
+    """
+    inside = sample.frame.index.isin(matched.index)
+    values, intervals = {}, {}
+    for agg in aggregations:
+        func = agg.get('function')
+        if func not in ESTIMATED_FUNCTIONS or agg.get('approximate'):
+            continue
+        name = aggregation_name(agg)
+        if func == 'count':
+            total, variance = sample.total(inside.astype('float64'))
+            values[name] = int(round(total))
+            intervals[name] = _interval(total, variance, lower=float(inside.sum()))
+        elif func == 'sum':
+            column, present = _numeric(sample.frame[agg.get('column')])
+            total, variance = sample.total(np.where(inside & present, column, 0.0))
+            values[name] = total
+            intervals[name] = _interval(total, variance)
+        elif func == 'average':
+            column, present = _numeric(sample.frame[agg.get('column')])
+            used = inside & present
+            count, _ = sample.total(used.astype('float64'))
+            total, _ = sample.total(np.where(used, column, 0.0))
+            if not count:
+                values[name], intervals[name] = math.nan, [math.nan, math.nan]
+                continue
+            ratio = total / count
+            # Ratio estimator, variance by linearization around the estimate
+            _, variance = sample.total(np.where(used, column - ratio, 0.0))
+            values[name] = ratio
+            intervals[name] = _interval(ratio, variance / (count * count))
+        else:
+            values[name], intervals[name] = _distinct_estimate(sample, matched[agg.get('column')])
+    return values, intervals
+
+def _distinct_estimate(sample, column):
+    # GEE estimator: values seen once stand for sqrt(N / n) population values, repeated ones for themselves
+    counts = column.dropna().value_counts()
+    seen = len(counts)
+    once = int((counts == 1).sum())
+    rows, population = int(sample.sizes.sum()), int(sample.population.sum())
+    scale = math.sqrt(population / rows) if rows else 1.0
+    upper = seen + population - rows
+    estimate = min(int(round(scale * once + (seen - once))), upper)
+    return estimate, [seen, upper]
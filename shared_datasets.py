@@ -0,0 +1,229 @@
+import os
+import json
+import mmap
+import uuid
+import pickle
+import tempfile
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+from column_stats import StatisticsCatalog, file_fingerprint, load_statistics
+from dates import read_csv
+
+# tmpfs on Linux, so the files live in RAM like multiprocessing.shared_memory segments
+SHARED_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+PREFIX = 'employee_dsl_'
+ALIGNMENT = 64
+HEADER_BYTES = 8
+
+class SharedDataset:
+    """A dataset attached from a shared file: read-only column arrays that point into the mapping.
+
+    Numeric, boolean and date columns are used in place by every process
+    that attaches the name. Text columns are stored once as UTF-8 but
+    decoded on attach, since pandas text columns hold Python strings, and
+    mixed columns are unpickled; each process keeps its own copy of both,
+    so their memory grows with the number of workers.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.path = _path(name)
+        with open(self.path, 'rb') as shared_file:
+            self._map = mmap.mmap(shared_file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._map)
+        length = int.from_bytes(buffer[:HEADER_BYTES], 'little')
+        manifest = json.loads(bytes(buffer[HEADER_BYTES:HEADER_BYTES + length]).decode('utf-8'))
+        self.source = manifest['source']
+        self.fingerprint = manifest['fingerprint']
+        self.statistics = StatisticsCatalog.from_dict(manifest['statistics'])
+        base = _aligned(HEADER_BYTES + length)
+        columns = {column['name']: _read_column(buffer, base, column) for column in manifest['columns']}
+        self.frame = pd.DataFrame(columns, index=pd.RangeIndex(manifest['rows']), copy=False)
+
+class DatasetRegistry:
+    """Datasets this process publishes for worker processes, removed when the registry goes away.
+
+    publish() writes the columns of a CSV file (or a frame) into a shared
+    file and returns its name; workers call attach(name), for example in a
+    ProcessPoolExecutor initializer, and every interpreter in the worker
+    then reads that file from the shared copy. Files are deleted by
+    unlink(), close(), garbage collection or interpreter exit, and files
+    left behind by processes that died are swept when a registry starts.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        sweep_stale()
+        # Runs once, on close() or when the registry is collected or the interpreter exits
+        self._finalizer = weakref.finalize(self, _remove, self._pid, self.names)
+
+    def publish(self, source, frame=None):
+        """Name of a shared copy of source (a CSV path); frame is used instead of reading the file"""
+        if frame is None:
+            frame = read_csv(source)
+        if not isinstance(frame.index, pd.RangeIndex) or frame.index.start != 0 or frame.index.step != 1:
+            raise ValueError("Solo se pueden compartir conjuntos con filas numeradas desde 0")
+        name = f"{PREFIX}{self._pid}_{uuid.uuid4().hex[:12]}"
+        try:
+            fingerprint = file_fingerprint(source)
+        except OSError:
+            fingerprint = None
+        statistics = load_statistics(source, frame) if fingerprint else StatisticsCatalog.from_frame(frame)
+        _write(_path(name), frame, {
+            'source': os.path.abspath(source),
+            'fingerprint': fingerprint,
+            'statistics': statistics.to_dict()
+        })
+        with self._lock:
+            self.names[name] = os.path.abspath(source)
+        return name
+
+    def unlink(self, name):
+        with self._lock:
+            self.names.pop(name, None)
+        _unlink(name)
+
+    def close(self):
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+_attached = {}
+_attached_lock = threading.Lock()
+
+def attach(name):
+    """Attach a published dataset in this process; interpreters reading its file use the shared columns"""
+    dataset = SharedDataset(name)
+    with _attached_lock:
+        _attached[dataset.source] = dataset
+    return dataset
+
+def attach_all(names):
+    # ProcessPoolExecutor(initializer=attach_all, initargs=(names,))
+    for name in names:
+        attach(name)
+
+def shared_dataset(filename):
+    """The attached dataset of filename while the file is unchanged since it was published, or None"""
+    dataset = _attached.get(os.path.abspath(filename))
+    if dataset is None:
+        return None
+    try:
+        if dataset.fingerprint != file_fingerprint(filename):
+            return None
+    except OSError:
+        pass
+    return dataset
+
+def sweep_stale():
+    """Delete shared files whose owner process is no longer running"""
+    try:
+        entries = os.listdir(SHARED_DIR)
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.startswith(PREFIX):
+            continue
+        owner = entry[len(PREFIX):].split('_', 1)[0]
+        if owner.isdigit() and not _alive(int(owner)):
+            _unlink(entry)
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _remove(pid, names):
+    # Forked children inherit the registry but must not delete the parent's files
+    if os.getpid() != pid:
+        return
+    for name in list(names):
+        _unlink(name)
+    names.clear()
+
+def _unlink(name):
+    try:
+        os.unlink(_path(name))
+    except FileNotFoundError:
+        pass
+
+def _path(name):
+    if not name.startswith(PREFIX) or os.sep in name:
+        raise ValueError(f"Nombre de conjunto compartido no válido: {name}")
+    return os.path.join(SHARED_DIR, name)
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def _encode(series):
+    """(kind, dtype, [buffers]) of a column"""
+    values = series.to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'array', str(values.dtype), [np.ascontiguousarray(values).view(np.int64)]
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biuf':
+        return 'array', values.dtype.str, [np.ascontiguousarray(values)]
+    if isinstance(series.dtype, pd.StringDtype):
+        missing = series.isna().to_numpy()
+        texts = [text for text in series[~missing]]
+        lengths = np.zeros(len(series), dtype=np.int64)
+        lengths[~missing] = [len(text) for text in texts]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        return 'text', 'str', [np.frombuffer(''.join(texts).encode('utf-8'), dtype=np.uint8), offsets, missing]
+    # Mixed object columns are rare, they are pickled
+    return 'pickle', 'object', [np.frombuffer(pickle.dumps(values), dtype=np.uint8)]
+
+def _write(path, frame, manifest):
+    columns = []
+    buffers = []
+    offset = 0
+    for name in frame.columns:
+        kind, dtype, parts = _encode(frame[name])
+        # Part offsets are relative to the aligned end of the manifest
+        entries = []
+        for part in parts:
+            entries.append([offset, part.nbytes, part.dtype.str])
+            offset = _aligned(offset + part.nbytes)
+        columns.append({'name': name, 'kind': kind, 'dtype': dtype, 'parts': entries})
+        buffers.extend(parts)
+    encoded = json.dumps(dict(manifest, rows=len(frame), columns=columns)).encode('utf-8')
+    base = _aligned(HEADER_BYTES + len(encoded))
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as shared_file:
+        shared_file.write(len(encoded).to_bytes(HEADER_BYTES, 'little'))
+        shared_file.write(encoded)
+        starts = [entry[0] for column in columns for entry in column['parts']]
+        for start, part in zip(starts, buffers):
+            shared_file.seek(base + start)
+            shared_file.write(part.tobytes())
+        shared_file.truncate(max(base + offset, 1))
+    # Workers never see a half written file
+    os.replace(temporary, path)
+
+def _read_column(buffer, base, column):
+    parts = [np.frombuffer(buffer, dtype=np.dtype(dtype), count=size // np.dtype(dtype).itemsize, offset=base + start)
+             for start, size, dtype in column['parts']]
+    if column['kind'] == 'array':
+        values = parts[0]
+        if column['dtype'].startswith('datetime64'):
+            values = values.view(column['dtype'])
+        return pd.Series(values, copy=False)
+    if column['kind'] == 'text':
+        blob, offsets, missing = parts
+        text = blob.tobytes().decode('utf-8')
+        values = np.array([text[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())],
+                          dtype=object)
+        values[missing] = np.nan
+        return pd.Series(values, dtype='str')
+    return pd.Series(pickle.loads(parts[0].tobytes()))
@@ -0,0 +1,194 @@
+import math
+import numpy as np
+import pandas as pd
+
+DEFAULT_K = 200
+CAPACITY_DECAY = 2.0 / 3.0
+HLL_PRECISION = 14
+
+class KllSketch:
+    """Mergeable quantile sketch (KLL) with memory bounded by about 3 * k values.
+
+    Level h holds values that each stand for 2**h input rows. When a level
+    outgrows its capacity it is sorted and every other value is promoted to
+    the next level, so the rank error stays around 1.7 / k of the row count
+    no matter how many rows are added or how the input was partitioned.
+    """
+
+    def __init__(self, k=DEFAULT_K):
+        self.k = k
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self.levels = [np.empty(0)]
+        # Alternating compaction offset keeps the sketch deterministic and unbiased on average
+        self._flip = 0
+
+    def update(self, values):
+        """Add a block of numeric values; NaN must be removed by the caller"""
+        values = np.asarray(values, dtype='float64')
+        if not len(values):
+            return self
+        self.count += len(values)
+        low, high = float(values.min()), float(values.max())
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+        return self
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate((self.levels[level], values))
+        self._compress()
+        return self
+
+    def copy(self):
+        sketch = KllSketch(self.k)
+        sketch.count, sketch.minimum, sketch.maximum = self.count, self.minimum, self.maximum
+        sketch.levels = [values.copy() for values in self.levels]
+        sketch._flip = self._flip
+        return sketch
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * CAPACITY_DECAY ** depth)), 2)
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(values)
+                # An odd value out stays behind so no weight is lost
+                keep = values[:1] if len(values) % 2 else values[:0]
+                paired = values[len(keep):]
+                promoted = paired[self._flip::2]
+                self._flip ^= 1
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+            level += 1
+
+    def quantile(self, fraction):
+        """Approximate value at the given fraction (0..1) of the sorted input"""
+        if self.count == 0:
+            return math.nan
+        if fraction <= 0:
+            return self.minimum
+        if fraction >= 1:
+            return self.maximum
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        position = int(np.searchsorted(cumulative, fraction * cumulative[-1], side='left'))
+        return float(values[order][min(position, len(values) - 1)])
+
+    def retained(self):
+        return sum(len(values) for values in self.levels)
+
+    def to_dict(self):
+        return {
+            'k': self.k,
+            'count': self.count,
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'levels': [values.tolist() for values in self.levels],
+            'flip': self._flip
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch.minimum = data['minimum']
+        sketch.maximum = data['maximum']
+        sketch.levels = [np.asarray(values, dtype='float64') for values in data['levels']] or [np.empty(0)]
+        sketch._flip = data.get('flip', 0)
+        return sketch
+
+class HyperLogLog:
+    """Distinct-count sketch with 2**precision one-byte registers (16 KB, ~0.8% error by default).
+
+    Each value is hashed to 64 bits: the top bits pick a register and the
+    register keeps the longest run of leading zeros seen in the rest.
+    Merging takes the register-wise maximum.
+    """
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Add a block of non-null values of any type"""
+        values = np.asarray(values)
+        if not len(values):
+            return self
+        hashes = pd.util.hash_array(values)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        # Position of the first set bit, counted from the top of the remaining 64 - precision bits
+        rank = np.minimum(_leading_zeros(rest) + 1, 64 - self.precision + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def copy(self):
+        sketch = HyperLogLog(self.precision)
+        sketch.registers = self.registers.copy()
+        return sketch
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small cardinalities: linear counting over the empty registers
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+    def to_dict(self):
+        return {'precision': self.precision, 'registers': self.registers.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['precision'])
+        sketch.registers = np.asarray(data['registers'], dtype=np.uint8)
+        return sketch
+
+def _leading_zeros(words):
+    # Binary search on the bit position, vectorized over uint64 words
+    zeros = np.zeros(len(words), dtype=np.int64)
+    words = words.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (words >> np.uint64(64 - shift)) == 0
+        zeros[empty] += shift
+        words[empty] <<= np.uint64(shift)
+    zeros[words == 0] = 64
+    return zeros
+
+def exact_quantile(values, fraction):
+    """Linearly interpolated quantile (same as pandas) using selection instead of a full sort"""
+    if not len(values):
+        return math.nan
+    rank = fraction * (len(values) - 1)
+    lower = int(math.floor(rank))
+    upper = min(lower + 1, len(values) - 1)
+    selected = np.partition(values, lower)
+    low = float(selected[lower])
+    # Everything after the lower rank is >= it, so the next order statistic is just their minimum
+    high = float(selected[lower + 1:].min()) if upper != lower else low
+    return low + (high - low) * (rank - lower)
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+MAX_PERMUTATIONS = 16
+# Selections smaller than this share of the dataset sort their own ranks instead of walking a full permutation
+WALK_FRACTION = 1 / 16
+
+def sort_keys(sorting):
+    """((column, ascending), ...) of a sort statement"""
+    return tuple(zip(sorting['columns'], sorting['ascending']))
+
+def describe_sort(sorting):
+    return ', '.join(f"{column} {'asc' if ascending else 'desc'}" for column, ascending in sort_keys(sorting))
+
+class SortIndexCatalog:
+    """Sort ranks per column and sort permutations per key list of a loaded dataset.
+
+    A column's rank is its dense code in sorted order (missing values
+    last), so any multi-column sort is a stable lexsort of small integer
+    arrays. Full-dataset permutations are cached, and a filtered selection
+    is sorted by walking the permutation and keeping its own rows.
+    Frames passed to sort() must be row subsets of the dataset that keep
+    its index labels.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._ranks = {}
+        self._permutations = OrderedDict()
+        # Interpreters running in threads share the catalog of a cached dataset
+        self._lock = threading.Lock()
+
+    def rank(self, column, ascending=True, positions=None):
+        """Sort rank of every row of a column (or of the rows at positions)"""
+        if column not in self._ranks:
+            codes, uniques = pd.factorize(self.frame[column], sort=True)
+            codes = codes.astype(np.int64)
+            codes[codes < 0] = len(uniques)
+            self._ranks[column] = (codes, len(uniques))
+        codes, count = self._ranks[column]
+        if positions is not None:
+            codes = codes[positions]
+        if ascending:
+            return codes
+        # Reverse the order but keep missing values last, as pandas does
+        return np.where(codes == count, count, count - 1 - codes)
+
+    def permutation(self, keys):
+        """Positions of every row of the dataset in sorted order; ties keep the original order"""
+        keys = tuple(keys)
+        with self._lock:
+            if keys in self._permutations:
+                self._permutations.move_to_end(keys)
+                return self._permutations[keys]
+        # lexsort takes the primary key last
+        permutation = np.lexsort([self.rank(column, ascending) for column, ascending in reversed(keys)])
+        with self._lock:
+            self._permutations[keys] = permutation
+            while len(self._permutations) > MAX_PERMUTATIONS:
+                self._permutations.popitem(last=False)
+        return permutation
+
+    def cached(self, keys):
+        return tuple(keys) in self._permutations
+
+    def sort(self, frame, keys):
+        keys = tuple(keys)
+        if frame is self.frame:
+            return frame.iloc[self.permutation(keys)]
+        positions = self.frame.index.get_indexer(frame.index)
+        if keys not in self._permutations and len(frame) < len(self.frame) * WALK_FRACTION:
+            order = np.lexsort([self.rank(column, ascending, positions) for column, ascending in reversed(keys)])
+            return frame.iloc[order]
+        # Walk the stored permutation and keep the rows of the selection, no new sort needed
+        inverse = np.full(len(self.frame), -1, dtype=np.intp)
+        inverse[positions] = np.arange(len(positions))
+        selected = inverse[self.permutation(keys)]
+        return frame.iloc[selected[selected >= 0]]
+
+def sort_frame(frame, sorting, catalog=None):
+    """frame sorted by every key of sorting: stable, missing values last"""
+    if catalog is not None:
+        try:
+            return catalog.sort(frame, sort_keys(sorting))
+        except TypeError:
+            # Mixed types in a column have no total order for factorize, let pandas decide
+            pass
+    return frame.sort_values(by=list(sorting['columns']), ascending=list(sorting['ascending']), kind='stable')
@@ -0,0 +1,438 @@
+import os
+import json
+import math
+import sqlite3
+import threading
+import contextlib
+import numpy as np
+import pandas as pd
+from aggregation import AggregationEngine, ColumnState
+from backends import Backend
+from column_stats import file_fingerprint
+from dates import DATE_PATTERN, coerce_date, is_date_column, read_csv
+from predicates import filter_predicate
+from query_result import DEFAULT_CHUNK_SIZE, QueryResult
+from sort_index import sort_keys
+
+DATABASE_VERSION = 1
+TABLE = 'data'
+# Rows per insert batch and per fetched chunk; a multiple of the aggregation block size
+CHUNK_ROWS = 65536
+BUSY_TIMEOUT = 30
+NAT = np.iinfo(np.int64).min
+SQL_OPERATORS = {'==': '=', '!=': '!=', '>': '>', '<': '<', '>=': '>=', '<=': '<='}
+MAX_DATABASES = 8
+
+class SQLiteDatabase:
+    """SQLite copy of a CSV file, kept next to it as <file>.sqlite.
+
+    Built once from the CSV and rebuilt when the CSV changes. Each column
+    gets a B-tree index the first time a query filters or sorts on it, and
+    the index stays in the file for later queries and processes. Column
+    types are kept so fetched rows come back with the dtypes read_csv gives.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.path = database_filename(source)
+        self._lock = threading.Lock()
+        if not self._current():
+            self._build()
+        with contextlib.closing(self.connect()) as connection:
+            meta = dict(connection.execute('SELECT key, value FROM dsl_meta'))
+            self.indexes = {name for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?", (TABLE,))}
+        self.fingerprint = json.loads(meta['fingerprint'])
+        self.dtypes = dict(json.loads(meta['columns']))
+        self.columns = list(self.dtypes)
+        # Zero rows with the real dtypes, to type-check filters and shape empty results
+        self.schema = pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in self.dtypes.items()})
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        # LIKE keeps the case-sensitive semantics of the in-memory text filters
+        connection.execute('PRAGMA case_sensitive_like = ON')
+        return connection
+
+    def ensure_indexes(self, connection, columns):
+        """Create the missing indexes of columns, then refresh the planner's statistics"""
+        missing = [column for column in columns if _index_name(self.columns, column) not in self.indexes]
+        if not missing:
+            return
+        with self._lock:
+            for column in missing:
+                name = _index_name(self.columns, column)
+                connection.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {TABLE} ({_quote(column)})')
+                self.indexes.add(name)
+            connection.execute(f'ANALYZE {TABLE}')
+            connection.commit()
+
+    def _current(self):
+        try:
+            connection = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+            try:
+                meta = dict(connection.execute('SELECT key, value FROM dsl_meta'))
+            finally:
+                connection.close()
+            return meta.get('version') == str(DATABASE_VERSION) \
+                and json.loads(meta.get('fingerprint', 'null')) == file_fingerprint(self.source)
+        except (sqlite3.Error, OSError, ValueError):
+            return False
+
+    def _build(self):
+        fingerprint = file_fingerprint(self.source)
+        frame = read_csv(self.source)
+        temporary = f'{self.path}.{os.getpid()}.tmp'
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        connection = sqlite3.connect(temporary)
+        try:
+            connection.execute('PRAGMA journal_mode = OFF')
+            connection.execute('PRAGMA synchronous = OFF')
+            connection.execute('CREATE TABLE dsl_meta (key TEXT PRIMARY KEY, value TEXT)')
+            definitions = ', '.join(f'{_quote(name)} {_sql_type(frame[name])}' for name in frame.columns)
+            connection.execute(f'CREATE TABLE {TABLE} ({definitions})')
+            insert = f"INSERT INTO {TABLE} VALUES ({', '.join('?' * len(frame.columns))})"
+            for start in range(0, len(frame), CHUNK_ROWS):
+                chunk = frame.iloc[start:start + CHUNK_ROWS]
+                connection.executemany(insert, zip(*(_sql_values(chunk[name]) for name in frame.columns)))
+            columns = [[name, str(frame[name].dtype)] for name in frame.columns]
+            connection.executemany('INSERT INTO dsl_meta VALUES (?, ?)', [
+                ('version', str(DATABASE_VERSION)),
+                ('source', os.path.abspath(self.source)),
+                ('fingerprint', json.dumps(fingerprint)),
+                ('columns', json.dumps(columns))
+            ])
+            connection.commit()
+        except BaseException:
+            connection.close()
+            os.unlink(temporary)
+            raise
+        connection.close()
+        # Readers never see a half built database
+        os.replace(temporary, self.path)
+        print(f"DEBUG: Built SQLite database {self.path} with {len(frame)} records")
+
+class SQLiteRelation:
+    """Rows of a database selected by WHERE conditions, in an order; nothing runs until rows are read.
+
+    Filters SQLite cannot express (computed expressions, mixed object
+    columns) stay residual and run in pandas on each fetched chunk.
+    """
+
+    def __init__(self, database, conditions=(), parameters=(), residual=(), sorting=None, columns=()):
+        self.database = database
+        self.conditions = tuple(conditions)
+        self.parameters = tuple(parameters)
+        self.residual = tuple(residual)
+        self.sorting = sorting
+        # Columns used by filters or the sort, which get indexes
+        self.columns = tuple(columns)
+        self._count = None
+
+    def derive(self, condition=None, parameters=(), residual=None, sorting=None, columns=()):
+        return SQLiteRelation(self.database,
+                              self.conditions + ((condition,) if condition else ()),
+                              self.parameters + tuple(parameters),
+                              self.residual + ((residual,) if residual is not None else ()),
+                              sorting if sorting is not None else self.sorting,
+                              self.columns + tuple(column for column in columns if column not in self.columns))
+
+    def unsorted(self):
+        # File order, the order the in-memory engine aggregates in
+        relation = SQLiteRelation(self.database, self.conditions, self.parameters, self.residual, None, self.columns)
+        relation._count = self._count
+        return relation
+
+    def select(self, columns=None):
+        """SQL and parameters returning rowid - 1 and columns of every selected row, in order"""
+        columns = self.database.columns if columns is None else columns
+        names = ', '.join(['rowid - 1'] + [_quote(column) for column in columns])
+        sql = f'SELECT {names} FROM {TABLE}{self._where()}'
+        order = [f"{_quote(column)} {'ASC' if ascending else 'DESC'} NULLS LAST"
+                 for column, ascending in (sort_keys(self.sorting) if self.sorting else ())]
+        # rowid last: ties keep the file order, like a stable sort
+        return f"{sql} ORDER BY {', '.join(order + ['rowid'])}", self.parameters
+
+    def count(self):
+        if self._count is None:
+            if self.residual:
+                self._count = sum(len(frame) for frame in self.frames(CHUNK_ROWS, []))
+            else:
+                with contextlib.closing(self.connect()) as connection:
+                    self._count = connection.execute(f'SELECT COUNT(*) FROM {TABLE}{self._where()}',
+                                                     self.parameters).fetchone()[0]
+        return self._count
+
+    def frames(self, chunk_size, columns=None):
+        """DataFrames of at most chunk_size selected rows holding columns (all by default) and the row labels"""
+        columns = list(self.database.columns if columns is None else columns)
+        # Residual filters need their own columns, which are dropped again afterwards
+        needed = columns + [column for column in _residual_columns(self.residual, self.database.columns)
+                            if column not in columns]
+        sql, parameters = self.select(needed)
+        connection = self.connect()
+        try:
+            cursor = connection.execute(sql, parameters)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                frame = self._frame(rows, needed)
+                for filter_op in self.residual:
+                    frame = frame[filter_predicate(filter_op).mask(frame)]
+                yield frame[columns]
+        finally:
+            connection.close()
+
+    def frame(self):
+        frames = list(self.frames(CHUNK_ROWS))
+        if not frames:
+            return self.database.schema.copy()
+        return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    def explain(self):
+        sql, parameters = self.select()
+        with contextlib.closing(self.connect()) as connection:
+            details = [row[-1] for row in connection.execute(f'EXPLAIN QUERY PLAN {sql}', parameters)]
+        if self.residual:
+            details.append(f'{len(self.residual)} filtro(s) en pandas')
+        return f"SQLite: {'; '.join(details)}"
+
+    def connect(self):
+        connection = self.database.connect()
+        self.database.ensure_indexes(connection, self.columns)
+        return connection
+
+    def _where(self):
+        return f" WHERE {' AND '.join(self.conditions)}" if self.conditions else ''
+
+    def _frame(self, rows, columns):
+        values = list(zip(*rows))
+        frame = pd.DataFrame({column: _column(values[position + 1], self.database.dtypes[column])
+                              for position, column in enumerate(columns)})
+        # Row labels of the file, like a selection of the in-memory dataset
+        frame.index = pd.Index(np.array(values[0], dtype=np.int64))
+        return frame
+
+class SQLiteBackend(Backend):
+    """Runs filters, sort and aggregates in a SQLite copy of the CSV.
+
+    Filters and the sort are compiled to one SQL query that uses the
+    on-disk indexes. Rows are read in chunks, so counts, aggregates and
+    exports use constant memory: aggregates go through the same mergeable
+    states as the in-memory engine. Only materialized records (or a
+    page, which is cut from the selection) bring every row into memory.
+    """
+
+    name = 'sqlite'
+    in_memory = False
+
+    def load(self, filename):
+        return SQLiteRelation(database_for(filename))
+
+    def filter(self, relation, filter_op, text_indexes=None, date_indexes=None):
+        database = relation.database
+        column = filter_op['column']
+        predicate = filter_predicate(filter_op)
+        # Same type errors as the in-memory engine, raised before any SQL runs
+        predicate.check(database.schema)
+        if filter_op.get('expression') is not None or column not in database.dtypes:
+            return relation.derive(residual=filter_op)
+        condition = _condition(database.schema[column], filter_op)
+        if condition is None:
+            return relation.derive(residual=filter_op)
+        sql, parameters = condition
+        return relation.derive(sql, parameters, columns=[column])
+
+    def sort(self, relation, sorting, catalog=None):
+        return relation.derive(sorting=sorting, columns=[column for column, _ in sort_keys(sorting)])
+
+    def count(self, relation):
+        return relation.count()
+
+    def aggregate(self, relation, aggregations):
+        engine = AggregationEngine(aggregations)
+        relation = relation.unsorted()
+        schema = relation.database.schema
+        # The empty selection raises the same errors (a sum of text, an unknown column) as pandas would
+        state = engine.partial(schema)
+        columns = {}
+        streamed = []
+        for column, needs in engine.needs.items():
+            if needs <= {'range'} and not relation.residual and _numeric(schema[column]):
+                columns[column] = _range_state(relation, column)
+            else:
+                streamed.append(column)
+        if streamed:
+            for frame in relation.frames(CHUNK_ROWS, streamed):
+                state = engine.merge(state, engine.partial(frame))
+        state['rows'] = relation.count()
+        state['columns'].update(columns)
+        return engine.finalize(state)
+
+    def iter_frames(self, relation, chunk_size):
+        return relation.frames(chunk_size)
+
+    def materialize(self, relation, aggregations, materialize=True, sorting=None, complete=None):
+        return SQLiteResult(relation, aggregations, materialize, sorting)
+
+    def explain(self, relation):
+        return relation.explain()
+
+class SQLiteResult(QueryResult):
+    """Result of a print run by SQLite: rows stay in the database until they are read.
+
+    The full frame is fetched on first use (records, pages); iter_chunks()
+    and the writers stream the rows from a cursor instead.
+    """
+
+    def __init__(self, relation, aggregations, materialize=True, sorting=None):
+        dict.__init__(self)
+        self.relation = relation
+        self.sorting = sorting
+        self.complete = None
+        self.checkpoint = None
+        self._frame = None
+        self['aggregations'] = aggregations
+        self['record_count'] = relation.count()
+        if materialize:
+            self['filtered_data'] = self.to_records()
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            self._frame = self.relation.frame()
+        return self._frame
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        if self._frame is not None:
+            yield from super().iter_chunks(chunk_size)
+            return
+        for frame in self.relation.frames(chunk_size):
+            if self.checkpoint is not None:
+                self.checkpoint()
+            yield frame
+
+def database_filename(filename):
+    return f"{filename}.sqlite"
+
+_databases = {}
+_databases_lock = threading.Lock()
+
+def database_for(filename):
+    """SQLite database of a CSV file, built on first use and shared while the file is unchanged"""
+    key = os.path.abspath(filename)
+    fingerprint = file_fingerprint(filename)
+    with _databases_lock:
+        database = _databases.get(key)
+        if database is None or database.fingerprint != fingerprint:
+            database = _databases[key] = SQLiteDatabase(filename)
+            while len(_databases) > MAX_DATABASES:
+                _databases.pop(next(iter(_databases)))
+        return database
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+def _index_name(columns, column):
+    return f'dsl_index_{columns.index(column)}'
+
+def _sql_type(series):
+    if is_date_column(series):
+        return 'INTEGER'
+    kind = series.dtype.kind if isinstance(series.dtype, np.dtype) else ''
+    if kind and kind in 'biu':
+        return 'INTEGER'
+    if kind == 'f':
+        return 'REAL'
+    return 'TEXT'
+
+def _sql_values(series):
+    """Python values SQLite stores for a column: dates as nanoseconds, missing values as NULL"""
+    if is_date_column(series):
+        values = series.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        return [None if value == NAT else value for value in values.tolist()]
+    values = series.to_numpy()
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biu':
+        return [int(value) for value in values.tolist()]
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind == 'f':
+        return [None if math.isnan(value) else value for value in values.tolist()]
+    return [None if not isinstance(value, str) and pd.isna(value) else str(value) for value in values.tolist()]
+
+def _column(values, dtype):
+    if dtype.startswith('datetime64'):
+        nanoseconds = np.array([NAT if value is None else value for value in values], dtype=np.int64)
+        return pd.Series(nanoseconds.view('datetime64[ns]')).astype(dtype)
+    if dtype in ('str', 'object'):
+        return pd.Series(values, dtype=dtype)
+    if dtype.startswith('float'):
+        return pd.Series(np.array(values, dtype=np.float64)).astype(dtype)
+    return pd.Series(np.array(values, dtype=dtype))
+
+def _numeric(series):
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+def _residual_columns(filters, columns):
+    names = []
+    for filter_op in filters:
+        expression = filter_op.get('expression')
+        for column in expression.columns() if expression is not None else [filter_op['column']]:
+            if column in columns and column not in names:
+                names.append(column)
+    return names
+
+def _literal(value):
+    # SQLite integers are 64-bit; larger literals compare as floats, like the in-memory engine does
+    if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+        return int(value) if abs(int(value)) < 2 ** 63 else float(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    return value
+
+def _condition(series, filter_op):
+    """(SQL, parameters) of a filter over series' column, or None when it must run in pandas"""
+    column, operator, value = _quote(filter_op['column']), filter_op['operator'], filter_op['value']
+    literals = value if isinstance(value, list) else [value]
+    if any(isinstance(literal, float) and math.isnan(literal) for literal in literals):
+        return None
+    if is_date_column(series):
+        if operator == 'between':
+            literals = [coerce_date(literal).as_unit('ns').value for literal in value]
+        elif operator in ('==', '!=') and isinstance(value, str) and not DATE_PATTERN.fullmatch(value):
+            # A text that is not a date never equals a date
+            return ('1' if operator == '!=' else '0'), ()
+        else:
+            literals = [coerce_date(value).as_unit('ns').value]
+    elif not isinstance(series.dtype, pd.StringDtype) and not pd.api.types.is_numeric_dtype(series):
+        return None
+    if operator == 'starts_with':
+        if not isinstance(series.dtype, pd.StringDtype):
+            return None
+        return f"{column} LIKE ? ESCAPE '\\'", (_escape_like(value) + '%',)
+    if operator == 'contains':
+        if not isinstance(series.dtype, pd.StringDtype):
+            return None
+        return f'instr({column}, ?) > 0', (value,)
+    if operator == 'like':
+        if not isinstance(series.dtype, pd.StringDtype):
+            return None
+        return f'{column} LIKE ?', (value,)
+    literals = [_literal(literal) for literal in literals]
+    if operator == 'between':
+        return f'{column} BETWEEN ? AND ?', tuple(literals)
+    if operator == '!=':
+        # Missing values differ from any literal, as in pandas
+        return f'({column} != ? OR {column} IS NULL)', tuple(literals)
+    return f'{column} {SQL_OPERATORS[operator]} ?', tuple(literals)
+
+def _escape_like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _range_state(relation, column):
+    # Minimum and maximum straight from SQLite, which reads them from the index when it can
+    with contextlib.closing(relation.connect()) as connection:
+        minimum, maximum = connection.execute(
+            f'SELECT MIN({_quote(column)}), MAX({_quote(column)}) FROM {TABLE}{relation._where()}',
+            relation.parameters).fetchone()
+    return ColumnState(count=0 if minimum is None else 1, minimum=minimum, maximum=maximum)
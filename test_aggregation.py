@@ -0,0 +1,42 @@
+import os
+import math
+import pandas as pd
+from aggregation import AggregationEngine
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+AGGREGATES = ('aggregate count column "id_empleado"; aggregate sum column "dias_laborados"; '
+              'aggregate average column "salario"; aggregate min column "salario"; aggregate max column "edad"; '
+              'aggregate stddev column "salario"; aggregate count distinct column "departamento"; '
+              'aggregate min column "fecha_ingreso"; aggregate max column "cargo";')
+
+def test_fused_aggregates_match_pandas():
+    selected = DATA[DATA['edad'] > 30]
+    aggregations = parse_and_interpret(f'load "{EMPLEADOS}"; filter column "edad" > 30;' + AGGREGATES + 'print;')[
+        'aggregations']
+    assert aggregations['count_id_empleado'] == len(selected)
+    assert aggregations['sum_dias_laborados'] == selected['dias_laborados'].sum()
+    assert math.isclose(aggregations['average_salario'], selected['salario'].mean(), rel_tol=1e-12)
+    assert aggregations['min_salario'] == selected['salario'].min()
+    assert aggregations['max_edad'] == selected['edad'].max()
+    assert math.isclose(aggregations['stddev_salario'], selected['salario'].std(), rel_tol=1e-9)
+    assert aggregations['count_distinct_departamento'] == selected['departamento'].nunique()
+    assert aggregations['min_fecha_ingreso'] == selected['fecha_ingreso'].min()
+    assert aggregations['max_cargo'] == selected['cargo'].max()
+
+def test_merged_partial_states_match_one_pass():
+    engine = AggregationEngine([
+        {'function': 'sum', 'column': 'salario'}, {'function': 'stddev', 'column': 'salario'},
+        {'function': 'min', 'column': 'edad'}, {'function': 'count_distinct', 'column': 'cargo'},
+        {'function': 'count', 'column': 'id_empleado'},
+    ])
+    state = engine.empty()
+    for start in range(0, len(DATA), 37):
+        # Round trip through the serialized form, as incremental executors do
+        partial = engine.state_from_dict(engine.state_to_dict(engine.partial(DATA.iloc[start:start + 37])))
+        state = engine.merge(state, partial)
+    merged, whole = engine.finalize(state), engine.compute(DATA)
+    assert merged.keys() == whole.keys()
+    for name, value in whole.items():
+        assert math.isclose(merged[name], value, rel_tol=1e-9), name
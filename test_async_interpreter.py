@@ -0,0 +1,43 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from async_interpreter import AsyncInterpreter
+from employee_dsl_interpreter import parse_and_interpret, parse_and_interpret_all
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+BY_DEPARTMENT = (f'load "{EMPLEADOS}"; filter column "departamento" == $dept; '
+                 'aggregate average column "salario"; sort column "edad" asc; print;')
+TWO_PRINTS = f'load "{EMPLEADOS}"; filter column "edad" > 25; print; filter column "salario" > 4000; print;'
+
+def plain(result):
+    return result['aggregations'], result['filtered_data']
+
+def test_concurrent_runs_match_synchronous_runs():
+    async def main():
+        interpreter = AsyncInterpreter(executor=ThreadPoolExecutor(4))
+        return await asyncio.gather(*(interpreter.run(BY_DEPARTMENT, {'dept': dept})
+                                      for dept in ('Ventas', 'Legal', 'Tecnología')),
+                                    interpreter.run_all(TWO_PRINTS))
+    *singles, both = asyncio.run(main())
+    for dept, result in zip(('Ventas', 'Legal', 'Tecnología'), singles):
+        assert plain(result) == plain(parse_and_interpret(BY_DEPARTMENT, params={'dept': dept}))
+    assert [plain(result) for result in both] == [plain(result) for result in parse_and_interpret_all(TWO_PRINTS)]
+
+def test_identical_concurrent_runs_share_one_execution():
+    async def main():
+        interpreter = AsyncInterpreter()
+        return await asyncio.gather(*(interpreter.run(BY_DEPARTMENT, {'dept': 'Ventas'}) for _ in range(3)))
+    first, second, third = asyncio.run(main())
+    assert first is second is third
+
+def test_cancelled_run_raises_and_the_interpreter_keeps_working():
+    async def main():
+        interpreter = AsyncInterpreter()
+        task = asyncio.ensure_future(interpreter.run(TWO_PRINTS))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await interpreter.run(TWO_PRINTS)
+    assert plain(asyncio.run(main())) == plain(parse_and_interpret(TWO_PRINTS))
@@ -0,0 +1,38 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from bitmaps import CONTAINER_ROWS, RoaringBitmap
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+SIZE = 3 * CONTAINER_ROWS + 1234
+
+def masks():
+    rng = np.random.default_rng(11)
+    # A sparse, a dense and an empty container, plus a partial last one
+    densities = np.repeat([0.01, 0.6, 0.0, 0.3], CONTAINER_ROWS)[:SIZE]
+    return rng.random(SIZE) < densities, rng.random(SIZE) < np.roll(densities, CONTAINER_ROWS)
+
+@pytest.mark.parametrize('popcount', ['numpy', 'table'])
+def test_bitmap_operations_match_boolean_masks(monkeypatch, popcount):
+    if popcount == 'table':
+        monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    left, right = masks()
+    a, b = RoaringBitmap.from_mask(left), RoaringBitmap.from_mask(right)
+    for bitmap, expected in [(a, left), (a & b, left & right), (a | b, left | right), (~a, ~left),
+                             (a - b, left & ~right)]:
+        assert bitmap.count() == int(expected.sum())
+        assert np.array_equal(bitmap.to_mask(), expected)
+    assert RoaringBitmap.from_positions(np.flatnonzero(left), SIZE) == a
+
+def test_cached_filter_bitmaps_give_the_same_rows():
+    script = (f'load "{EMPLEADOS}"; filter column "departamento" == "Tecnología"; filter column "edad" > 30; '
+              'aggregate count column "id_empleado"; print;')
+    first = parse_and_interpret(script)
+    second = parse_and_interpret(script.replace('print;', 'explain analyze;'))
+    assert 'bitmap en caché' in second['plan'].render()
+    assert second['filtered_data'] == first['filtered_data']
+    data = pd.read_csv(EMPLEADOS)
+    selected = data[(data['departamento'] == 'Tecnología') & (data['edad'] > 30)]
+    assert [record['id_empleado'] for record in first['filtered_data']] == selected['id_empleado'].tolist()
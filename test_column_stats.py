@@ -0,0 +1,30 @@
+import os
+import pandas as pd
+import pytest
+from column_stats import StatisticsCatalog
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+
+@pytest.mark.parametrize('body, mask', [
+    # Never true, always true, duplicated and ordinary filters
+    ('filter column "edad" > 1000;', DATA['edad'] > 1000),
+    ('filter column "edad" > 0; filter column "salario" > 3500;', DATA['salario'] > 3500),
+    ('filter column "departamento" == "Ventas"; filter column "departamento" == "Ventas";',
+     DATA['departamento'] == 'Ventas'),
+    ('filter column "departamento" == "No existe";', DATA['departamento'] == 'No existe'),
+    ('filter column "salario" between 3000 and 4000; filter column "edad" <= 30;',
+     DATA['salario'].between(3000, 4000) & (DATA['edad'] <= 30)),
+])
+def test_planned_filters_match_pandas(body, mask):
+    result = parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'aggregate sum column "salario"; print;')
+    assert result['record_count'] == int(mask.sum())
+    assert [record['id_empleado'] for record in result['filtered_data']] == DATA.loc[mask, 'id_empleado'].tolist()
+
+def test_statistics_prove_empty_results():
+    catalog = StatisticsCatalog.from_frame(DATA)
+    out_of_range = {'column': 'edad', 'operator': '>', 'value': float(DATA['edad'].max())}
+    assert catalog.plan_filters([out_of_range])[1]
+    everyone = {'column': 'edad', 'operator': '>=', 'value': float(DATA['edad'].min())}
+    assert catalog.plan_filters([everyone]) == ([], False)
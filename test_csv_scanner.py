@@ -0,0 +1,35 @@
+import os
+import json
+import pandas as pd
+import pytest
+from csv_scanner import CsvScanError, CsvScanner
+from dates import read_csv
+from employee_dsl_interpreter import parse_and_interpret_all
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EMPLEADOS = os.path.join(HERE, 'empleados.csv')
+with open(os.path.join(HERE, 'example_scripts.json'), 'r', encoding='utf-8') as f:
+    SCRIPTS = [script['contenido'].replace('"empleados.csv"', f'"{EMPLEADOS}"') for script in json.load(f)]
+
+def summary(results):
+    return [(result['record_count'], result['aggregations'], result['filtered_data'], result.get('page'))
+            for result in results]
+
+@pytest.mark.parametrize('script', SCRIPTS)
+def test_mmap_loader_matches_pandas_on_example_scripts(script):
+    assert summary(parse_and_interpret_all(script, loader='mmap')) == summary(parse_and_interpret_all(script))
+
+def test_scanned_columns_have_pandas_types(tmp_path):
+    path = tmp_path / 'tipos.csv'
+    path.write_text('entero,decimal,faltante,logico,texto,fecha\n'
+                    '1,2.5,,True,a,2020-01-01\n'
+                    '-7,3,4,false,,2021-12-31\n'
+                    '0,-0.125,NaN,FALSE,c c,2019-06-15\n', encoding='utf-8')
+    expected = read_csv(str(path))
+    pd.testing.assert_frame_equal(CsvScanner(str(path)).frame(), expected)
+
+def test_quoted_fields_are_rejected(tmp_path):
+    path = tmp_path / 'comillas.csv'
+    path.write_text('a,b\n1,"x,y"\n', encoding='utf-8')
+    with pytest.raises(CsvScanError):
+        CsvScanner(str(path))
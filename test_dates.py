@@ -0,0 +1,43 @@
+import os
+import operator
+import numpy as np
+import pandas as pd
+import pytest
+from dates import DateIndex
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS, parse_dates=['fecha_ingreso'])
+FECHA = DATA['fecha_ingreso']
+COMPARISONS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le, '==': operator.eq,
+               '!=': operator.ne}
+
+def run(body):
+    return parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')
+
+@pytest.mark.parametrize('body, mask', [
+    ('filter column "fecha_ingreso" >= 2020-01-01;', FECHA >= '2020-01-01'),
+    ('filter column "fecha_ingreso" < "2018-06-30";', FECHA < '2018-06-30'),
+    ('filter column "fecha_ingreso" between 2018-01-01 and 2019-12-31;', FECHA.between('2018-01-01', '2019-12-31')),
+    ('filter column "fecha_ingreso" != 2020-11-09;', FECHA != '2020-11-09'),
+    ('filter column "fecha_ingreso" == "no es fecha";', FECHA != FECHA),
+])
+def test_date_filters_match_pandas(body, mask):
+    result = run(body)
+    assert [record['id_empleado'] for record in result['filtered_data']] == DATA.loc[mask, 'id_empleado'].tolist()
+
+def test_date_sort_and_range_keep_the_iso_format():
+    result = run('sort column "fecha_ingreso" desc; aggregate min column "fecha_ingreso"; '
+                 'aggregate max column "fecha_ingreso";')
+    expected = DATA.sort_values('fecha_ingreso', ascending=False, kind='stable')
+    assert [record['id_empleado'] for record in result['filtered_data']] == expected['id_empleado'].tolist()
+    assert result['filtered_data'][0]['fecha_ingreso'] == FECHA.max().strftime('%Y-%m-%d')
+    assert result['aggregations']['min_fecha_ingreso'] == FECHA.min().strftime('%Y-%m-%d')
+
+def test_date_index_skips_missing_dates():
+    series = pd.Series(pd.to_datetime(['2021-03-01', None, '2019-01-01', '2021-03-01', '2020-05-05']))
+    index = DateIndex(series)
+    for symbol, compare in COMPARISONS.items():
+        assert np.array_equal(index.mask(symbol, '2020-05-05'), compare(series, '2020-05-05').to_numpy()), symbol
+    assert np.array_equal(index.mask('between', ['2020-01-01', '2021-03-01']),
+                          series.between('2020-01-01', '2021-03-01').to_numpy())
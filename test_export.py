@@ -0,0 +1,26 @@
+import io
+import os
+import json
+import pandas as pd
+from employee_dsl_interpreter import export_script, parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+SCRIPT = f'load "{EMPLEADOS}"; filter column "edad" > 40; sort column "salario" desc; print;'
+
+def test_ndjson_export_matches_records_in_small_chunks():
+    records = parse_and_interpret(SCRIPT)['filtered_data']
+    out = io.StringIO()
+    assert export_script(SCRIPT, out, 'ndjson', chunk_size=7)['record_count'] == len(records)
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == records
+
+def test_csv_export_matches_pandas(tmp_path):
+    path = tmp_path / 'resultado.csv'
+    export_script(SCRIPT, str(path), 'csv', chunk_size=7)
+    data = pd.read_csv(EMPLEADOS)
+    expected = data[data['edad'] > 40].sort_values('salario', ascending=False, kind='stable')
+    pd.testing.assert_frame_equal(pd.read_csv(path), expected.reset_index(drop=True))
+
+def test_empty_csv_export_keeps_header():
+    out = io.StringIO()
+    export_script(f'load "{EMPLEADOS}"; filter column "edad" > 1000; print;', out, 'csv')
+    assert out.getvalue().strip() == ','.join(pd.read_csv(EMPLEADOS, nrows=0).columns)
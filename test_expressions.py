@@ -0,0 +1,21 @@
+import os
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS, parse_dates=['fecha_ingreso'])
+
+def ids(body):
+    result = parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')
+    return [record['id_empleado'] for record in result['filtered_data']]
+
+@pytest.mark.parametrize('body, mask', [
+    ('filter column "salario" / column "dias_laborados" > 2;', DATA['salario'] / DATA['dias_laborados'] > 2),
+    ('filter (column "salario" + 500) * 2 <= 9000;', (DATA['salario'] + 500) * 2 <= 9000),
+    ('filter column "edad" - column "dias_laborados" / 365 between 20 and 40;',
+     (DATA['edad'] - DATA['dias_laborados'] / 365).between(20, 40)),
+    ('filter year(column "fecha_ingreso") == 2020;', DATA['fecha_ingreso'].dt.year == 2020),
+])
+def test_expression_filters_match_pandas(body, mask):
+    assert ids(body) == DATA.loc[mask, 'id_empleado'].tolist()
@@ -0,0 +1,44 @@
+import os
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import EmployeeDSLInterpreter, parse_script
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DEPTOS = pd.DataFrame({
+    'departamento': ['Tecnología', 'Ventas', 'Operaciones', 'Finanzas', 'Marketing', 'Otro'],
+    'presupuesto': [500000, 200000, 300000, 250000, 150000, 90000],
+    'sede': ['Bogotá', 'Medellín', 'Cali', 'Medellín', 'Cali', 'Bogotá'],
+})
+
+def run(script, chunk_size=None):
+    return EmployeeDSLInterpreter(join_chunk_size=chunk_size).visit(parse_script(script))
+
+@pytest.fixture
+def deptos(tmp_path):
+    path = tmp_path / 'deptos.csv'
+    DEPTOS.to_csv(path, index=False)
+    return path
+
+@pytest.mark.parametrize('chunk_size', [None, 7, 1000])
+def test_join_with_filters_on_both_sides_matches_merge(deptos, chunk_size):
+    result = run(f'load "{EMPLEADOS}"; load "{deptos}" as d; join d on column "departamento"; '
+                 'filter column "presupuesto" > 150000; filter column "edad" > 30; '
+                 'filter column "salario" * 100 - column "presupuesto" < 0; aggregate sum column "presupuesto"; print;',
+                 chunk_size)
+    merged = pd.read_csv(EMPLEADOS).merge(DEPTOS, on='departamento')
+    merged = merged[(merged['presupuesto'] > 150000) & (merged['edad'] > 30)
+                    & (merged['salario'] * 100 < merged['presupuesto'])]
+    got = sorted((record['id_empleado'], record['presupuesto'], record['sede']) for record in result['filtered_data'])
+    assert got == sorted(zip(merged['id_empleado'], merged['presupuesto'], merged['sede']))
+    assert result['aggregations']['sum_presupuesto'] == merged['presupuesto'].sum()
+
+def test_chunked_join_matches_whole_join(deptos):
+    script = (f'load "{EMPLEADOS}"; load "{deptos}" as d; join d on column "departamento"; '
+              'sort column "salario" desc; print;')
+    assert run(script, 5)['filtered_data'] == run(script)['filtered_data']
+
+def test_clashing_columns_get_the_alias():
+    script = f'load "{EMPLEADOS}"; load "{EMPLEADOS}" as e; join e on column "id_empleado"; print;'
+    record = run(script)['filtered_data'][0]
+    assert record['e.salario'] == record['salario']
+    assert run(script)['record_count'] == len(pd.read_csv(EMPLEADOS))
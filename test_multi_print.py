@@ -0,0 +1,27 @@
+import os
+import pandas as pd
+from employee_dsl_interpreter import parse_and_interpret, parse_and_interpret_all
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+STEPS = [
+    'filter column "edad" > 25; aggregate count column "id_empleado"; print;',
+    'filter column "salario" > 3000; aggregate average column "salario"; print;',
+    'sort column "salario" desc; print;',
+    'filter column "departamento" != "Ventas"; print;',
+]
+
+def test_each_print_matches_a_separate_run():
+    results = parse_and_interpret_all(f'load "{EMPLEADOS}";' + ''.join(STEPS))
+    assert len(results) == len(STEPS)
+    for number, result in enumerate(results, 1):
+        alone = parse_and_interpret(f'load "{EMPLEADOS}";' + ''.join(STEPS[:number]))
+        assert result['aggregations'] == alone['aggregations']
+        assert result['filtered_data'] == alone['filtered_data']
+
+def test_last_print_matches_pandas():
+    data = pd.read_csv(EMPLEADOS)
+    selected = data[(data['edad'] > 25) & (data['salario'] > 3000) & (data['departamento'] != 'Ventas')]
+    last = parse_and_interpret_all(f'load "{EMPLEADOS}";' + ''.join(STEPS))[-1]
+    expected = selected.sort_values('salario', ascending=False, kind='stable')
+    assert [record['id_empleado'] for record in last['filtered_data']] == expected['id_empleado'].tolist()
+    assert last['aggregations']['count_id_empleado'] == len(selected)
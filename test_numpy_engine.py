@@ -0,0 +1,54 @@
+import io
+import os
+import sys
+import json
+import subprocess
+import pytest
+import numpy_engine
+from benchmark_engines import same_result
+from employee_dsl_interpreter import export_script, parse_and_interpret
+from numpy_engine import UnsupportedFeature
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EMPLEADOS = os.path.join(HERE, 'empleados.csv')
+with open(os.path.join(HERE, 'example_scripts.json'), 'r', encoding='utf-8') as f:
+    SCRIPTS = [script['contenido'].replace('"empleados.csv"', f'"{EMPLEADOS}"') for script in json.load(f)]
+
+def plain(result):
+    return {'record_count': result['record_count'], 'aggregations': dict(result['aggregations']),
+            'filtered_data': result['filtered_data']}
+
+@pytest.mark.parametrize('script', SCRIPTS)
+def test_numpy_engine_matches_pandas_on_example_scripts(script):
+    # Same check as benchmark_engines.py: NaN equal to NaN, int distinct from float
+    assert same_result(plain(numpy_engine.parse_and_interpret(script)), plain(parse_and_interpret(script)))
+
+@pytest.mark.parametrize('fmt', ['ndjson', 'csv'])
+def test_exports_match_pandas(fmt):
+    script = (f'load "{EMPLEADOS}"; filter column "correo" like "%a%@empresa.com"; '
+              'sort column "departamento" asc, column "fecha_ingreso" desc; print;')
+    outputs = []
+    for export in (numpy_engine.export_script, export_script):
+        out = io.StringIO()
+        export(script, out, fmt, chunk_size=13)
+        outputs.append(out.getvalue())
+    assert outputs[0] == outputs[1]
+
+def test_missing_values_and_types_match_pandas(tmp_path):
+    path = tmp_path / 'huecos.csv'
+    path.write_text('id,valor,activo,fecha,nota\n1,2.5,True,2020-01-01,a\n2,,False,,\n3,7,True,2021-05-06,c\n',
+                    encoding='utf-8')
+    for body in ('filter column "valor" != 7;', 'filter column "nota" != "a"; sort column "valor" desc;',
+                 'filter column "fecha" < 2021-01-01;', 'aggregate sum column "valor"; aggregate max column "fecha";'):
+        script = f'load "{path}";{body}print;'
+        assert same_result(plain(numpy_engine.parse_and_interpret(script)), plain(parse_and_interpret(script))), body
+
+@pytest.mark.parametrize('body', ['limit 5;', 'sample 10%;', 'filter column "edad" * 2 > 60;',
+                                  'aggregate median column "edad";', 'explain;'])
+def test_unsupported_features_are_reported(body):
+    with pytest.raises(UnsupportedFeature):
+        numpy_engine.parse_and_interpret(f'load "{EMPLEADOS}";{body}print;')
+
+def test_engine_does_not_import_pandas():
+    check = 'import sys, numpy_engine; sys.exit("pandas" in sys.modules)'
+    assert subprocess.run([sys.executable, '-c', check], cwd=HERE).returncode == 0
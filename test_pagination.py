@@ -0,0 +1,45 @@
+import os
+import pandas as pd
+from employee_dsl_interpreter import parse_and_interpret
+from result_cache import ResultCache
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+QUERY = 'filter column "salario" > 3000; sort column "edad" desc, column "departamento" asc;'
+
+def run(path, body, cache=None):
+    return parse_and_interpret(f'load "{path}";' + QUERY + body + 'print;', result_cache=cache)
+
+def test_offset_and_cursor_pages_rebuild_the_full_result():
+    full = run(EMPLEADOS, '')
+    data = pd.read_csv(EMPLEADOS)
+    selected = data[data['salario'] > 3000].sort_values(['edad', 'departamento'], ascending=[False, True],
+                                                         kind='stable')
+    assert [record['id_empleado'] for record in full['filtered_data']] == selected['id_empleado'].tolist()
+    by_offset = []
+    for offset in range(0, full['record_count'], 40):
+        page = run(EMPLEADOS, f'limit 40 offset {offset};')
+        assert page['page']['total'] == full['record_count']
+        by_offset += page['filtered_data']
+    assert by_offset == full['filtered_data']
+    cache = ResultCache()
+    by_cursor, cursor = [], ''
+    while cursor is not None:
+        page = run(EMPLEADOS, f'limit 40 after "{cursor}";', cache)
+        assert page['aggregations'] == full['aggregations']
+        by_cursor += page['filtered_data']
+        cursor = page['page']['next_cursor']
+    assert by_cursor == full['filtered_data']
+    assert by_cursor == [record for start in range(0, full['record_count'], 40)
+                         for record in full.page(40, start)['filtered_data']]
+
+def test_cursor_survives_rows_added_before_it(tmp_path):
+    path = tmp_path / 'empleados.csv'
+    data = pd.read_csv(EMPLEADOS)
+    data.to_csv(path, index=False)
+    first = run(path, 'limit 30;')
+    # Appended rows that sort ahead of every existing one
+    added = data.head(20).assign(id_empleado=[f'NEW{number:04d}' for number in range(20)], edad=99)
+    pd.concat([data, added]).to_csv(path, index=False)
+    second = run(path, f'limit 30 after "{first["page"]["next_cursor"]}";')
+    assert [record['id_empleado'] for record in second['filtered_data']] == \
+        [record['id_empleado'] for record in run(EMPLEADOS, 'limit 30 offset 30;')['filtered_data']]
@@ -0,0 +1,52 @@
+import io
+import os
+import pandas as pd
+import pytest
+import parallel_csv
+from dates import read_csv
+from employee_dsl_interpreter import parse_and_interpret
+from parallel_csv import last_record_end, read_csv_parallel, read_partitions, split_ranges
+
+@pytest.fixture(autouse=True)
+def small_files_in_parallel(monkeypatch):
+    monkeypatch.setattr(parallel_csv, 'MIN_PARALLEL_BYTES', 0)
+
+def write(path, rows):
+    path.write_text(''.join(rows), encoding='utf-8')
+    return str(path)
+
+def test_quoted_newlines_never_straddle_ranges(tmp_path):
+    path = write(tmp_path / 'notas.csv', ['id,nota,valor,fecha\n'] + [
+        f'{i},"línea {i}\nsigue, con ""comillas""\n\nfin",{i * 1.5},2020-01-{i % 28 + 1:02d}\n' for i in range(400)])
+    header, ranges = split_ranges(path, 8)
+    assert len(ranges) == 8
+    expected = read_csv(path)
+    partitions = read_partitions(path, workers=8)
+    with open(path, 'rb') as csv_file:
+        data = csv_file.read()
+    # Each range parses on its own into exactly the rows of its partition
+    assert [len(pd.read_csv(io.BytesIO(header + data[start:end]))) for start, end in ranges] == \
+        [len(partition) for partition in partitions]
+    pd.testing.assert_frame_equal(pd.concat(partitions), expected)
+    pd.testing.assert_frame_equal(read_csv_parallel(path, workers=3), expected)
+
+def test_types_are_unified_across_ranges(tmp_path):
+    # Numbers then text in one column, dates then a non-date in another
+    rows = ['codigo,fecha,valor\n'] + [f'{i},2021-03-{i % 28 + 1:02d},{i}\n' for i in range(300)]
+    rows += ['X-1,pendiente,\n']
+    path = write(tmp_path / 'mixto.csv', rows)
+    pd.testing.assert_frame_equal(read_csv_parallel(path, workers=4), read_csv(path))
+
+def test_parallel_loader_matches_pandas_loader(monkeypatch):
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    empleados = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+    script = (f'load "{empleados}"; filter column "fecha_ingreso" >= 2019-01-01; sort column "salario" desc; '
+              'aggregate average column "salario"; print;')
+    parallel, single = parse_and_interpret(script, loader='parallel'), parse_and_interpret(script)
+    assert parallel['aggregations'] == single['aggregations']
+    assert parallel['filtered_data'] == single['filtered_data']
+
+def test_last_record_end_skips_newlines_inside_quotes():
+    data = b'1,"a\nb"\n2,"c\n'
+    assert last_record_end(data) == data.index(b'2')
+    assert last_record_end(b'"open\nfield') == 0
@@ -0,0 +1,56 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+from expressions import COMPARISONS
+from predicates import FilterTypeError, filter_predicate
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+
+def run(body):
+    return parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')
+
+@pytest.mark.parametrize('condition', [
+    '> 2020-01-01',
+    'between 2020-01-01 and 2021-01-01',
+    '> "abc"',
+])
+def test_expression_filter_rejects_non_numeric_literals(condition):
+    with pytest.raises(FilterTypeError):
+        run(f'filter column "salario" * 2 {condition};')
+
+def test_expression_filter_with_number_matches_column_filter():
+    assert run('filter column "salario" * 2 > 8000;')['record_count'] == \
+        run('filter column "salario" > 4000;')['record_count']
+
+FRAME = pd.DataFrame({
+    'entero': np.array([-3, 0, 2, 3, 7, 2 ** 53 + 1, -2 ** 62], dtype=np.int64),
+    'decimal': [-3.5, 0.0, np.nan, 3.0, 7.25, 1e20, -np.inf],
+    'texto': pd.Series(['a', 'b', None, 'c', 'b', 'z', 'a'], dtype='str'),
+})
+
+@pytest.mark.parametrize('column', ['entero', 'decimal'])
+@pytest.mark.parametrize('operator, value', [
+    ('>', 2.5), ('>=', 2.5), ('<', -2.5), ('<=', 3), ('==', 2.5), ('!=', 2.5), ('==', 3), ('!=', 3),
+    ('>', 1e30), ('<', -1e30), ('>=', 2 ** 53 + 1), ('between', [-3.5, 2.5]), ('between', [3, 2]),
+])
+def test_numeric_predicates_match_pandas(column, operator, value):
+    mask = filter_predicate({'column': column, 'operator': operator, 'value': value}).mask(FRAME)
+    series = FRAME[column]
+    expected = series.between(*value) if operator == 'between' else COMPARISONS[operator](series, value)
+    assert np.array_equal(mask, expected.to_numpy(dtype=bool))
+
+@pytest.mark.parametrize('operator, value', [('==', 'b'), ('!=', 'b'), ('>', 'a'), ('between', ['a', 'b'])])
+def test_text_predicates_match_pandas(operator, value):
+    mask = filter_predicate({'column': 'texto', 'operator': operator, 'value': value}).mask(FRAME)
+    series = FRAME['texto']
+    expected = series.between(*value) if operator == 'between' else COMPARISONS[operator](series, value)
+    assert np.array_equal(mask, expected.fillna(operator == '!=').to_numpy(dtype=bool))
+
+@pytest.mark.parametrize('column, value', [('entero', 'b'), ('texto', 3), ('decimal', [1, 'x'])])
+def test_mismatched_literals_raise(column, value):
+    predicate = filter_predicate({'column': column, 'operator': 'between' if isinstance(value, list) else '==',
+                                  'value': value})
+    with pytest.raises(FilterTypeError):
+        predicate.check(FRAME)
@@ -0,0 +1,35 @@
+import os
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+from predicates import FilterTypeError
+from prepared import execute, execute_many, prepare
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+SCRIPT = (f'load "{EMPLEADOS}"; filter column "departamento" == $dept; filter column "salario" between $min and $max; '
+          'aggregate count column "id_empleado"; aggregate average column "edad"; sort column "edad" asc; print;')
+PARAMS = [{'dept': dept, 'min': 2500, 'max': 4500} for dept in ['Ventas', 'Tecnología', 'Legal', 'No existe']]
+
+def plain(result):
+    return result['aggregations'], result['filtered_data']
+
+def test_execute_and_execute_many_match_literal_scripts():
+    prepared = prepare(SCRIPT)
+    batch = execute_many(prepared, PARAMS)
+    data = pd.read_csv(EMPLEADOS)
+    for params, result in zip(PARAMS, batch):
+        literal = SCRIPT.replace('$dept', f'"{params["dept"]}"').replace('$min', '2500').replace('$max', '4500')
+        assert plain(result) == plain(execute(prepared, params)) == plain(parse_and_interpret(literal))
+        selected = data[(data['departamento'] == params['dept']) & data['salario'].between(2500, 4500)]
+        assert result['record_count'] == len(selected)
+
+def test_positional_placeholders():
+    prepared = prepare(f'load "{EMPLEADOS}"; filter column "edad" > ?; filter column "edad" <= ?; print;')
+    data = pd.read_csv(EMPLEADOS)
+    assert execute(prepared, [30, 40])['record_count'] == int(((data['edad'] > 30) & (data['edad'] <= 40)).sum())
+
+@pytest.mark.parametrize('run', [execute, lambda prepared, params: execute_many(prepared, [params])])
+def test_bound_values_are_type_checked(run):
+    prepared = prepare(f'load "{EMPLEADOS}"; filter column "edad" > $edad; print;')
+    with pytest.raises(FilterTypeError):
+        run(prepared, {'edad': 'abc'})
@@ -0,0 +1,52 @@
+import io
+import os
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import (CancellationToken, QueryCancelled, QueryLimitExceeded, QueryLimits,
+                                      export_script, parse_and_interpret)
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+SCRIPT = f'load "{EMPLEADOS}"; filter column "edad" > 30; sort column "salario" desc; print;'
+SELECTED = int((pd.read_csv(EMPLEADOS)['edad'] > 30).sum())
+
+def test_limits_above_the_query_do_not_change_the_result():
+    limits = QueryLimits(timeout=60, max_rows=SELECTED, max_memory=2 ** 30)
+    assert parse_and_interpret(SCRIPT, limits=limits)['filtered_data'] == parse_and_interpret(SCRIPT)['filtered_data']
+
+@pytest.mark.parametrize('limits, name', [
+    (QueryLimits(max_rows=SELECTED - 1), 'max_rows'),
+    (QueryLimits(max_memory=1024), 'max_memory'),
+])
+def test_exceeded_limits_raise_a_clean_error(limits, name):
+    with pytest.raises(QueryLimitExceeded) as error:
+        parse_and_interpret(SCRIPT, limits=limits)
+    details = error.value.to_dict()
+    assert details['error'] == 'limit_exceeded' and details['limit'] == name
+    assert details['value'] > details['maximum']
+
+def test_loaded_rows_do_not_count():
+    # Every row is loaded, but the query only builds a few
+    result = parse_and_interpret(f'load "{EMPLEADOS}"; filter column "edad" > 60; print;',
+                                 limits=QueryLimits(max_rows=SELECTED))
+    assert result['record_count'] < SELECTED
+
+def test_cancelled_token_stops_queries_and_exports():
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(QueryCancelled):
+        parse_and_interpret(SCRIPT, cancel_token=token)
+    with pytest.raises(QueryCancelled):
+        export_script(SCRIPT, io.StringIO(), chunk_size=10, cancel_token=token)
+
+def test_export_stops_between_chunks():
+    token = CancellationToken()
+
+    class CancelAfterFirstChunk(io.StringIO):
+        def write(self, text):
+            token.cancel()
+            return super().write(text)
+
+    out = CancelAfterFirstChunk()
+    with pytest.raises(QueryCancelled):
+        export_script(SCRIPT, out, 'ndjson', chunk_size=10, cancel_token=token)
+    assert len(out.getvalue().splitlines()) == 10
@@ -0,0 +1,37 @@
+import os
+import pandas as pd
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+QUERY = (f'load "{EMPLEADOS}"; filter column "edad" > 30; filter column "departamento" == "Ventas"; '
+         'sort column "salario" desc; limit 5; aggregate count column "id_empleado";')
+
+def nodes(node):
+    yield node
+    for child in node['children']:
+        yield from nodes(child)
+
+def operators(plan, prefix):
+    return [node for node in nodes(plan) if node['operator'].startswith(prefix)]
+
+def test_explain_analyze_counts_match_pandas():
+    result = parse_and_interpret(QUERY + 'explain analyze;')
+    plan = result['plan'].to_dict()
+    data = pd.read_csv(EMPLEADOS)
+    selected = data[(data['edad'] > 30) & (data['departamento'] == 'Ventas')]
+    assert operators(plan, 'Lectura')[0]['actual_rows'] == len(data)
+    assert operators(plan, 'Orden salario')[0]['actual_rows'] == len(selected)
+    assert operators(plan, 'Límite 5')[0]['actual_rows'] == 5
+    # The topmost filter has applied all of them, whatever order the statistics chose
+    filters = operators(plan, 'Filtro')
+    assert len(filters) == 2 and filters[0]['actual_rows'] == len(selected)
+    assert all(node['estimated_rows'] is not None for node in filters)
+    printed = parse_and_interpret(QUERY + 'print;')
+    assert result['filtered_data'] == printed['filtered_data']
+    assert result['aggregations'] == printed['aggregations'] == {'count_id_empleado': len(selected)}
+
+def test_explain_only_estimates(capsys):
+    parse_and_interpret(QUERY + 'explain;')
+    output = capsys.readouterr().out
+    plan = output[output.index('Plan de consulta:'):]
+    assert 'Filtro edad > 30' in plan and 'estimadas' in plan and 'reales' not in plan
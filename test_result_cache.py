@@ -0,0 +1,35 @@
+import os
+import shutil
+import pandas as pd
+from employee_dsl_interpreter import parse_and_interpret
+from result_cache import ResultCache
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+QUERY = 'filter column "edad" > 30; filter column "salario" < 4000; aggregate sum column "salario"; print;'
+REORDERED = 'filter column "salario"  <  4000; filter column "edad" > 30; filter column "edad" > 30; ' \
+            'aggregate sum column "salario"; print;'
+
+def expected_sum(path):
+    data = pd.read_csv(path)
+    return data.loc[(data['edad'] > 30) & (data['salario'] < 4000), 'salario'].sum()
+
+def test_normalized_plans_share_one_entry():
+    cache = ResultCache()
+    first = parse_and_interpret(f'load "{EMPLEADOS}";' + QUERY, result_cache=cache)
+    second = parse_and_interpret(f'load "{EMPLEADOS}";' + REORDERED, result_cache=cache)
+    assert second['filtered_data'] == first['filtered_data']
+    assert second['aggregations'] == first['aggregations']
+    assert first['aggregations']['sum_salario'] == expected_sum(EMPLEADOS)
+    assert cache.stats()['hits'] == 1 and cache.stats()['entries'] == 1
+
+def test_changed_file_is_not_served_from_cache(tmp_path):
+    path = tmp_path / 'empleados.csv'
+    shutil.copy(EMPLEADOS, path)
+    cache = ResultCache()
+    parse_and_interpret(f'load "{path}";' + QUERY, result_cache=cache)
+    lines = path.read_text(encoding='utf-8').splitlines(keepends=True)
+    path.write_text(''.join(lines[:100]), encoding='utf-8')
+    os.utime(path, ns=(1, 1))
+    result = parse_and_interpret(f'load "{path}";' + QUERY, result_cache=cache)
+    assert result['aggregations']['sum_salario'] == expected_sum(path)
+    assert cache.stats()['hits'] == 0 and cache.stats()['entries'] == 1
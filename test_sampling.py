@@ -0,0 +1,38 @@
+import os
+import math
+import pandas as pd
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+AGGREGATES = 'aggregate count column "id_empleado"; aggregate sum column "salario"; aggregate average column "salario";'
+
+def run(body):
+    return parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')
+
+def test_full_sample_is_exact():
+    result = run('sample 100%; filter column "edad" > 30;' + AGGREGATES)
+    selected = DATA[DATA['edad'] > 30]
+    expected = {'count_id_empleado': len(selected), 'sum_salario': selected['salario'].sum(),
+                'average_salario': selected['salario'].mean()}
+    for name, value in expected.items():
+        assert math.isclose(result['aggregations'][name], value, rel_tol=1e-12), name
+        low, high = result['confidence_intervals'][name]
+        assert math.isclose(low, value, rel_tol=1e-12) and math.isclose(high, value, rel_tol=1e-12), name
+
+def test_stratified_sample_scales_to_the_population():
+    result = run('sample 20% by column "departamento";' + AGGREGATES)
+    assert result['sample']['population'] == len(DATA)
+    assert result['aggregations']['count_id_empleado'] == len(DATA)
+    low, high = result['confidence_intervals']['sum_salario']
+    assert low <= DATA['salario'].sum() <= high
+    # At least two rows of every department
+    sampled = pd.DataFrame(result['filtered_data'])
+    assert sampled.groupby('departamento').size().min() >= 2
+    assert set(sampled['departamento']) == set(DATA['departamento'])
+
+def test_samples_are_reproducible_and_nested():
+    small = {record['id_empleado'] for record in run('sample 5%;')['filtered_data']}
+    large = {record['id_empleado'] for record in run('sample 20%;')['filtered_data']}
+    assert small == {record['id_empleado'] for record in run('sample 5%;')['filtered_data']}
+    assert small < large
@@ -0,0 +1,47 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from dates import read_csv
+from employee_dsl_interpreter import parse_and_interpret
+from shared_datasets import DatasetRegistry, SharedDataset, _path, attach_all
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+
+def run(path):
+    # Plain values, so a worker can send them back
+    result = parse_and_interpret(f'load "{path}"; filter column "fecha_ingreso" >= 2019-01-01; '
+                                 'filter column "nombre" contains "a"; sort column "salario" desc; '
+                                 'aggregate average column "edad"; explain analyze;')
+    return result['filtered_data'], result['aggregations'], 'memoria compartida' in result['plan'].render()
+
+def test_attached_columns_match_the_csv(tmp_path):
+    path = tmp_path / 'empleados.csv'
+    shutil.copy(EMPLEADOS, path)
+    with DatasetRegistry() as registry:
+        name = registry.publish(str(path))
+        dataset = SharedDataset(name)
+        pd.testing.assert_frame_equal(dataset.frame, read_csv(str(path)))
+        assert not dataset.frame['salario'].to_numpy().flags.writeable
+    assert not os.path.exists(_path(name))
+
+def test_missing_texts_and_mixed_columns_round_trip(tmp_path):
+    frame = pd.DataFrame({
+        'texto': pd.Series(['ñandú', None, '', 'a,b'], dtype='str'),
+        'mixto': pd.Series([1, 'dos', None, 3.5], dtype=object),
+        'logico': np.array([True, False, True, True]),
+    })
+    with DatasetRegistry() as registry:
+        dataset = SharedDataset(registry.publish(str(tmp_path / 'memoria.csv'), frame))
+        pd.testing.assert_frame_equal(dataset.frame, frame)
+
+def test_workers_read_the_shared_copy(tmp_path):
+    path = tmp_path / 'empleados.csv'
+    shutil.copy(EMPLEADOS, path)
+    records, aggregations, shared = run(path)
+    assert not shared
+    with DatasetRegistry() as registry:
+        names = [registry.publish(str(path))]
+        with ProcessPoolExecutor(1, initializer=attach_all, initargs=(names,)) as pool:
+            assert pool.submit(run, path).result() == (records, aggregations, True)
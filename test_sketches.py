@@ -0,0 +1,42 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+from sketches import HyperLogLog, KllSketch
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+
+def aggregations(body):
+    return parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')['aggregations']
+
+@pytest.mark.parametrize('percentile', [0, 10, 50, 90, 99, 100])
+def test_exact_percentiles_match_pandas_quantile(percentile):
+    result = aggregations(f'filter column "edad" > 30; aggregate percentile {percentile} column "salario"; '
+                          'aggregate median column "dias_laborados";')
+    selected = DATA[DATA['edad'] > 30]
+    assert result[f'percentile_{percentile}_salario'] == pytest.approx(selected['salario'].quantile(percentile / 100))
+    assert result['median_dias_laborados'] == pytest.approx(selected['dias_laborados'].median())
+
+def test_approximate_percentile_has_small_rank_error():
+    value = aggregations('aggregate approx percentile 90 column "salario";')['approx_percentile_90_salario']
+    assert abs((DATA['salario'] <= value).mean() - 0.9) <= 0.02
+
+def test_merged_kll_sketches_stay_close_to_the_exact_quantiles():
+    values = np.random.default_rng(7).lognormal(size=200000)
+    sketch = KllSketch()
+    for part in np.array_split(values, 9):
+        other = KllSketch()
+        other.update(part)
+        sketch.merge(KllSketch.from_dict(other.to_dict()))
+    for fraction in (0.01, 0.5, 0.99):
+        assert abs((values <= sketch.quantile(fraction)).mean() - fraction) <= 0.02
+
+def test_hyperloglog_estimate_is_close():
+    sketch = HyperLogLog()
+    sketch.update(np.arange(100000) % 60000)
+    sketch.update(np.arange(50000, 90000))
+    assert sketch.estimate() == pytest.approx(90000, rel=0.03)
+    assert aggregations('aggregate approx count distinct column "correo";')['approx_count_distinct_correo'] == \
+        pytest.approx(DATA['correo'].nunique(), rel=0.03)
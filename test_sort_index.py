@@ -0,0 +1,40 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+
+def ids(path, body):
+    result = parse_and_interpret(f'load "{path}";' + body + 'print;')
+    return [record['id_empleado'] for record in result['filtered_data']]
+
+def expected(data, columns, ascending):
+    return data.sort_values(list(columns), ascending=list(ascending), kind='stable', na_position='last')[
+        'id_empleado'].tolist()
+
+@pytest.mark.parametrize('keys', [
+    [('departamento', True), ('salario', False)],
+    [('edad', False), ('cargo', True), ('fecha_ingreso', False)],
+    [('edad', True)],
+])
+def test_multi_key_sort_matches_pandas(keys):
+    body = 'sort ' + ', '.join(f'column "{column}" {"asc" if up else "desc"}' for column, up in keys) + ';'
+    columns, ascending = zip(*keys)
+    assert ids(EMPLEADOS, body) == expected(DATA, columns, ascending)
+    # A filtered selection reuses the permutation of the whole dataset
+    selected = DATA[DATA['salario'] > 3500]
+    assert ids(EMPLEADOS, 'filter column "salario" > 3500;' + body) == expected(selected, columns, ascending)
+
+def test_missing_values_go_last_in_both_directions(tmp_path):
+    data = DATA.copy()
+    data.loc[np.arange(0, len(data), 7), 'salario'] = np.nan
+    data.loc[np.arange(0, len(data), 5), 'departamento'] = np.nan
+    path = tmp_path / 'huecos.csv'
+    data.to_csv(path, index=False)
+    for body, columns, ascending in [('sort column "salario" desc;', ['salario'], [False]),
+                                     ('sort column "departamento" asc, column "salario" asc;',
+                                      ['departamento', 'salario'], [True, True])]:
+        assert ids(path, body) == expected(pd.read_csv(path), columns, ascending)
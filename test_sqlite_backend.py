@@ -0,0 +1,41 @@
+import os
+import io
+import json
+import shutil
+import pytest
+from benchmark_engines import same_result
+from employee_dsl_interpreter import export_script, parse_and_interpret
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(HERE, 'example_scripts.json'), 'r', encoding='utf-8') as f:
+    SCRIPTS = [script['contenido'] for script in json.load(f)]
+
+@pytest.fixture(scope='module')
+def empleados(tmp_path_factory):
+    # The database is built next to the CSV, so keep it out of the repository
+    path = tmp_path_factory.mktemp('sqlite') / 'empleados.csv'
+    shutil.copy(os.path.join(HERE, 'empleados.csv'), path)
+    return str(path)
+
+def plain(result):
+    return [result['record_count'], dict(result['aggregations']), result['filtered_data']]
+
+@pytest.mark.parametrize('script', SCRIPTS)
+def test_sqlite_backend_matches_pandas_on_example_scripts(empleados, script):
+    script = script.replace('"empleados.csv"', f'"{empleados}"')
+    assert same_result(plain(parse_and_interpret(script, backend='sqlite')), plain(parse_and_interpret(script)))
+
+def test_sqlite_export_matches_pandas_export(empleados):
+    script = (f'load "{empleados}"; filter column "nombre" contains "a"; filter column "salario" / column "edad" > 80; '
+              'sort column "fecha_ingreso" desc, column "id_empleado" asc; print;')
+    exports = []
+    for backend in ('sqlite', 'pandas'):
+        out = io.StringIO()
+        export_script(script, out, 'csv', chunk_size=16, backend=backend)
+        exports.append(out.getvalue())
+    assert exports[0] == exports[1] and exports[0].count('\n') > 16
+
+def test_join_is_rejected(empleados):
+    with pytest.raises(ValueError):
+        parse_and_interpret(f'load "{empleados}"; load "{empleados}" as e; join e on column "id_empleado"; print;',
+                            backend='sqlite')
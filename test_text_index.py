@@ -0,0 +1,37 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from employee_dsl_interpreter import parse_and_interpret
+from text_index import INDEX_AFTER_SCANS, TextColumnIndex
+
+EMPLEADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'empleados.csv')
+DATA = pd.read_csv(EMPLEADOS)
+
+@pytest.mark.parametrize('body, mask', [
+    ('filter column "cargo" starts_with "Analista";', DATA['cargo'].str.startswith('Analista')),
+    ('filter column "nombre" contains "Ana";', DATA['nombre'].str.contains('Ana', regex=False)),
+    ('filter column "correo" like "%.g%@empresa.com";', DATA['correo'].str.fullmatch(r'.*\.g.*@empresa\.com')),
+    ('filter column "nombre" like "_ar%";', DATA['nombre'].str.fullmatch('.ar.*')),
+    ('filter column "cargo" contains "de"; filter column "salario" > 3000;',
+     DATA['cargo'].str.contains('de', regex=False) & (DATA['salario'] > 3000)),
+])
+def test_text_filters_match_pandas_string_methods(body, mask):
+    result = parse_and_interpret(f'load "{EMPLEADOS}";' + body + 'print;')
+    assert [record['id_empleado'] for record in result['filtered_data']] == DATA.loc[mask, 'id_empleado'].tolist()
+
+def test_indexed_column_matches_pandas_after_repeated_queries():
+    words = np.array(['alfa', 'beta', 'gamma', 'delta', '100%', 'a_b'])
+    rng = np.random.default_rng(3)
+    series = pd.Series([f'{a}-{b}-{n}' for n, (a, b) in enumerate(rng.choice(words, (5000, 2)))] + [None])
+    index = TextColumnIndex(series, indexed=True)
+    cases = [('starts_with', 'gamma-', series.str.startswith('gamma-')),
+             ('contains', 'ta-del', series.str.contains('ta-del', regex=False)),
+             ('like', '%100%', series.str.contains('100', regex=False)),
+             ('like', '%a_b-1%', series.str.fullmatch('.*a.b-1.*'))]
+    # Other values first, so the cases below go through the sorted dictionary and the trigrams
+    for number in range(INDEX_AFTER_SCANS):
+        index.row_mask('contains', f'warm-up {number}')
+    for operator, value, expected in cases:
+        assert (index.row_mask(operator, value) == expected.fillna(False).to_numpy(dtype=bool)).all(), value
+    assert index._sorted is not None and index._trigrams is not None
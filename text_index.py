@@ -0,0 +1,169 @@
+import re
+import numpy as np
+import pandas as pd
+
+TEXT_OPERATORS = ('starts_with', 'contains', 'like')
+# Below this many distinct values a scan of the dictionary is cheaper than building trigrams
+TRIGRAM_MIN_VALUES = 1024
+# A dictionary scan costs a fraction of an index build, so indexes wait for repeated use
+INDEX_AFTER_SCANS = 3
+BUILD_CHUNK = 65536
+LAST_CHARACTER = '\U0010ffff'
+HASH_MULTIPLIERS = (np.uint64(0x9E3779B1), np.uint64(0x85EBCA77), np.uint64(0xC2B2AE3D))
+LOW_32_BITS = np.uint64(0xFFFFFFFF)
+
+def like_regex(pattern):
+    """Regular expression equivalent to a LIKE pattern: % is any run of characters, _ exactly one"""
+    parts = ['.*' if char == '%' else '.' if char == '_' else re.escape(char) for char in pattern]
+    return re.compile(''.join(parts), re.DOTALL)
+
+def _trigram_hashes(chars):
+    # 32-bit hash of every trigram along the last axis; collisions only add candidates, which are verified
+    first, second, third = HASH_MULTIPLIERS
+    return ((chars[..., :-2] * first) ^ (chars[..., 1:-1] * second) ^ (chars[..., 2:] * third)) & LOW_32_BITS
+
+def _trigram_keys(text):
+    if len(text) < 3:
+        return []
+    return np.unique(_trigram_hashes(np.array([ord(char) for char in text], dtype=np.uint64))).tolist()
+
+class TextColumnIndex:
+    """Dictionary-encoded text column: predicates run once per distinct value, rows are picked by code.
+
+    With indexed=True, once the column has been scanned a few times, a
+    sorted copy of the dictionary answers prefixes by binary search and a
+    trigram index narrows contains/like to the candidate values before the
+    vectorized check.
+    """
+
+    def __init__(self, series, indexed=False):
+        if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            raise ValueError(f"La columna '{series.name}' no es de texto")
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        self.codes = codes
+        self.values = np.asarray(uniques, dtype=str)
+        self.indexed = indexed
+        self._sorted = None
+        self._trigrams = None
+        self._scans = 0
+        self._matches = {}
+
+    def row_mask(self, operator, value):
+        """Boolean mask over the rows of the indexed column"""
+        flags = self.matching(operator, value)
+        # Code -1 (missing value) picks the trailing False
+        return np.append(flags, False)[self.codes]
+
+    def matching(self, operator, value):
+        """Boolean array over the distinct values"""
+        if not isinstance(value, str):
+            raise ValueError(f"El operador {operator} requiere un texto, no {value!r}")
+        key = (operator, value)
+        if key not in self._matches:
+            self._scans += 1
+            if operator == 'starts_with':
+                flags = self._prefix(value)
+            elif operator == 'contains':
+                flags = self._verify(self._candidates([value]), lambda values: np.char.find(values, value) >= 0)
+            else:
+                regex = like_regex(value)
+                fragments = [fragment for fragment in re.split('[%_]', value) if fragment]
+                flags = self._verify(self._candidates(fragments), lambda values: np.fromiter(
+                    (regex.fullmatch(text) is not None for text in values), dtype=bool, count=len(values)))
+            self._matches[key] = flags
+        return self._matches[key]
+
+    def _prefix(self, prefix):
+        if self._sorted is None and not self._use_index():
+            return np.char.startswith(self.values, prefix)
+        if self._sorted is None:
+            order = np.argsort(self.values, kind='stable')
+            self._sorted = (self.values[order], order)
+        sorted_values, order = self._sorted
+        low = sorted_values.searchsorted(prefix, 'left')
+        high = sorted_values.searchsorted(prefix + LAST_CHARACTER, 'right')
+        flags = np.zeros(len(self.values), dtype=bool)
+        flags[order[low:high]] = True
+        return flags
+
+    def _verify(self, candidates, check):
+        if candidates is None:
+            return check(self.values) if len(self.values) else np.zeros(0, dtype=bool)
+        flags = np.zeros(len(self.values), dtype=bool)
+        if len(candidates):
+            flags[candidates[check(self.values[candidates])]] = True
+        return flags
+
+    def _candidates(self, fragments):
+        """Sorted ids of the values containing every trigram of the fragments, None for all values"""
+        if self._trigrams is None and (len(self.values) < TRIGRAM_MIN_VALUES or not self._use_index()):
+            return None
+        keys = sorted({key for fragment in fragments for key in _trigram_keys(fragment)})
+        if not keys:
+            return None
+        if self._trigrams is None:
+            self._trigrams = self._build_trigrams()
+        trigrams, starts, ids = self._trigrams
+        postings = []
+        for key in keys:
+            position = trigrams.searchsorted(key)
+            if position == len(trigrams) or trigrams[position] != key:
+                return np.zeros(0, dtype=np.intp)
+            postings.append(ids[starts[position]:starts[position + 1]])
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        return candidates.astype(np.intp)
+
+    def _use_index(self):
+        return self.indexed and self._scans > INDEX_AFTER_SCANS
+
+    def _build_trigrams(self):
+        # (trigram hash << 32 | value id) for every trigram, from the UTF-32 code points in blocks
+        width = self.values.dtype.itemsize // 4
+        blocks = []
+        for start in range(0, len(self.values) if width >= 3 else 0, BUILD_CHUNK):
+            block = self.values[start:start + BUILD_CHUNK]
+            chars = block.view(np.uint32).reshape(len(block), width).astype(np.uint64)
+            ids = np.arange(start, start + len(block), dtype=np.uint64)[:, None]
+            pairs = (_trigram_hashes(chars) << np.uint64(32)) | ids
+            valid = np.arange(width - 2)[None, :] < (np.char.str_len(block) - 2)[:, None]
+            blocks.append(pairs[valid])
+        pairs = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.uint64)
+        # One sort orders by trigram and then by value id, duplicates end up adjacent
+        pairs.sort()
+        if len(pairs):
+            pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        keys = pairs >> np.uint64(32)
+        ids = (pairs & LOW_32_BITS).astype(np.intp)
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else np.zeros(0, np.intp)
+        return keys[starts], np.append(starts, len(keys)), ids
+
+class TextIndexCatalog:
+    """Text indexes of a loaded dataset, one per column, created on first use.
+
+    Frames passed to mask() must be row subsets of the dataset that keep
+    its index labels (filtered or sampled selections).
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.columns = {}
+
+    def column(self, name):
+        if name not in self.columns:
+            self.columns[name] = TextColumnIndex(self.frame[name], indexed=True)
+        return self.columns[name]
+
+    def mask(self, frame, column, operator, value):
+        full = self.column(column).row_mask(operator, value)
+        if frame is self.frame:
+            return full
+        return full[self.frame.index.get_indexer(frame.index)]
+
+def text_mask(frame, column, operator, value, catalog=None):
+    """Rows of frame whose column satisfies a starts_with, contains or like predicate"""
+    if catalog is not None:
+        return catalog.mask(frame, column, operator, value)
+    return TextColumnIndex(frame[column]).row_mask(operator, value)